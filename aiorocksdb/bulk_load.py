@@ -0,0 +1,281 @@
+import os
+import asyncio
+import heapq
+import struct
+import bisect
+import itertools
+from typing import *
+from operator import itemgetter
+from concurrent.futures import Executor
+from .db_native import *
+from .db_api import *
+from .rocks_db import *
+
+
+Row = Tuple[bytes, bytes]
+
+
+class MemoryRun:
+    """
+    sorted rows kept in memory, the last run of a load usually stays here
+    """
+
+    def __init__(self, rows: List[Row]):
+        self.rows = rows
+        self.keys = [row[0] for row in rows]
+
+    def sample(self, interval: int) -> List[bytes]:
+        return self.keys[::interval]
+
+    def read(self, lower: Optional[bytes], upper: Optional[bytes]) -> Iterator[Row]:
+        start = 0 if lower is None else bisect.bisect_left(self.keys, lower)
+        stop = len(self.keys) if upper is None else bisect.bisect_left(self.keys, upper)
+        return itertools.islice(self.rows, start, stop)
+
+    def remove(self):
+        self.rows = list()
+        self.keys = list()
+
+
+class FileRun:
+    """
+    sorted rows spilled to a file of length prefixed records
+    index holds (key, offset) of every interval-th record, so a range read seeks instead of scanning the file
+    """
+    HEADER = struct.Struct('<II')
+
+    def __init__(self, path: str, index: List[Tuple[bytes, int]], interval: int):
+        self.path = path
+        self.index = index
+        self.interval = interval
+
+    @classmethod
+    def write(cls, path: str, rows: List[Row], interval: int) -> 'FileRun':
+        index = list()
+        offset = 0
+        with open(path, 'wb') as f:
+            for i, (key, value) in enumerate(rows):
+                if i % interval == 0:
+                    index.append((key, offset, ))
+                f.write(cls.HEADER.pack(len(key), len(value)))
+                f.write(key)
+                f.write(value)
+                offset += cls.HEADER.size + len(key) + len(value)
+        return cls(path, index, interval)
+
+    def sample(self, interval: int) -> List[bytes]:
+        """
+        every interval-th key like MemoryRun.sample, interval has to be a multiple of the index interval
+        """
+        assert interval % self.interval == 0
+        return [key for key, _ in self.index[::interval // self.interval]]
+
+    def read(self, lower: Optional[bytes], upper: Optional[bytes]) -> Iterator[Row]:
+        offset = 0
+        if lower is not None:
+            position = bisect.bisect_left(self.index, (lower, -1)) - 1
+            if position >= 0:
+                offset = self.index[position][1]
+        header_size = self.HEADER.size
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            while True:
+                header = f.read(header_size)
+                if not header:
+                    return
+                key_size, value_size = self.HEADER.unpack(header)
+                key = f.read(key_size)
+                value = f.read(value_size)
+                if lower is not None and key < lower:
+                    continue
+                if upper is not None and key >= upper:
+                    return
+                yield key, value
+
+    def remove(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class BulkLoader(AsyncCallMixin):
+    """
+    streams (key, value) pairs into sst files and ingests them with one ingest_external_file call
+    unsorted input is sorted by an external merge sort whose memory is bounded by memory_limit,
+    duplicated keys keep the last value, the key space is split into writer_count ranges written on parallel threads
+    """
+    ROW_OVERHEAD = 96
+    INDEX_INTERVAL = 256
+    CHUNK_SIZE = 1024
+
+    def __init__(
+            self,
+            db: RocksDb,
+            directory: str,
+            column_family: RColumnFamily = None,
+            options: Options = None,
+            env_options: EnvOptions = None,
+            writer_count: int = 4,
+            memory_limit: int = 64 * 1024 * 1024,
+            move_files: bool = True,
+            executor: Union[Executor, ExecutorRegistry] = None,
+    ):
+        assert isinstance(db, RocksDb)
+        assert writer_count > 0
+        assert memory_limit > 0
+        self.db = db
+        self.directory = directory
+        self.column_family = column_family or db.default_column_family
+        assert isinstance(self.column_family, RColumnFamily)
+        self.options = options or Options()
+        assert isinstance(self.options, Options)
+        self.env_options = env_options or EnvOptions()
+        assert isinstance(self.env_options, EnvOptions)
+        self.writer_count = writer_count
+        self.memory_limit = memory_limit
+        self.move_files = move_files
+        self.row_count = 0
+        self.file_list: List[str] = list()
+        self._runs: List[Union[MemoryRun, FileRun]] = list()
+        os.makedirs(directory, exist_ok=True)
+        executor = executor or ExecutorRegistry(max_workers=writer_count, thread_name_prefix='aiorocksdb-bulk-load')
+        super(BulkLoader, self).__init__(executor)
+
+    def _file_prefix(self) -> str:
+        return f'bulk_load_{id(self):x}_'
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, self._file_prefix() + name)
+
+    def _spill(self, rows: List[Row]) -> FileRun:
+        rows.sort(key=itemgetter(0))
+        return FileRun.write(self._path(f'{len(self._runs)}.run'), rows, self.INDEX_INTERVAL)
+
+    def _split_keys(self) -> List[bytes]:
+        samples = list(heapq.merge(*[run.sample(self.INDEX_INTERVAL) for run in self._runs]))
+        split_keys = list()
+        for i in range(1, self.writer_count):
+            if not samples:
+                break
+            key = samples[len(samples) * i // self.writer_count]
+            if not split_keys or split_keys[-1] < key:
+                split_keys.append(key)
+        return split_keys
+
+    @classmethod
+    def _abort(cls, path: str, status: StatusT) -> StatusT:
+        # callers drop the writer first, so its file handle is closed before the partial file is unlinked
+        if os.path.exists(path):
+            os.remove(path)
+        return status
+
+    def _write_range(self, name: str, lower: Optional[bytes], upper: Optional[bytes]) -> StatusT:
+        merged = heapq.merge(*[run.read(lower, upper) for run in self._runs], key=itemgetter(0))
+        path = self._path(name)
+        writer = None
+        status = Status()
+        status.result = None
+        chunk: List[Row] = list()
+        previous = None
+        # heapq.merge is stable and runs are ordered by arrival, so the last row of equal keys is the newest
+        for row in itertools.chain(merged, [None]):
+            if previous is not None and (row is None or row[0] != previous[0]):
+                chunk.append(previous)
+            previous = row
+            if len(chunk) >= self.CHUNK_SIZE or (row is None and chunk):
+                if writer is None:
+                    writer = RSstFileWriter(self.env_options, self.options)
+                    status = writer.open(path)
+                    if not status.ok():
+                        writer = None
+                        return self._abort(path, status)
+                status = writer.put_many(chunk)
+                if not status.ok():
+                    writer = None
+                    return self._abort(path, status)
+                chunk = list()
+        if writer is not None:
+            complex_status = writer.finish()
+            writer = None
+            status = complex_status.status
+            if not status.ok():
+                return self._abort(path, status)
+            status.result = complex_status.value
+        return status
+
+    async def add_rows(self, rows: AsyncIterable[Row]):
+        buffer: List[Row] = list()
+        buffer_size = 0
+        async for key, value in rows:
+            key = bytes(key)
+            value = bytes(value)
+            buffer.append((key, value, ))
+            buffer_size += len(key) + len(value) + self.ROW_OVERHEAD
+            self.row_count += 1
+            if buffer_size >= self.memory_limit:
+                self._runs.append(await self.aio_call(self._spill, buffer))
+                buffer = list()
+                buffer_size = 0
+        if buffer:
+            await self.aio_call(buffer.sort, key=itemgetter(0))
+            self._runs.append(MemoryRun(buffer))
+
+    async def write_files(self) -> StatusT:
+        split_keys = self._split_keys()
+        bounds = list(zip([None] + split_keys, split_keys + [None]))
+        status_list = await asyncio.gather(*[
+            self.aio_call(self._write_range, f'{i}.sst', lower, upper) for i, (lower, upper) in enumerate(bounds)
+        ])
+        status = Status()
+        # every finished file is recorded before a failure is reported, so cleanup removes it
+        for s in status_list:
+            if not s.ok():
+                if status.ok():
+                    status = s
+            elif s.result:
+                self.file_list.append(s.result.file_path)
+        return status
+
+    async def ingest(self, ingest_options: IngestExternalFileOptions = None) -> StatusT:
+        ingest_options = ingest_options.copy() if ingest_options is not None else IngestExternalFileOptions()
+        assert isinstance(ingest_options, IngestExternalFileOptions)
+        ingest_options.move_files = self.move_files
+        if not self.file_list:
+            return Status()
+        status = await self.db.ingest_external_file(self.file_list, ingest_options, self.column_family)
+        return status
+
+    async def cleanup(self):
+        runs = self._runs
+        file_list = self.file_list
+        self._runs = list()
+        self.file_list = list()
+        directory = self.directory
+        file_prefix = self._file_prefix()
+
+        def remove():
+            for run in runs:
+                run.remove()
+            for path in file_list:
+                if os.path.exists(path):
+                    os.remove(path)
+            # anything else this loader left behind, e.g. files of ranges that failed
+            for name in os.listdir(directory):
+                if name.startswith(file_prefix):
+                    os.remove(os.path.join(directory, name))
+
+        await self.aio_call(remove)
+
+    async def load(self, rows: AsyncIterable[Row], ingest_options: IngestExternalFileOptions = None) -> StatusT[int]:
+        try:
+            await self.add_rows(rows)
+            status = await self.write_files()
+            if status.ok():
+                status = await self.ingest(ingest_options)
+            status.result = self.row_count
+            return status
+        finally:
+            await self.cleanup()
+            self.close_executor()
+
+
+__all__ = ['BulkLoader', ]
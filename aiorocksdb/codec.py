@@ -1,15 +1,20 @@
 
 
 class Codec:
-    def __init__(self, prefix, loads=None, dumps=None, key_split=b':'):
+    def __init__(self, prefix, loads=None, dumps=None, key_split=b':', zero_copy=False):
         self.prefix = prefix
         self._loads = loads
         self._dumps = dumps
         self.key_split = key_split
+        # loads accepts a memoryview and returns objects that do not refer to it,
+        # only worth it when loads parses the view directly, a codec without loads copies it with tobytes anyway
+        self.zero_copy = zero_copy
 
     def loads(self, data):
         if self._loads:
             return self._loads(data)
+        elif isinstance(data, memoryview):
+            return data.tobytes()
         else:
             return data
 
@@ -29,6 +29,40 @@ class ColumnFamilyBase(abc.ABC):
         else:
             raise ValueError(f'Unknown column family type: {type(obj)}')
 
+    async def _get(self, key: bytes, raise_exception=False) -> Optional[Any]:
+        codec = Codec.find_codec(key, self.d.codec_list)
+        if codec.zero_copy and not self.d.inline_get:
+            status = await self.d.get_pinned(key, column_family=self.cf, read_options=self.read_options)
+            if status.ok():
+                pinned = status.result
+                with memoryview(pinned) as view:
+                    value = codec.loads(view)
+                pinned.release()
+                return value
+        else:
+            status = await self.d.get(key, column_family=self.cf, read_options=self.read_options)
+            if status.ok():
+                value = codec.loads(status.result)
+                return value
+        if raise_exception:
+            raise StatusError(status)
+        else:
+            return None
+
+    async def _multi_get(self, keys: List[bytes], sorted_input=False) -> List[Optional[Any]]:
+        if not keys:
+            return list()
+        status = await self.d.multi_get_batch(keys, read_options=self.read_options, column_family=self.cf, sorted_input=sorted_input)
+        if not status.ok():
+            raise StatusError(status)
+        result = list()
+        for key, value in zip(keys, status.result):
+            if value is not None:
+                codec = Codec.find_codec(key, self.d.codec_list)
+                value = codec.loads(value)
+            result.append(value)
+        return result
+
 
 class ColumnFamily(ColumnFamilyBase):
     def __init__(self, cf_name: str, d: RocksDb, read_options=None):
@@ -38,16 +72,12 @@ class ColumnFamily(ColumnFamilyBase):
         return f'<ColumnFamily {self.name}>'
 
     async def get(self, key: bytes, raise_exception=False) -> Optional[Any]:
-        status = await self.d.get(key, column_family=self.cf, read_options=self.read_options)
-        if status.ok():
-            codec = Codec.find_codec(key, self.d.codec_list)
-            value = codec.loads(status.result)
-            return value
-        else:
-            if raise_exception:
-                raise StatusError(status)
-            else:
-                return None
+        value = await self._get(key, raise_exception)
+        return value
+
+    async def multi_get(self, keys: List[bytes], sorted_input=False) -> List[Optional[Any]]:
+        result = await self._multi_get(keys, sorted_input)
+        return result
 
     async def put(self, key: bytes, value: object):
         assert not self.d.is_readonly
@@ -57,6 +87,12 @@ class ColumnFamily(ColumnFamilyBase):
         if not status.ok():
             raise StatusError(status)
 
+    async def merge(self, key: bytes, operand: bytes):
+        assert not self.d.is_readonly
+        status = await self.d.merge(key, operand, column_family=self.cf)
+        if not status.ok():
+            raise StatusError(status)
+
     async def delete(self, key: bytes):
         assert not self.d.is_readonly
         status = await self.d.delete(key, column_family=self.cf)
@@ -72,16 +108,12 @@ class SnapshotColumnFamily(ColumnFamilyBase):
         return f'<SnapshotColumnFamily {self.name}>'
 
     async def get(self, key: bytes, raise_exception=False) -> Optional[object]:
-        status = await self.d.get(key, column_family=self.cf, read_options=self.read_options)
-        if status.ok():
-            codec = Codec.find_codec(key, self.d.codec_list)
-            value = codec.loads(status.result)
-            return value
-        else:
-            if raise_exception:
-                raise StatusError(status)
-            else:
-                return None
+        value = await self._get(key, raise_exception)
+        return value
+
+    async def multi_get(self, keys: List[bytes], sorted_input=False) -> List[Optional[object]]:
+        result = await self._multi_get(keys, sorted_input)
+        return result
 
 
 class BatchColumnFamily(ColumnFamilyBase):
@@ -97,9 +129,15 @@ class BatchColumnFamily(ColumnFamilyBase):
         value = codec.dumps(value)
         self.batch.put(key, value, self.cf)
 
+    def merge(self, key: bytes, operand: bytes):
+        self.batch.merge(key, operand, self.cf)
+
     def delete(self, key: bytes):
         self.batch.delete_key(key, self.cf)
 
+    def delete_range(self, begin_key: bytes, end_key: bytes):
+        self.batch.delete_range(begin_key, end_key, self.cf)
+
 
 __all__ = [
     'ColumnFamilyBase',
@@ -4,7 +4,7 @@ from aiorocksdb.codec import *
 
 class ComplexCodec(Codec):
     def __init__(self):
-        super(ComplexCodec, self).__init__(b'__redis:complex', loads=msgpack.loads, dumps=msgpack.dumps)
+        super(ComplexCodec, self).__init__(b'__redis:complex', loads=msgpack.loads, dumps=msgpack.dumps, zero_copy=True)
 
     @classmethod
     def create_data_key(cls, *args):
@@ -0,0 +1,115 @@
+from typing import *
+from aiorocksdb.meta import *
+from aiorocksdb.rocks_db import *
+from aiorocksdb.batch import *
+from aiorocksdb.iterator import *
+from aiorocksdb.complex.node_base import *
+
+
+class HashTable(NodeBase):
+    """
+    every field lives under its own key below the field prefix of the hash, meta only keeps the field count
+    updating a field writes the field key, and the meta key only when the field count changes
+    """
+
+    @classmethod
+    def field_prefix(cls, codec, key: bytes) -> bytes:
+        return cls.scoped_prefix(codec, b'hash', key)
+
+    @classmethod
+    def field_key(cls, codec, key: bytes, field: bytes) -> bytes:
+        return cls.field_prefix(codec, key) + field
+
+    @classmethod
+    def new_meta(cls) -> KeyMeta:
+        meta = KeyMeta()
+        meta.key_type = KeyTypeEnum.HASH.name
+        meta.length = 0
+        return meta
+
+    @classmethod
+    async def set(cls, codec, db, cf, key, meta: Optional[KeyMeta], meta_key, mapping: Dict[bytes, Any]) -> int:
+        if meta is None:
+            meta = cls.new_meta()
+            exists = [None] * len(mapping)
+        else:
+            exists = await cf.multi_get([cls.field_key(codec, key, field) for field in mapping])
+        added = sum(1 for value in exists if value is None)
+        async with Batch(db) as batch:
+            batch_cf = batch[cf]
+            for field, value in mapping.items():
+                batch_cf.put(cls.field_key(codec, key, field), value)
+            if added or meta.length == 0:
+                meta.length += added
+                batch_cf.put(meta_key, meta.to_dict())
+        return added
+
+    @classmethod
+    async def get(cls, codec, cf, key, field: bytes) -> Optional[Any]:
+        value = await cf.get(cls.field_key(codec, key, field))
+        return value
+
+    @classmethod
+    async def multi_get(cls, codec, cf, key, fields: List[bytes]) -> List[Optional[Any]]:
+        result = await cf.multi_get([cls.field_key(codec, key, field) for field in fields])
+        return result
+
+    @classmethod
+    async def get_all(cls, codec, cf, key) -> Dict[bytes, Any]:
+        prefix = cls.field_prefix(codec, key)
+        result = dict()
+        async with Iterator.prefix(cf, prefix) as iter:
+            async for field_key, value in iter:
+                result[field_key[len(prefix):]] = value
+        return result
+
+    @classmethod
+    async def increase(cls, codec, db, cf, key, meta: Optional[KeyMeta], meta_key, field: bytes, amount: int) -> int:
+        field_key = cls.field_key(codec, key, field)
+        value = None if meta is None else await cf.get(field_key)
+        result = int(value or 0) + amount
+        if meta is None:
+            meta = cls.new_meta()
+        async with Batch(db) as batch:
+            batch_cf = batch[cf]
+            batch_cf.put(field_key, result)
+            if value is None:
+                meta.length += 1
+                batch_cf.put(meta_key, meta.to_dict())
+        return result
+
+    @classmethod
+    async def remove(cls, codec, db, cf, key, meta: KeyMeta, meta_key, fields: List[bytes]) -> int:
+        field_keys = [cls.field_key(codec, key, field) for field in set(fields)]
+        exists = await cf.multi_get(field_keys)
+        field_keys = [field_key for field_key, value in zip(field_keys, exists) if value is not None]
+        if not field_keys:
+            return 0
+        meta.length -= len(field_keys)
+        async with Batch(db) as batch:
+            batch_cf = batch[cf]
+            for field_key in field_keys:
+                batch_cf.delete(field_key)
+            if meta.length > 0:
+                batch_cf.put(meta_key, meta.to_dict())
+            else:
+                batch_cf.delete(meta_key)
+        return len(field_keys)
+
+    @classmethod
+    async def delete(cls, codec, db, cf, key, meta_key):
+        prefix = cls.field_prefix(codec, key)
+        async with Batch(db) as batch:
+            batch_cf = batch[cf]
+            batch_cf.delete_range(prefix, Iterator.prefix_successor(prefix))
+            batch_cf.delete(meta_key)
+
+    @classmethod
+    async def size(cls, meta: KeyMeta) -> int:
+        if meta is None:
+            return 0
+        else:
+            return meta.length
+
+
+__all__ = ['HashTable', ]
@@ -1,5 +1,6 @@
 from typing import *
 from aiorocksdb.meta import *
+from aiorocksdb.rocks_db import *
 from aiorocksdb.batch import *
 from aiorocksdb.iterator import *
 from aiorocksdb.complex.node_base import *
@@ -85,10 +86,10 @@ class LinkedList(NodeBase):
         node_key_prefix = cls.node_key(codec, key) + codec.key_split
         data_key_prefix = cls.data_key(codec, key) + codec.key_split
         keys.append(meta_key)
-        async with Iterator.prefix(cf, node_key_prefix) as iter:
+        async with Iterator.prefix(cf, node_key_prefix, scan_profile=ScanProfile()) as iter:
             async for key, _ in iter:
                 keys.append(key)
-        async with Iterator.prefix(cf, data_key_prefix) as iter:
+        async with Iterator.prefix(cf, data_key_prefix, scan_profile=ScanProfile()) as iter:
             async for key, _ in iter:
                 keys.append(key)
         async with Batch(db) as batch:
@@ -1,10 +1,13 @@
 import abc
+import struct
 import msgpack
 from typing import *
 from aiorocksdb.meta import *
 
 
 class NodeBase(abc.ABC):
+    KEY_LENGTH = struct.Struct('>I')
+
     @classmethod
     async def fetch_meta(cls, cf, key, key_type: KeyTypeEnum = None, assert_exists=False) -> Optional[KeyMeta]:
         meta = await cf.get(key)
@@ -27,6 +30,14 @@ class NodeBase(abc.ABC):
     def meta_key(cls, codec, key):
         return codec.create_key(b'meta', key)
 
+    @classmethod
+    def scoped_prefix(cls, codec, scope: bytes, key: bytes) -> bytes:
+        """
+        prefix of the sub keys of key, the user key is length prefixed,
+        so the sub key range of one key never interleaves with another key sharing its prefix
+        """
+        return codec.create_key(scope, cls.KEY_LENGTH.pack(len(key)) + key) + codec.key_split
+
     @classmethod
     def node_key(cls, codec, key: bytes, node_name: Any = None):
         if node_name is None:
@@ -1,5 +1,294 @@
-from aiorocksdb.complex.order_list_base import *
+import struct
+from typing import *
+from aiorocksdb.meta import *
+from aiorocksdb.rocks_db import *
+from aiorocksdb.batch import *
+from aiorocksdb.iterator import *
+from aiorocksdb.complex.node_base import *
+from aiorocksdb.complex.rank_index import *
 
 
-class OrderedSet(OrderedListBase):
-    pass
+class OrderedSet(NodeBase):
+    """
+    sorted set, every member has a score key (member -> score) and an index key (score, member) without value
+    index keys sort by score then member, so score ranges and rank ordered scans are one bounded iterator scan
+    sets created with rank_index also keep a RankIndex over the index entries for O(log n) rank and select
+    """
+    SCORE = struct.Struct('>d')
+    SCORE_SIZE = SCORE.size
+    SIGN_MASK = 1 << 63
+    BITS_MASK = (1 << 64) - 1
+    SCAN_BATCH_SIZE = 256
+
+    @classmethod
+    def encode_score(cls, score: float) -> bytes:
+        """
+        ieee 754 double made bytewise comparable, positive scores flip the sign bit, negative scores flip every bit
+        """
+        bits = int.from_bytes(cls.SCORE.pack(float(score) + 0.0), 'big')
+        if bits & cls.SIGN_MASK:
+            bits ^= cls.BITS_MASK
+        else:
+            bits ^= cls.SIGN_MASK
+        return bits.to_bytes(cls.SCORE_SIZE, 'big')
+
+    @classmethod
+    def decode_score(cls, data: bytes) -> float:
+        bits = int.from_bytes(data[:cls.SCORE_SIZE], 'big')
+        if bits & cls.SIGN_MASK:
+            bits ^= cls.SIGN_MASK
+        else:
+            bits ^= cls.BITS_MASK
+        return cls.SCORE.unpack(bits.to_bytes(cls.SCORE_SIZE, 'big'))[0]
+
+    @classmethod
+    def score_prefix(cls, codec, key: bytes) -> bytes:
+        return cls.scoped_prefix(codec, b'zscore', key)
+
+    @classmethod
+    def index_prefix(cls, codec, key: bytes) -> bytes:
+        return cls.scoped_prefix(codec, b'zindex', key)
+
+    @classmethod
+    def score_key(cls, codec, key: bytes, member: bytes) -> bytes:
+        return cls.score_prefix(codec, key) + member
+
+    @classmethod
+    def index_entry(cls, score: float, member: bytes) -> bytes:
+        return cls.encode_score(score) + member
+
+    @classmethod
+    def index_key(cls, codec, key: bytes, score: float, member: bytes) -> bytes:
+        return cls.index_prefix(codec, key) + cls.index_entry(score, member)
+
+    @classmethod
+    def parse_index_key(cls, prefix: bytes, index_key: bytes) -> Tuple[bytes, float]:
+        entry = index_key[len(prefix):]
+        return entry[cls.SCORE_SIZE:], cls.decode_score(entry)
+
+    @classmethod
+    def new_meta(cls, rank_index=False) -> KeyMeta:
+        meta = KeyMeta()
+        meta.key_type = KeyTypeEnum.ZSET.name
+        meta.length = 0
+        meta.rank_index = rank_index
+        return meta
+
+    @classmethod
+    def index_read_options(cls, prefix: bytes, upper: bytes = None) -> ReadOptions:
+        read_options = ReadOptions()
+        read_options.iterate_lower_bound = prefix
+        read_options.iterate_upper_bound = upper or Iterator.prefix_successor(prefix)
+        return read_options
+
+    @classmethod
+    async def add(
+            cls,
+            codec,
+            db,
+            cf,
+            key,
+            meta: Optional[KeyMeta],
+            meta_key,
+            mapping: Dict[bytes, float],
+            rank_index=False,
+    ) -> int:
+        """
+        result is the number of new members, members whose score changed move their index key
+        rank_index only applies to a set created by this call
+        """
+        members = list(mapping)
+        if meta is None:
+            meta = cls.new_meta(rank_index)
+            scores = [None] * len(members)
+        else:
+            scores = await cf.multi_get([cls.score_key(codec, key, member) for member in members])
+        changes = list()
+        for member, old_score in zip(members, scores):
+            score = float(mapping[member])
+            if old_score != score:
+                changes.append((member, old_score, score, ))
+        added = sum(1 for _, old_score, _ in changes if old_score is None)
+        index = RankIndex(codec, cf, key, meta) if meta.rank_index else None
+        if index is not None:
+            for member, old_score, score in changes:
+                if old_score is not None:
+                    await index.remove(cls.index_entry(old_score, member))
+                await index.insert(cls.index_entry(score, member))
+        async with Batch(db) as batch:
+            batch_cf = batch[cf]
+            for member, old_score, score in changes:
+                if old_score is not None:
+                    batch_cf.delete(cls.index_key(codec, key, old_score, member))
+                batch_cf.put(cls.score_key(codec, key, member), score)
+                batch_cf.put(cls.index_key(codec, key, score, member), None)
+            if index is not None:
+                index.flush(batch_cf)
+            if added or meta.length == 0 or (index is not None and changes):
+                meta.length += added
+                batch_cf.put(meta_key, meta.to_dict())
+        return added
+
+    @classmethod
+    async def remove(cls, codec, db, cf, key, meta: KeyMeta, meta_key, members: List[bytes]) -> int:
+        members = list(set(members))
+        scores = await cf.multi_get([cls.score_key(codec, key, member) for member in members])
+        removed = [(member, score, ) for member, score in zip(members, scores) if score is not None]
+        if not removed:
+            return 0
+        index = RankIndex(codec, cf, key, meta) if meta.rank_index else None
+        if index is not None:
+            for member, score in removed:
+                await index.remove(cls.index_entry(score, member))
+        async with Batch(db) as batch:
+            batch_cf = batch[cf]
+            for member, score in removed:
+                batch_cf.delete(cls.score_key(codec, key, member))
+                batch_cf.delete(cls.index_key(codec, key, score, member))
+            if index is not None:
+                index.flush(batch_cf)
+            meta.length -= len(removed)
+            if meta.length > 0:
+                batch_cf.put(meta_key, meta.to_dict())
+            else:
+                batch_cf.delete(meta_key)
+        return len(removed)
+
+    @classmethod
+    async def enable_rank_index(cls, codec, db, cf, key, meta: KeyMeta, meta_key):
+        """
+        builds the rank index of an existing set from one scan of its index keys
+        """
+        if meta.rank_index:
+            return
+        prefix = cls.index_prefix(codec, key)
+        entries = list()
+        iterator = Iterator.range(cf, read_options=cls.index_read_options(prefix), batch_size=cls.SCAN_BATCH_SIZE)
+        async with iterator as iter:
+            async for index_key, _ in iter:
+                entries.append(index_key[len(prefix):])
+        meta.rank_index = True
+        index = RankIndex(codec, cf, key, meta)
+        index.build(entries)
+        async with Batch(db) as batch:
+            batch_cf = batch[cf]
+            index.flush(batch_cf)
+            batch_cf.put(meta_key, meta.to_dict())
+
+    @classmethod
+    async def rank(cls, codec, cf, key, meta: KeyMeta, member: bytes, desc=False) -> Optional[int]:
+        """
+        position of member in the ascending (or descending) order, without a rank index every lower entry is scanned
+        """
+        score = await cls.score(codec, cf, key, member)
+        if score is None:
+            return None
+        entry = cls.index_entry(score, member)
+        if meta.rank_index:
+            result = await RankIndex(codec, cf, key, meta).rank(entry)
+        else:
+            prefix = cls.index_prefix(codec, key)
+            read_options = cls.index_read_options(prefix, prefix + entry)
+            result = 0
+            async with Iterator.range(cf, read_options=read_options, batch_size=cls.SCAN_BATCH_SIZE) as iter:
+                async for _ in iter:
+                    result += 1
+        if result is not None and desc:
+            result = meta.length - 1 - result
+        return result
+
+    @classmethod
+    async def score(cls, codec, cf, key, member: bytes) -> Optional[float]:
+        value = await cf.get(cls.score_key(codec, key, member))
+        return value
+
+    @classmethod
+    async def range_by_score(
+            cls,
+            codec,
+            cf,
+            key,
+            min_score: float,
+            max_score: float,
+            offset: int = 0,
+            count: int = None,
+    ) -> List[Tuple[bytes, float]]:
+        """
+        members with min_score <= score <= max_score in ascending order, after skipping offset of them
+        """
+        result = list()
+        if min_score > max_score or (count is not None and count <= 0):
+            return result
+        prefix = cls.index_prefix(codec, key)
+        read_options = ReadOptions()
+        # every member of max_score sorts below the successor of its encoded score
+        read_options.iterate_upper_bound = Iterator.prefix_successor(prefix + cls.encode_score(max_score))
+        batch_size = cls.SCAN_BATCH_SIZE if count is None else min(offset + count, cls.SCAN_BATCH_SIZE)
+        iterator = Iterator.range(cf, start=prefix + cls.encode_score(min_score), read_options=read_options, batch_size=batch_size)
+        async with iterator as iter:
+            async for index_key, _ in iter:
+                if offset > 0:
+                    offset -= 1
+                    continue
+                result.append(cls.parse_index_key(prefix, index_key))
+                if count is not None and len(result) >= count:
+                    break
+        return result
+
+    @classmethod
+    async def range_by_index(cls, codec, cf, key, meta: KeyMeta, start: int, stop: int, desc=False) -> List[Tuple[bytes, float]]:
+        """
+        members at rank [start, stop] of the ascending (or descending) order
+        with a rank index the scan starts at the first wanted member, otherwise it walks past the first start members
+        """
+        length = meta.length
+        if start < 0:
+            start = max(start + length, 0)
+        if stop < 0:
+            stop += length
+        stop = min(stop, length - 1)
+        result = list()
+        if start > stop:
+            return result
+        prefix = cls.index_prefix(codec, key)
+        read_options = cls.index_read_options(prefix)
+        if meta.rank_index:
+            first, last = (length - 1 - stop, length - 1 - start) if desc else (start, stop)
+            entry = await RankIndex(codec, cf, key, meta).select(first)
+            batch_size = min(last - first + 1, cls.SCAN_BATCH_SIZE)
+            async with Iterator.range(cf, start=prefix + entry, read_options=read_options, batch_size=batch_size) as iter:
+                async for index_key, _ in iter:
+                    result.append(cls.parse_index_key(prefix, index_key))
+                    if len(result) > last - first:
+                        break
+            if desc:
+                result.reverse()
+            return result
+        iterator = Iterator.range(cf, desc=desc, read_options=read_options, batch_size=min(stop + 1, cls.SCAN_BATCH_SIZE))
+        position = 0
+        async with iterator as iter:
+            async for index_key, _ in iter:
+                if position >= start:
+                    result.append(cls.parse_index_key(prefix, index_key))
+                position += 1
+                if position > stop:
+                    break
+        return result
+
+    @classmethod
+    async def delete(cls, codec, db, cf, key, meta_key):
+        async with Batch(db) as batch:
+            batch_cf = batch[cf]
+            for prefix in [cls.score_prefix(codec, key), cls.index_prefix(codec, key), RankIndex.page_prefix(codec, key)]:
+                batch_cf.delete_range(prefix, Iterator.prefix_successor(prefix))
+            batch_cf.delete(meta_key)
+
+    @classmethod
+    async def size(cls, meta: KeyMeta) -> int:
+        if meta is None:
+            return 0
+        else:
+            return meta.length
+
+
+__all__ = ['OrderedSet', ]
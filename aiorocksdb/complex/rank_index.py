@@ -0,0 +1,223 @@
+import bisect
+import struct
+from typing import *
+from aiorocksdb.meta import *
+from aiorocksdb.complex.node_base import *
+
+
+Page = Dict[str, Any]
+
+
+class RankIndex(NodeBase):
+    """
+    order statistics over the index entries of a sorted set, kept in b+tree pages with subtree counts
+    leaf pages hold sorted entries, internal pages hold children, their entry counts and separator keys,
+    keys[i] is the smallest entry below children[i + 1]
+    rank, select, insert and remove touch one page per level, pages are cached for the life of the object,
+    so create one per command and flush the changed pages into that command's write batch
+    emptied pages are dropped, pages are never merged, so deletions keep the height of the largest size reached
+    """
+    PAGE_SIZE = 128
+    BUILD_FILL = PAGE_SIZE * 3 // 4
+    PAGE_ID = struct.Struct('>Q')
+
+    def __init__(self, codec, cf, key: bytes, meta: KeyMeta):
+        self._page_cache: Dict[int, Page] = dict()
+        self._dirty: Set[int] = set()
+        self._dropped: Set[int] = set()
+        self.codec = codec
+        self.cf = cf
+        self.key = key
+        self.meta = meta
+
+    @classmethod
+    def page_prefix(cls, codec, key: bytes) -> bytes:
+        return cls.scoped_prefix(codec, b'zrank', key)
+
+    def page_key(self, page_id: int) -> bytes:
+        return self.page_prefix(self.codec, self.key) + self.PAGE_ID.pack(page_id)
+
+    async def fetch_page(self, page_id: int) -> Page:
+        if page_id in self._page_cache:
+            return self._page_cache[page_id]
+        page = await self.cf.get(self.page_key(page_id))
+        assert page is not None
+        self._page_cache[page_id] = page
+        return page
+
+    def _new_page(self, page: Page) -> int:
+        page_id = self.meta.increase_seq()
+        self._page_cache[page_id] = page
+        self._dirty.add(page_id)
+        return page_id
+
+    def _drop_page(self, page_id: int):
+        self._page_cache.pop(page_id, None)
+        self._dirty.discard(page_id)
+        self._dropped.add(page_id)
+
+    @classmethod
+    def _size(cls, page: Page) -> int:
+        return len(page['entries']) if page['leaf'] else len(page['children'])
+
+    @classmethod
+    def _count(cls, page: Page) -> int:
+        return len(page['entries']) if page['leaf'] else sum(page['counts'])
+
+    def _split(self, page_id: int, page: Page) -> Optional[Tuple[bytes, int, int, int]]:
+        """
+        splits an overflowing page in half, result is (separator, right page id, left count, right count)
+        """
+        if self._size(page) <= self.PAGE_SIZE:
+            return None
+        self._dirty.add(page_id)
+        if page['leaf']:
+            middle = len(page['entries']) // 2
+            right = {'leaf': True, 'entries': page['entries'][middle:]}
+            page['entries'] = page['entries'][:middle]
+            separator = right['entries'][0]
+        else:
+            middle = len(page['children']) // 2
+            right = {
+                'leaf': False,
+                'children': page['children'][middle:],
+                'counts': page['counts'][middle:],
+                'keys': page['keys'][middle:],
+            }
+            separator = page['keys'][middle - 1]
+            page['children'] = page['children'][:middle]
+            page['counts'] = page['counts'][:middle]
+            page['keys'] = page['keys'][:middle - 1]
+        right_id = self._new_page(right)
+        return separator, right_id, self._count(page), self._count(right)
+
+    async def _descend(self, entry: bytes) -> Tuple[List[Tuple[int, Page, int]], int, Page]:
+        path = list()
+        page_id = self.meta.rank_root
+        page = await self.fetch_page(page_id)
+        while not page['leaf']:
+            i = bisect.bisect_right(page['keys'], entry)
+            path.append((page_id, page, i, ))
+            page_id = page['children'][i]
+            page = await self.fetch_page(page_id)
+        return path, page_id, page
+
+    async def insert(self, entry: bytes):
+        if self.meta.rank_root is None:
+            self.meta.rank_root = self._new_page({'leaf': True, 'entries': list()})
+        path, page_id, page = await self._descend(entry)
+        bisect.insort(page['entries'], entry)
+        self._dirty.add(page_id)
+        for parent_id, parent, i in path:
+            parent['counts'][i] += 1
+            self._dirty.add(parent_id)
+        split = self._split(page_id, page)
+        while split and path:
+            parent_id, parent, i = path.pop()
+            separator, right_id, left_count, right_count = split
+            parent['keys'].insert(i, separator)
+            parent['children'].insert(i + 1, right_id)
+            parent['counts'][i] = left_count
+            parent['counts'].insert(i + 1, right_count)
+            split = self._split(parent_id, parent)
+        if split:
+            separator, right_id, left_count, right_count = split
+            self.meta.rank_root = self._new_page({
+                'leaf': False,
+                'children': [self.meta.rank_root, right_id],
+                'counts': [left_count, right_count],
+                'keys': [separator],
+            })
+
+    async def remove(self, entry: bytes) -> bool:
+        if self.meta.rank_root is None:
+            return False
+        path, page_id, page = await self._descend(entry)
+        i = bisect.bisect_left(page['entries'], entry)
+        if i >= len(page['entries']) or page['entries'][i] != entry:
+            return False
+        del page['entries'][i]
+        self._dirty.add(page_id)
+        for parent_id, parent, i in path:
+            parent['counts'][i] -= 1
+            self._dirty.add(parent_id)
+        child_id, child = page_id, page
+        while not self._size(child) and path:
+            parent_id, parent, i = path.pop()
+            self._drop_page(child_id)
+            del parent['children'][i]
+            del parent['counts'][i]
+            if parent['keys']:
+                del parent['keys'][max(i - 1, 0)]
+            child_id, child = parent_id, parent
+        root = await self.fetch_page(self.meta.rank_root)
+        while not root['leaf'] and len(root['children']) == 1:
+            self._drop_page(self.meta.rank_root)
+            self.meta.rank_root = root['children'][0]
+            root = await self.fetch_page(self.meta.rank_root)
+        if not self._size(root):
+            self._drop_page(self.meta.rank_root)
+            self.meta.rank_root = None
+        return True
+
+    async def rank(self, entry: bytes) -> Optional[int]:
+        if self.meta.rank_root is None:
+            return None
+        result = 0
+        page = await self.fetch_page(self.meta.rank_root)
+        while not page['leaf']:
+            i = bisect.bisect_right(page['keys'], entry)
+            result += sum(page['counts'][:i])
+            page = await self.fetch_page(page['children'][i])
+        i = bisect.bisect_left(page['entries'], entry)
+        if i >= len(page['entries']) or page['entries'][i] != entry:
+            return None
+        return result + i
+
+    async def select(self, position: int) -> bytes:
+        """
+        entry at position of the ascending order
+        """
+        page = await self.fetch_page(self.meta.rank_root)
+        while not page['leaf']:
+            for i, count in enumerate(page['counts']):
+                if position < count:
+                    break
+                position -= count
+            page = await self.fetch_page(page['children'][i])
+        return page['entries'][position]
+
+    def build(self, entries: List[bytes]):
+        """
+        bulk loads sorted entries into a new tree, pages are filled to BUILD_FILL so inserts do not split at once
+        """
+        fill = self.BUILD_FILL
+        level = list()
+        for i in range(0, len(entries), fill):
+            chunk = entries[i:i + fill]
+            page_id = self._new_page({'leaf': True, 'entries': chunk})
+            level.append((page_id, chunk[0], len(chunk), ))
+        while len(level) > 1:
+            upper = list()
+            for i in range(0, len(level), fill):
+                chunk = level[i:i + fill]
+                page_id = self._new_page({
+                    'leaf': False,
+                    'children': [child_id for child_id, _, _ in chunk],
+                    'counts': [count for _, _, count in chunk],
+                    'keys': [first for _, first, _ in chunk[1:]],
+                })
+                upper.append((page_id, chunk[0][1], sum(count for _, _, count in chunk), ))
+            level = upper
+        self.meta.rank_root = level[0][0] if level else None
+
+    def flush(self, batch_cf):
+        for page_id in self._dirty:
+            batch_cf.put(self.page_key(page_id), self._page_cache[page_id])
+        for page_id in self._dropped:
+            batch_cf.delete(self.page_key(page_id))
+        self._dirty = set()
+        self._dropped = set()
+
+
+__all__ = ['RankIndex', ]
@@ -6,6 +6,9 @@ from aiorocksdb.batch import *
 from aiorocksdb.column_family import *
 from aiorocksdb.complex.node_base import *
 from aiorocksdb.complex.linked_list import *
+from aiorocksdb.complex.sequence_list import *
+from aiorocksdb.complex.hash_table import *
+from aiorocksdb.complex.ordered_set import *
 
 
 class RedisCommand(NodeBase):
@@ -53,66 +56,299 @@ class RedisCommand(NodeBase):
                     cf.delete(meta_key)
                     cf.delete(data_key)
             elif meta.key_type == KeyTypeEnum.LIST.name:
-                await LinkedList.delete(codec, self.db, self.cf, key)
+                if SequenceList.is_sequence(meta):
+                    await SequenceList.delete(codec, self.db, self.cf, key, meta, meta_key)
+                else:
+                    await LinkedList.delete(codec, self.db, self.cf, key)
+            elif meta.key_type == KeyTypeEnum.HASH.name:
+                await HashTable.delete(codec, self.db, self.cf, key, meta_key)
+            elif meta.key_type == KeyTypeEnum.ZSET.name:
+                await OrderedSet.delete(codec, self.db, self.cf, key, meta_key)
 
     async def llen(self, key) -> int:
         codec = ComplexCodec()
         meta_key = self.meta_key(codec, key)
         async with RedisCommand.LOCK.acquire(key):
             meta = await self.fetch_meta(self.cf, meta_key, KeyTypeEnum.LIST)
-            result = await LinkedList.size(meta)
+            result = await SequenceList.size(meta)
             return result
 
-    async def lpush(self, key, value):
+    async def _push(self, key, value, left: bool):
         codec = ComplexCodec()
         meta_key = self.meta_key(codec, key)
         async with RedisCommand.LOCK.acquire(key):
             meta = await self.fetch_meta(self.cf, meta_key, KeyTypeEnum.LIST)
-            if meta is None:
-                await LinkedList.create(codec, self.db, self.cf, key, meta_key, value)
+            if SequenceList.is_sequence(meta):
+                await SequenceList.push(codec, self.db, self.cf, key, meta, meta_key, value, left)
             else:
-                await LinkedList.insert(codec, self.db, self.cf, key, meta, meta_key, 0, value)
+                await LinkedList.insert(codec, self.db, self.cf, key, meta, meta_key, 0 if left else -1, value)
 
-    async def lpop(self, key) -> Optional[Any]:
+    async def _pop(self, key, left: bool) -> Optional[Any]:
         codec = ComplexCodec()
         meta_key = self.meta_key(codec, key)
         async with RedisCommand.LOCK.acquire(key):
             meta = await self.fetch_meta(self.cf, meta_key, KeyTypeEnum.LIST, assert_exists=True)
-            value = await LinkedList.remove(codec, self.db, self.cf, key, meta, meta_key, 0, True)
+            if SequenceList.is_sequence(meta):
+                value = await SequenceList.pop(codec, self.db, self.cf, key, meta, meta_key, left)
+            else:
+                value = await LinkedList.remove(codec, self.db, self.cf, key, meta, meta_key, 0 if left else -1, True)
             return value
 
+    async def lpush(self, key, value):
+        await self._push(key, value, True)
+
+    async def lpop(self, key) -> Optional[Any]:
+        value = await self._pop(key, True)
+        return value
+
     async def rpush(self, key, value):
+        await self._push(key, value, False)
+
+    async def rpop(self, key) -> Optional[Any]:
+        value = await self._pop(key, False)
+        return value
+
+    async def lindex(self, key, index) -> Any:
         codec = ComplexCodec()
         meta_key = self.meta_key(codec, key)
         async with RedisCommand.LOCK.acquire(key):
-            meta = await self.fetch_meta(self.cf, meta_key, KeyTypeEnum.LIST)
-            if meta is None:
-                await LinkedList.create(codec, self.db, self.cf, key, meta_key, value)
+            meta = await self.fetch_meta(self.cf, meta_key, KeyTypeEnum.LIST, assert_exists=True)
+            if SequenceList.is_sequence(meta):
+                result = await SequenceList.index_of(codec, self.cf, key, meta, index)
             else:
-                await LinkedList.insert(codec, self.db, self.cf, key, meta, meta_key, -1, value)
+                result = await LinkedList.index_of(codec, self.cf, key, meta, index)
+            return result
 
-    async def rpop(self, key) -> Optional[Any]:
+    async def lset(self, key, index, value):
         codec = ComplexCodec()
         meta_key = self.meta_key(codec, key)
         async with RedisCommand.LOCK.acquire(key):
             meta = await self.fetch_meta(self.cf, meta_key, KeyTypeEnum.LIST, assert_exists=True)
-            value = await LinkedList.remove(codec, self.db, self.cf, key, meta, meta_key, -1, True)
-            return value
+            if SequenceList.is_sequence(meta):
+                await SequenceList.update_date(codec, self.cf, key, meta, index, value)
+            else:
+                await LinkedList.update_date(codec, self.cf, key, meta, index, value)
 
-    async def lindex(self, key, index) -> Any:
+    async def _sequence_meta(self, codec, key, meta_key, meta: KeyMeta) -> KeyMeta:
+        if SequenceList.is_sequence(meta):
+            return meta
+        meta = await SequenceList.convert(codec, self.db, self.cf, key, meta, meta_key)
+        return meta
+
+    async def lrange(self, key, start: int, stop: int) -> List[Any]:
         codec = ComplexCodec()
         meta_key = self.meta_key(codec, key)
         async with RedisCommand.LOCK.acquire(key):
-            meta = await self.fetch_meta(self.cf, meta_key, KeyTypeEnum.LIST, assert_exists=True)
-            result = await LinkedList.index_of(codec, self.cf, key, meta, index)
+            meta = await self.fetch_meta(self.cf, meta_key, KeyTypeEnum.LIST)
+            if meta is None:
+                return list()
+            meta = await self._sequence_meta(codec, key, meta_key, meta)
+            result = await SequenceList.range(codec, self.cf, key, meta, start, stop)
             return result
 
-    async def lset(self, key, index, value):
+    async def ltrim(self, key, start: int, stop: int):
         codec = ComplexCodec()
         meta_key = self.meta_key(codec, key)
         async with RedisCommand.LOCK.acquire(key):
-            meta = await self.fetch_meta(self.cf, meta_key, KeyTypeEnum.LIST, assert_exists=True)
-            await LinkedList.update_date(codec, self.cf, key, meta, index, value)
+            meta = await self.fetch_meta(self.cf, meta_key, KeyTypeEnum.LIST)
+            if meta is None:
+                return
+            meta = await self._sequence_meta(codec, key, meta_key, meta)
+            await SequenceList.trim(codec, self.db, self.cf, key, meta, meta_key, start, stop)
+
+    async def lrem(self, key, count: int, value) -> int:
+        codec = ComplexCodec()
+        meta_key = self.meta_key(codec, key)
+        async with RedisCommand.LOCK.acquire(key):
+            meta = await self.fetch_meta(self.cf, meta_key, KeyTypeEnum.LIST)
+            if meta is None:
+                return 0
+            meta = await self._sequence_meta(codec, key, meta_key, meta)
+            result = await SequenceList.remove_value(codec, self.db, self.cf, key, meta, meta_key, count, value)
+            return result
+
+    async def linsert(self, key, pivot, value, before=True) -> int:
+        codec = ComplexCodec()
+        meta_key = self.meta_key(codec, key)
+        async with RedisCommand.LOCK.acquire(key):
+            meta = await self.fetch_meta(self.cf, meta_key, KeyTypeEnum.LIST)
+            if meta is None:
+                return 0
+            meta = await self._sequence_meta(codec, key, meta_key, meta)
+            result = await SequenceList.insert_by_pivot(codec, self.db, self.cf, key, meta, meta_key, pivot, value, before)
+            return result
+
+    async def hset(self, key, field=None, value=None, mapping: Dict[bytes, Any] = None) -> int:
+        """
+        sets field to value and / or every item of mapping, result is the number of fields added
+        """
+        mapping = dict(mapping or dict())
+        if field is not None:
+            mapping[field] = value
+        assert mapping
+        codec = ComplexCodec()
+        meta_key = self.meta_key(codec, key)
+        async with RedisCommand.LOCK.acquire(key):
+            meta = await self.fetch_meta(self.cf, meta_key, KeyTypeEnum.HASH)
+            result = await HashTable.set(codec, self.db, self.cf, key, meta, meta_key, mapping)
+            return result
+
+    async def hget(self, key, field) -> Optional[Any]:
+        codec = ComplexCodec()
+        meta_key = self.meta_key(codec, key)
+        async with RedisCommand.LOCK.acquire(key):
+            meta = await self.fetch_meta(self.cf, meta_key, KeyTypeEnum.HASH)
+            if meta is None:
+                return None
+            result = await HashTable.get(codec, self.cf, key, field)
+            return result
+
+    async def hmget(self, key, fields: List[bytes]) -> List[Optional[Any]]:
+        codec = ComplexCodec()
+        meta_key = self.meta_key(codec, key)
+        async with RedisCommand.LOCK.acquire(key):
+            meta = await self.fetch_meta(self.cf, meta_key, KeyTypeEnum.HASH)
+            if meta is None:
+                return [None] * len(fields)
+            result = await HashTable.multi_get(codec, self.cf, key, fields)
+            return result
+
+    async def hgetall(self, key) -> Dict[bytes, Any]:
+        codec = ComplexCodec()
+        meta_key = self.meta_key(codec, key)
+        async with RedisCommand.LOCK.acquire(key):
+            meta = await self.fetch_meta(self.cf, meta_key, KeyTypeEnum.HASH)
+            if meta is None:
+                return dict()
+            result = await HashTable.get_all(codec, self.cf, key)
+            return result
+
+    async def hincrby(self, key, field, amount: int = 1) -> int:
+        codec = ComplexCodec()
+        meta_key = self.meta_key(codec, key)
+        async with RedisCommand.LOCK.acquire(key):
+            meta = await self.fetch_meta(self.cf, meta_key, KeyTypeEnum.HASH)
+            result = await HashTable.increase(codec, self.db, self.cf, key, meta, meta_key, field, amount)
+            return result
+
+    async def hdel(self, key, *fields) -> int:
+        codec = ComplexCodec()
+        meta_key = self.meta_key(codec, key)
+        async with RedisCommand.LOCK.acquire(key):
+            meta = await self.fetch_meta(self.cf, meta_key, KeyTypeEnum.HASH)
+            if meta is None or not fields:
+                return 0
+            result = await HashTable.remove(codec, self.db, self.cf, key, meta, meta_key, list(fields))
+            return result
+
+    async def hlen(self, key) -> int:
+        codec = ComplexCodec()
+        meta_key = self.meta_key(codec, key)
+        async with RedisCommand.LOCK.acquire(key):
+            meta = await self.fetch_meta(self.cf, meta_key, KeyTypeEnum.HASH)
+            result = await HashTable.size(meta)
+            return result
+
+    async def hexists(self, key, field) -> bool:
+        value = await self.hget(key, field)
+        return value is not None
+
+    @classmethod
+    def _members(cls, items: List[Tuple[bytes, float]], with_scores: bool) -> List[Any]:
+        if with_scores:
+            return items
+        return [member for member, _ in items]
+
+    async def zadd(self, key, mapping: Dict[bytes, float], rank_index=False) -> int:
+        """
+        result is the number of members added, existing members only get their score updated
+        rank_index keeps a RankIndex for the key, so zrank, zrevrank and zrange touch O(log n) keys
+        """
+        assert mapping
+        codec = ComplexCodec()
+        meta_key = self.meta_key(codec, key)
+        async with RedisCommand.LOCK.acquire(key):
+            meta = await self.fetch_meta(self.cf, meta_key, KeyTypeEnum.ZSET)
+            if meta is not None and rank_index:
+                await OrderedSet.enable_rank_index(codec, self.db, self.cf, key, meta, meta_key)
+            result = await OrderedSet.add(codec, self.db, self.cf, key, meta, meta_key, mapping, rank_index)
+            return result
+
+    async def zrem(self, key, *members) -> int:
+        codec = ComplexCodec()
+        meta_key = self.meta_key(codec, key)
+        async with RedisCommand.LOCK.acquire(key):
+            meta = await self.fetch_meta(self.cf, meta_key, KeyTypeEnum.ZSET)
+            if meta is None or not members:
+                return 0
+            result = await OrderedSet.remove(codec, self.db, self.cf, key, meta, meta_key, list(members))
+            return result
+
+    async def zscore(self, key, member) -> Optional[float]:
+        codec = ComplexCodec()
+        meta_key = self.meta_key(codec, key)
+        async with RedisCommand.LOCK.acquire(key):
+            meta = await self.fetch_meta(self.cf, meta_key, KeyTypeEnum.ZSET)
+            if meta is None:
+                return None
+            result = await OrderedSet.score(codec, self.cf, key, member)
+            return result
+
+    async def zrank(self, key, member) -> Optional[int]:
+        codec = ComplexCodec()
+        meta_key = self.meta_key(codec, key)
+        async with RedisCommand.LOCK.acquire(key):
+            meta = await self.fetch_meta(self.cf, meta_key, KeyTypeEnum.ZSET)
+            if meta is None:
+                return None
+            result = await OrderedSet.rank(codec, self.cf, key, meta, member)
+            return result
+
+    async def zrevrank(self, key, member) -> Optional[int]:
+        codec = ComplexCodec()
+        meta_key = self.meta_key(codec, key)
+        async with RedisCommand.LOCK.acquire(key):
+            meta = await self.fetch_meta(self.cf, meta_key, KeyTypeEnum.ZSET)
+            if meta is None:
+                return None
+            result = await OrderedSet.rank(codec, self.cf, key, meta, member, desc=True)
+            return result
+
+    async def zcard(self, key) -> int:
+        codec = ComplexCodec()
+        meta_key = self.meta_key(codec, key)
+        async with RedisCommand.LOCK.acquire(key):
+            meta = await self.fetch_meta(self.cf, meta_key, KeyTypeEnum.ZSET)
+            result = await OrderedSet.size(meta)
+            return result
+
+    async def zrangebyscore(
+            self,
+            key,
+            min_score: float,
+            max_score: float,
+            with_scores=False,
+            offset: int = 0,
+            count: int = None,
+    ) -> List[Any]:
+        codec = ComplexCodec()
+        meta_key = self.meta_key(codec, key)
+        async with RedisCommand.LOCK.acquire(key):
+            meta = await self.fetch_meta(self.cf, meta_key, KeyTypeEnum.ZSET)
+            if meta is None:
+                return list()
+            items = await OrderedSet.range_by_score(codec, self.cf, key, min_score, max_score, offset, count)
+            return self._members(items, with_scores)
+
+    async def zrange(self, key, start: int, stop: int, with_scores=False, desc=False) -> List[Any]:
+        codec = ComplexCodec()
+        meta_key = self.meta_key(codec, key)
+        async with RedisCommand.LOCK.acquire(key):
+            meta = await self.fetch_meta(self.cf, meta_key, KeyTypeEnum.ZSET)
+            if meta is None:
+                return list()
+            items = await OrderedSet.range_by_index(codec, self.cf, key, meta, start, stop, desc)
+            return self._members(items, with_scores)
 
 
 __all__ = ['RedisCommand', ]
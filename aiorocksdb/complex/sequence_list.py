@@ -0,0 +1,319 @@
+import struct
+from typing import *
+from operator import itemgetter
+from aiorocksdb.meta import *
+from aiorocksdb.rocks_db import *
+from aiorocksdb.batch import *
+from aiorocksdb.iterator import *
+from aiorocksdb.complex.node_base import *
+from aiorocksdb.complex.linked_list import *
+
+
+class SequenceList(NodeBase):
+    """
+    list elements live under fixed width sequence keys, element i is stored at head_seq + i
+    push moves head_seq / tail_seq outwards, pop moves them inwards, so neither touches other elements
+    an empty list has tail_seq == head_seq - 1
+    """
+    SEQ_OFFSET = 1 << 63
+    SEQ = struct.Struct('>Q')
+    SCAN_BATCH_SIZE = 1024
+
+    @classmethod
+    def encode_seq(cls, seq: int) -> bytes:
+        """
+        signed 64 bit sequence with the sign bit flipped, big endian keeps bytewise order equal to numeric order
+        """
+        return cls.SEQ.pack(seq + cls.SEQ_OFFSET)
+
+    @classmethod
+    def decode_seq(cls, data: bytes) -> int:
+        return cls.SEQ.unpack(data[-cls.SEQ.size:])[0] - cls.SEQ_OFFSET
+
+    @classmethod
+    def element_prefix(cls, codec, key: bytes) -> bytes:
+        return cls.scoped_prefix(codec, b'seq', key)
+
+    @classmethod
+    def element_key(cls, codec, key: bytes, seq: int) -> bytes:
+        return cls.element_prefix(codec, key) + cls.encode_seq(seq)
+
+    @classmethod
+    def offset(cls, meta: KeyMeta, index: int) -> int:
+        """
+        index is [0, 1, 2, ..., n - 1] or [-n, ..., -2, -1]
+        result is the sequence of the element
+        """
+        position = index + meta.length if index < 0 else index
+        if position < 0 or position >= meta.length:
+            raise ValueError(f'index {index} overflow, list length is {meta.length}')
+        return meta.head_seq + position
+
+    @classmethod
+    def clamp_range(cls, length: int, start: int, stop: int) -> Optional[Tuple[int, int]]:
+        """
+        redis style inclusive range, negative positions count from the tail, out of range positions are clamped
+        result is None when the range is empty
+        """
+        if start < 0:
+            start = max(start + length, 0)
+        if stop < 0:
+            stop += length
+        stop = min(stop, length - 1)
+        if start > stop:
+            return None
+        return start, stop
+
+    @classmethod
+    def range_iterator(cls, codec, cf, key, meta: KeyMeta, first: int, last: int, desc=False) -> Iterator:
+        """
+        one bounded scan over the elements at positions [first, last]
+        """
+        return Iterator.range(
+            cf,
+            start=cls.element_key(codec, key, meta.head_seq + first),
+            stop=cls.element_key(codec, key, meta.head_seq + last),
+            desc=desc,
+            seek_to_prev=desc,
+            batch_size=min(last - first + 1, cls.SCAN_BATCH_SIZE),
+        )
+
+    @classmethod
+    def position(cls, meta: KeyMeta, element_key: bytes) -> int:
+        return cls.decode_seq(element_key) - meta.head_seq
+
+    @classmethod
+    def new_meta(cls) -> KeyMeta:
+        meta = KeyMeta()
+        meta.key_type = KeyTypeEnum.LIST.name
+        meta.encoding = ListEncodingEnum.SEQUENCE.name
+        meta.length = 0
+        meta.head_seq = 0
+        meta.tail_seq = -1
+        return meta
+
+    @classmethod
+    def is_sequence(cls, meta: Optional[KeyMeta]) -> bool:
+        return meta is None or meta.encoding == ListEncodingEnum.SEQUENCE.name
+
+    @classmethod
+    async def push(cls, codec, db, cf, key, meta: Optional[KeyMeta], meta_key, value, left: bool):
+        if meta is None:
+            meta = cls.new_meta()
+        if left:
+            meta.head_seq -= 1
+            seq = meta.head_seq
+        else:
+            meta.tail_seq += 1
+            seq = meta.tail_seq
+        meta.length += 1
+        async with Batch(db) as batch:
+            batch_cf = batch[cf]
+            batch_cf.put(cls.element_key(codec, key, seq), value)
+            batch_cf.put(meta_key, meta.to_dict())
+        return meta.length
+
+    @classmethod
+    async def pop(cls, codec, db, cf, key, meta: KeyMeta, meta_key, left: bool):
+        seq = meta.head_seq if left else meta.tail_seq
+        element_key = cls.element_key(codec, key, seq)
+        value = await cf.get(element_key)
+        if left:
+            meta.head_seq += 1
+        else:
+            meta.tail_seq -= 1
+        meta.length -= 1
+        async with Batch(db) as batch:
+            batch_cf = batch[cf]
+            batch_cf.delete(element_key)
+            if meta.length > 0:
+                batch_cf.put(meta_key, meta.to_dict())
+            else:
+                batch_cf.delete(meta_key)
+        return value
+
+    @classmethod
+    async def delete(cls, codec, db, cf, key, meta: KeyMeta, meta_key):
+        async with Batch(db) as batch:
+            batch_cf = batch[cf]
+            if meta.length > 0:
+                batch_cf.delete_range(
+                    cls.element_key(codec, key, meta.head_seq),
+                    cls.element_key(codec, key, meta.tail_seq + 1),
+                )
+            batch_cf.delete(meta_key)
+
+    @classmethod
+    async def size(cls, meta: KeyMeta) -> int:
+        if meta is None:
+            return 0
+        else:
+            return meta.length
+
+    @classmethod
+    async def index_of(cls, codec, cf, key, meta: KeyMeta, index: int):
+        seq = cls.offset(meta, index)
+        value = await cf.get(cls.element_key(codec, key, seq))
+        return value
+
+    @classmethod
+    async def update_date(cls, codec, cf, key, meta: KeyMeta, index: int, value):
+        seq = cls.offset(meta, index)
+        await cf.put(cls.element_key(codec, key, seq), value)
+
+    @classmethod
+    async def range(cls, codec, cf, key, meta: KeyMeta, start: int, stop: int) -> List[Any]:
+        bounds = cls.clamp_range(meta.length, start, stop)
+        if bounds is None:
+            return list()
+        result = list()
+        async with cls.range_iterator(codec, cf, key, meta, *bounds) as iter:
+            async for _, value in iter:
+                result.append(value)
+        return result
+
+    @classmethod
+    async def trim(cls, codec, db, cf, key, meta: KeyMeta, meta_key, start: int, stop: int):
+        bounds = cls.clamp_range(meta.length, start, stop)
+        if bounds is None:
+            await cls.delete(codec, db, cf, key, meta, meta_key)
+            return
+        first, last = bounds
+        async with Batch(db) as batch:
+            batch_cf = batch[cf]
+            if first > 0:
+                batch_cf.delete_range(
+                    cls.element_key(codec, key, meta.head_seq),
+                    cls.element_key(codec, key, meta.head_seq + first),
+                )
+            if last < meta.length - 1:
+                batch_cf.delete_range(
+                    cls.element_key(codec, key, meta.head_seq + last + 1),
+                    cls.element_key(codec, key, meta.tail_seq + 1),
+                )
+            meta.head_seq, meta.tail_seq = meta.head_seq + first, meta.head_seq + last
+            meta.length = last - first + 1
+            batch_cf.put(meta_key, meta.to_dict())
+
+    @classmethod
+    async def remove_value(cls, codec, db, cf, key, meta: KeyMeta, meta_key, count: int, value) -> int:
+        """
+        count > 0 removes the first count matches from the head, count < 0 from the tail, 0 removes all of them
+        the survivors between the list end that was scanned and the farthest match close the gap,
+        so only that window is rewritten
+        """
+        desc = count < 0
+        limit = abs(count)
+        window = list()
+        removed = set()
+        async with cls.range_iterator(codec, cf, key, meta, 0, meta.length - 1, desc) as iter:
+            async for element_key, element in iter:
+                position = cls.position(meta, element_key)
+                window.append((position, element, ))
+                if element == value:
+                    removed.add(position)
+                    if limit and len(removed) >= limit:
+                        break
+        if not removed:
+            return 0
+        if count == 0:
+            toward_tail = max(removed) + 1 <= meta.length - min(removed)
+        else:
+            toward_tail = count > 0
+        if toward_tail:
+            first, last = 0, max(removed)
+        else:
+            first, last = min(removed), meta.length - 1
+        window.sort(key=itemgetter(0))
+        survivors = [element for position, element in window if first <= position <= last and position not in removed]
+        begin = first + len(removed) if toward_tail else first
+        async with Batch(db) as batch:
+            batch_cf = batch[cf]
+            batch_cf.delete_range(
+                cls.element_key(codec, key, meta.head_seq + first),
+                cls.element_key(codec, key, meta.head_seq + last + 1),
+            )
+            for i, element in enumerate(survivors):
+                batch_cf.put(cls.element_key(codec, key, meta.head_seq + begin + i), element)
+            if toward_tail:
+                meta.head_seq += len(removed)
+            else:
+                meta.tail_seq -= len(removed)
+            meta.length -= len(removed)
+            if meta.length > 0:
+                batch_cf.put(meta_key, meta.to_dict())
+            else:
+                batch_cf.delete(meta_key)
+        return len(removed)
+
+    @classmethod
+    async def insert_by_pivot(cls, codec, db, cf, key, meta: KeyMeta, meta_key, pivot, value, before: bool) -> int:
+        """
+        inserts value next to the first element equal to pivot, the shorter side of the list moves by one position
+        result is the new length, or -1 when pivot is missing
+        """
+        head = list()
+        found = False
+        async with cls.range_iterator(codec, cf, key, meta, 0, meta.length - 1) as iter:
+            async for _, element in iter:
+                if element == pivot:
+                    found = True
+                    if not before:
+                        head.append(element)
+                    break
+                head.append(element)
+        if not found:
+            return -1
+        index = len(head)
+        tail = list()
+        shift_head = index <= meta.length - index
+        if not shift_head:
+            tail = await cls.range(codec, cf, key, meta, index, -1)
+        async with Batch(db) as batch:
+            batch_cf = batch[cf]
+            if shift_head:
+                meta.head_seq -= 1
+                for i, element in enumerate(head):
+                    batch_cf.put(cls.element_key(codec, key, meta.head_seq + i), element)
+            else:
+                for i, element in enumerate(tail):
+                    batch_cf.put(cls.element_key(codec, key, meta.head_seq + index + 1 + i), element)
+                meta.tail_seq += 1
+            batch_cf.put(cls.element_key(codec, key, meta.head_seq + index), value)
+            meta.length += 1
+            batch_cf.put(meta_key, meta.to_dict())
+        return meta.length
+
+    @classmethod
+    async def convert(cls, codec, db, cf, key, meta: KeyMeta, meta_key) -> KeyMeta:
+        """
+        rewrites a linked list into the sequence encoding with one scan of its nodes, one scan of its data and one batch
+        """
+        nodes = dict()
+        values = dict()
+        async with Iterator.prefix(cf, LinkedList.node_key(codec, key) + codec.key_split, scan_profile=ScanProfile()) as iter:
+            async for node_key, node in iter:
+                nodes[node_key] = node
+        async with Iterator.prefix(cf, LinkedList.data_key(codec, key) + codec.key_split, scan_profile=ScanProfile()) as iter:
+            async for data_key, value in iter:
+                values[data_key] = value
+        new_meta = cls.new_meta()
+        new_meta.ttl = meta.ttl
+        seq = meta.head_seq
+        async with Batch(db) as batch:
+            batch_cf = batch[cf]
+            while seq is not None:
+                node_key = LinkedList.node_key(codec, key, seq)
+                data_key = LinkedList.data_key(codec, key, seq)
+                node = ListNode.from_dict(nodes[node_key])
+                new_meta.tail_seq += 1
+                new_meta.length += 1
+                batch_cf.put(cls.element_key(codec, key, new_meta.tail_seq), values.get(data_key))
+                batch_cf.delete(node_key)
+                batch_cf.delete(data_key)
+                seq = node.next
+            batch_cf.put(meta_key, new_meta.to_dict())
+        return new_meta
+
+
+__all__ = ['SequenceList', ]
@@ -22,6 +22,14 @@ class StatusT(Generic[T]):
     def ToString(self) -> str:
         ...
 
+    @abc.abstractmethod
+    def is_not_found(self) -> bool:
+        ...
+
+    @abc.abstractmethod
+    def is_incomplete(self) -> bool:
+        ...
+
     result: Optional[T] = None
 
 
@@ -30,6 +38,144 @@ class ComplexStatusT:
     value: Union[Optional[str], List[str]]
     status_list: List[StatusT]
     value_list: List[bytes]
+    error_list: List[Tuple[int, StatusT]]
+
+
+class PinnableSliceT:
+    @abc.abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    @abc.abstractmethod
+    def to_bytes(self) -> bytes:
+        ...
+
+    @abc.abstractmethod
+    def release(self):
+        ...
+
+
+class StatisticsT:
+    stats_level: int
+
+    @abc.abstractmethod
+    def get_ticker_count(self, name: str) -> int:
+        ...
+
+    @abc.abstractmethod
+    def get_and_reset_ticker_count(self, name: str) -> int:
+        ...
+
+    @abc.abstractmethod
+    def get_histogram_data(self, name: str) -> Dict[str, float]:
+        ...
+
+    @abc.abstractmethod
+    def tickers(self) -> Dict[str, int]:
+        ...
+
+    @abc.abstractmethod
+    def histograms(self) -> Dict[str, Dict[str, float]]:
+        ...
+
+    @abc.abstractmethod
+    def reset(self) -> StatusT:
+        ...
+
+    @abc.abstractmethod
+    def ToString(self) -> str:
+        ...
+
+
+class CacheT:
+    @abc.abstractmethod
+    def name(self) -> str:
+        ...
+
+    @abc.abstractmethod
+    def get_capacity(self) -> int:
+        ...
+
+    @abc.abstractmethod
+    def set_capacity(self, capacity: int):
+        ...
+
+    @abc.abstractmethod
+    def get_usage(self) -> int:
+        ...
+
+    @abc.abstractmethod
+    def get_pinned_usage(self) -> int:
+        ...
+
+
+class BlockBasedTableOptionsT:
+    block_cache: Optional[CacheT]
+    no_block_cache: bool
+    block_size: int
+    block_restart_interval: int
+    cache_index_and_filter_blocks: bool
+    cache_index_and_filter_blocks_with_high_priority: bool
+    pin_l0_filter_and_index_blocks_in_cache: bool
+    pin_top_level_index_and_filter: bool
+    partition_filters: bool
+    whole_key_filtering: bool
+    optimize_filters_for_memory: bool
+    format_version: int
+
+    @abc.abstractmethod
+    def set_bloom_filter(self, bits_per_key: float = 10.0):
+        ...
+
+
+class RateLimiterT:
+    @abc.abstractmethod
+    def get_bytes_per_second(self) -> int:
+        ...
+
+    @abc.abstractmethod
+    def set_bytes_per_second(self, bytes_per_second: int):
+        ...
+
+    @abc.abstractmethod
+    def get_total_bytes_through(self) -> int:
+        ...
+
+    @abc.abstractmethod
+    def get_total_requests(self) -> int:
+        ...
+
+
+class WriteBufferManagerT:
+    @abc.abstractmethod
+    def enabled(self) -> bool:
+        ...
+
+    @abc.abstractmethod
+    def memory_usage(self) -> int:
+        ...
+
+    @abc.abstractmethod
+    def mutable_memtable_memory_usage(self) -> int:
+        ...
+
+    @abc.abstractmethod
+    def buffer_size(self) -> int:
+        ...
+
+    @abc.abstractmethod
+    def set_buffer_size(self, buffer_size: int):
+        ...
+
+
+class ExternalSstFileInfoT:
+    file_path: str
+    smallest_key: bytes
+    largest_key: bytes
+    sequence_number: int
+    file_size: int
+    num_entries: int
+    num_range_del_entries: int
 
 
 class DbPathT:
@@ -37,7 +183,72 @@ class DbPathT:
     target_size: int
 
 
-class OptionsT:
+class ColumnFamilyOptionsT:
+    write_buffer_size: int
+    max_write_buffer_number: int
+    min_write_buffer_number_to_merge: int
+    target_file_size_base: int
+    target_file_size_multiplier: int
+    max_bytes_for_level_base: int
+    max_bytes_for_level_multiplier: float
+    level_compaction_dynamic_level_bytes: bool
+    level0_file_num_compaction_trigger: int
+    level0_slowdown_writes_trigger: int
+    level0_stop_writes_trigger: int
+    num_levels: int
+    compression: int
+    bottommost_compression: int
+    compaction_style: int
+    disable_auto_compactions: bool
+    optimize_filters_for_hits: bool
+    memtable_prefix_bloom_size_ratio: float
+    memtable_whole_key_filtering: bool
+    prefix_extractor_name: Optional[str]
+
+    @abc.abstractmethod
+    def set_fixed_prefix_extractor(self, prefix_len: int):
+        ...
+
+    @abc.abstractmethod
+    def set_capped_prefix_extractor(self, cap_len: int):
+        ...
+
+    @abc.abstractmethod
+    def set_delimiter_prefix_extractor(self, delimiter: Union[str, bytes] = ':', occurrences: int = 1):
+        ...
+
+    @abc.abstractmethod
+    def clear_prefix_extractor(self):
+        ...
+
+    merge_operator_name: Optional[str]
+
+    @abc.abstractmethod
+    def set_uint64_add_merge_operator(self):
+        ...
+
+    @abc.abstractmethod
+    def set_string_append_merge_operator(self, delimiter: Union[str, bytes] = ','):
+        ...
+
+    @abc.abstractmethod
+    def set_max_merge_operator(self):
+        ...
+
+    @abc.abstractmethod
+    def set_min_merge_operator(self):
+        ...
+
+    @abc.abstractmethod
+    def clear_merge_operator(self):
+        ...
+
+    @abc.abstractmethod
+    def set_block_based_table_factory(self, table_options: BlockBasedTableOptionsT):
+        ...
+
+
+class OptionsT(ColumnFamilyOptionsT):
     @abc.abstractmethod
     def IncreaseParallelism(self, total_threads: int = 16):
         ...
@@ -46,6 +257,20 @@ class OptionsT:
     def OptimizeLevelStyleCompaction(self, memtable_memory_budget: int = 512 * 1024 * 1024):
         ...
 
+    @abc.abstractmethod
+    def enable_statistics(self, level: int = ...) -> StatisticsT:
+        ...
+
+    statistics: Optional[StatisticsT]
+    row_cache: Optional[CacheT]
+    rate_limiter: Optional[RateLimiterT]
+    write_buffer_manager: Optional[WriteBufferManagerT]
+    db_write_buffer_size: int
+    bytes_per_sync: int
+    wal_bytes_per_sync: int
+    stats_dump_period_sec: int
+    stats_persist_period_sec: int
+
     max_log_file_size: int
     max_background_flushes: int
     max_subcompactions: int
@@ -67,6 +292,23 @@ class OptionsT:
 
 class ReadOptionsT:
     tailing: bool
+    prefix_same_as_start: bool
+    total_order_seek: bool
+    auto_prefix_mode: bool
+    fill_cache: bool
+    verify_checksums: bool
+    readahead_size: int
+    auto_readahead_size: bool
+    adaptive_readahead: bool
+    pin_data: bool
+    async_io: bool
+    read_tier: int
+    iterate_lower_bound: Optional[bytes]
+    iterate_upper_bound: Optional[bytes]
+
+    @abc.abstractmethod
+    def copy(self) -> 'ReadOptionsT':
+        ...
 
 
 class RColumnFamilyT:
@@ -78,6 +320,14 @@ class RColumnFamilyT:
     def is_loaded(self) -> bool:
         ...
 
+    @abc.abstractmethod
+    def has_prefix_extractor(self) -> bool:
+        ...
+
+    @abc.abstractmethod
+    def prefix_seek_compatible(self, prefix: bytes) -> bool:
+        ...
+
 
 class SnapshotT:
     @abc.abstractmethod
@@ -89,5 +339,5 @@ class LatestOptionsStatusT(StatusT[List[RColumnFamilyT]]):
     options: Optional[OptionsT] = None
 
 
-__all__ = ['StatusT', 'ComplexStatusT', 'DbPathT', 'OptionsT', 'ReadOptionsT', 'RColumnFamilyT',
+__all__ = ['StatusT', 'ComplexStatusT', 'PinnableSliceT', 'StatisticsT', 'CacheT', 'BlockBasedTableOptionsT', 'ExternalSstFileInfoT', 'RateLimiterT', 'WriteBufferManagerT', 'DbPathT', 'ColumnFamilyOptionsT', 'OptionsT', 'ReadOptionsT', 'RColumnFamilyT',
            'SnapshotT', 'LatestOptionsStatusT', ]
@@ -0,0 +1,77 @@
+import asyncio
+from typing import *
+from .db_native import REventListener
+from .rocks_db import *
+
+
+Event = Dict[str, Union[str, int]]
+
+
+class EventListener:
+    """
+    delivers RocksDB flush, compaction, write stall and background error events to an asyncio callback
+    background threads only queue events natively, the loop drains them in batches when the wakeup pipe is readable
+    callback receives a list of event dicts and may be a coroutine function
+    """
+
+    def __init__(self, callback: Callable[[List[Event]], Any] = None, loop: asyncio.AbstractEventLoop = None):
+        self.native = REventListener()
+        self.callback = callback
+        self.loop = loop or asyncio.get_event_loop()
+        self.stall_conditions: Dict[str, str] = dict()
+        self.no_stall = asyncio.Event()
+        self.no_stall.set()
+        self.event_count = 0
+        self._started = False
+
+    def attach(self, options: Options):
+        assert isinstance(options, Options)
+        options.add_event_listener(self.native)
+        self.start()
+
+    def start(self):
+        if self._started:
+            return
+        self.loop.add_reader(self.native.fileno(), self._drain)
+        self._started = True
+
+    def stop(self):
+        if not self._started:
+            return
+        self.loop.remove_reader(self.native.fileno())
+        self._drain()
+        self._started = False
+
+    def _drain(self):
+        events = self.native.drain()
+        if not events:
+            return
+        self.event_count += len(events)
+        for event in events:
+            if event['type'] == 'stall_conditions_changed':
+                self._update_stall(event['cf_name'], event['condition'])
+        if self.callback is None:
+            return
+        result = self.callback(events)
+        if asyncio.iscoroutine(result):
+            self.loop.create_task(result)
+
+    def _update_stall(self, cf_name: str, condition: str):
+        if condition == 'normal':
+            self.stall_conditions.pop(cf_name, None)
+        else:
+            self.stall_conditions[cf_name] = condition
+        if self.stall_conditions:
+            self.no_stall.clear()
+        else:
+            self.no_stall.set()
+
+    @property
+    def is_stalled(self) -> bool:
+        return bool(self.stall_conditions)
+
+    async def wait_for_no_stall(self):
+        await self.no_stall.wait()
+
+
+__all__ = ['EventListener', ]
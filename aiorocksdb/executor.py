@@ -0,0 +1,66 @@
+import threading
+from typing import *
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+
+class ExecutorRegistry:
+    """
+    reference counted thread pool shared by every AsyncCallMixin user
+    max_workers is a worker count or a callable policy returning one,
+    the pool is created by the first user and shut down when the last user releases it
+    """
+    _default: Optional['ExecutorRegistry'] = None
+
+    def __init__(self, max_workers: Union[int, Callable[[], int], None] = None, thread_name_prefix: str = 'aiorocksdb'):
+        self.max_workers = max_workers
+        self.thread_name_prefix = thread_name_prefix
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._users = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def default(cls) -> 'ExecutorRegistry':
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    @classmethod
+    def set_default(cls, registry: 'ExecutorRegistry'):
+        assert isinstance(registry, ExecutorRegistry)
+        cls._default = registry
+
+    @property
+    def users(self) -> int:
+        return self._users
+
+    @property
+    def executor(self) -> Optional[Executor]:
+        return self._executor
+
+    def worker_count(self) -> Optional[int]:
+        if callable(self.max_workers):
+            return self.max_workers()
+        return self.max_workers
+
+    def acquire(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.worker_count(),
+                    thread_name_prefix=self.thread_name_prefix,
+                )
+            self._users += 1
+            return self._executor
+
+    def release(self, executor: Executor):
+        with self._lock:
+            if executor is not self._executor:
+                return
+            self._users -= 1
+            if self._users <= 0:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+                self._users = 0
+
+
+__all__ = ['ExecutorRegistry', ]
@@ -80,7 +80,7 @@ class Db:
         await self.close()
 
     async def create_column_family(self, column_family: Union[str, RColumnFamilyT, ColumnFamilyBase], options: ColumnFamilyOptions = None) -> StatusT:
-        cf = RColumnFamily(column_family)
+        cf = RColumnFamily(column_family, options) if options else RColumnFamily(column_family)
         status = await self.d.create_column_family(cf, options)
         return status
 
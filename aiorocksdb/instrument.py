@@ -0,0 +1,102 @@
+import time
+from typing import *
+
+
+class LatencyHistogram:
+    """
+    log2 bucketed latency histogram in microseconds, bucket i holds samples in [2 ** (i - 1), 2 ** i)
+    """
+    BUCKET_COUNT = 40
+
+    def __init__(self):
+        self.buckets = [0] * self.BUCKET_COUNT
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, micros: int):
+        index = micros.bit_length()
+        if index >= self.BUCKET_COUNT:
+            index = self.BUCKET_COUNT - 1
+        self.buckets[index] += 1
+        self.count += 1
+        self.total += micros
+        if micros > self.max:
+            self.max = micros
+
+    def percentile(self, p: float) -> int:
+        if not self.count:
+            return 0
+        rank = self.count * p / 100
+        seen = 0
+        for index, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                return min(1 << index, self.max)
+        return self.max
+
+    def snapshot(self) -> Dict[str, Union[int, float]]:
+        return dict(
+            count=self.count,
+            average=self.total / self.count if self.count else 0,
+            p50=self.percentile(50),
+            p95=self.percentile(95),
+            p99=self.percentile(99),
+            max=self.max,
+        )
+
+
+class Instrument:
+    """
+    per operation queue wait / execution latency of AsyncCallMixin calls
+    sample_rate 0.01 records one call out of a hundred, records are only mutated on the event loop thread
+    """
+
+    def __init__(self, sample_rate: float = 1.0):
+        assert 0 < sample_rate <= 1
+        self.sample_rate = sample_rate
+        self._interval = max(1, round(1 / sample_rate))
+        self._counter = 0
+        self.records: Dict[str, Tuple[LatencyHistogram, LatencyHistogram]] = dict()
+
+    def sample(self) -> bool:
+        self._counter += 1
+        if self._counter < self._interval:
+            return False
+        self._counter = 0
+        return True
+
+    def wrap(self, fn: Callable, name: str) -> Tuple[Callable, Callable]:
+        submit = time.perf_counter_ns()
+        timing = [submit, submit]
+
+        def timed_call():
+            timing[0] = time.perf_counter_ns()
+            try:
+                return fn()
+            finally:
+                timing[1] = time.perf_counter_ns()
+
+        def done_callback(_):
+            self.record(name, (timing[0] - submit) // 1000, (timing[1] - timing[0]) // 1000)
+
+        return timed_call, done_callback
+
+    def record(self, name: str, queue_wait: int, execution: int):
+        histograms = self.records.get(name)
+        if histograms is None:
+            histograms = self.records[name] = (LatencyHistogram(), LatencyHistogram())
+        histograms[0].record(queue_wait)
+        histograms[1].record(execution)
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, Union[int, float]]]]:
+        return {
+            name: dict(queue_wait=queue_wait.snapshot(), execution=execution.snapshot())
+            for name, (queue_wait, execution) in self.records.items()
+        }
+
+    def reset(self):
+        self.records.clear()
+
+
+__all__ = ['LatencyHistogram', 'Instrument', ]
@@ -1,4 +1,5 @@
 from typing import *
+from collections import deque
 from .error_type import *
 from .rocks_db import *
 from .codec import *
@@ -6,6 +7,8 @@ from .column_family import *
 
 
 class Iterator:
+    DEFAULT_BATCH_SIZE = 64
+
     def __init__(
             self,
             c: ColumnFamilyBase,
@@ -15,6 +18,8 @@ class Iterator:
             desc=False,
             seek_to_prev=False,
             read_options=None,
+            batch_size: int = None,
+            scan_profile: ScanProfile = None,
     ):
         self.desc = desc
         self.prefix = prefix
@@ -24,29 +29,105 @@ class Iterator:
         self.options = read_options
         self.iterator: RocksDbIterator = None
         self.seek_to_prev = seek_to_prev
+        self.batch_size = batch_size or self.DEFAULT_BATCH_SIZE
+        self.scan_profile = scan_profile
+        self._rows: Deque[Tuple[bytes, bytes]] = deque()
+        self._exhausted = False
         if start is not None and stop is not None:
             assert start <= stop
+        assert self.batch_size > 0
 
     @classmethod
-    def prefix(cls, c: ColumnFamilyBase, prefix, read_options=None):
-        return cls(c, prefix=prefix, read_options=read_options)
+    def prefix(
+            cls,
+            c: ColumnFamilyBase,
+            prefix,
+            read_options=None,
+            batch_size: int = None,
+            scan_profile: ScanProfile = None,
+    ):
+        return cls(c, prefix=prefix, read_options=read_options, batch_size=batch_size, scan_profile=scan_profile)
 
     @classmethod
-    def range(cls, c: ColumnFamilyBase, start: bytes = None, stop: bytes = None, desc=False, seek_to_prev=False, read_options=None):
-        return cls(c, start=start, stop=stop, desc=desc, seek_to_prev=seek_to_prev, read_options=read_options)
+    def range(
+            cls,
+            c: ColumnFamilyBase,
+            start: bytes = None,
+            stop: bytes = None,
+            desc=False,
+            seek_to_prev=False,
+            read_options=None,
+            batch_size: int = None,
+            scan_profile: ScanProfile = None,
+    ):
+        return cls(
+            c,
+            start=start,
+            stop=stop,
+            desc=desc,
+            seek_to_prev=seek_to_prev,
+            read_options=read_options,
+            batch_size=batch_size,
+            scan_profile=scan_profile,
+        )
 
     async def seek(self, key: bytes):
+        self._rows.clear()
+        self._exhausted = False
         if self.seek_to_prev:
             await self.iterator.seek_for_prev(key)
         else:
             await self.iterator.seek(key)
 
+    @classmethod
+    def prefix_successor(cls, prefix: bytes) -> Optional[bytes]:
+        prefix = prefix.rstrip(b'\xff')
+        if not prefix:
+            return None
+        return prefix[:-1] + bytes([prefix[-1] + 1])
+
+    def _bounds(self) -> Tuple[Optional[bytes], Optional[bytes]]:
+        if self.prefix is not None:
+            return self.prefix, self.prefix_successor(self.prefix)
+        lower = None
+        upper = None
+        # seek_for_prev may land before start, and seek(stop) may land after stop
+        if self.start is not None and (self.desc or not self.seek_to_prev):
+            lower = self.start
+        if self.stop is not None and (not self.desc or self.seek_to_prev):
+            upper = self.stop + b'\x00'
+        return lower, upper
+
+    def _read_options(self) -> Optional[ReadOptions]:
+        lower, upper = self._bounds()
+        cf = self.c.cf
+        # prefix bloom filters are only exact when every key under self.prefix shares one extracted prefix
+        prefix_seek = self.prefix is not None and cf.prefix_seek_compatible(self.prefix)
+        total_order_seek = not prefix_seek and cf.has_prefix_extractor()
+        if lower is None and upper is None and not prefix_seek and not total_order_seek and self.scan_profile is None:
+            return self.options
+        if self.scan_profile is not None:
+            options = self.scan_profile.apply(self.options)
+        else:
+            options = self.options.copy() if self.options is not None else ReadOptions()
+        if prefix_seek:
+            options.prefix_same_as_start = True
+        elif total_order_seek and not options.prefix_same_as_start:
+            options.total_order_seek = True
+        if lower is not None:
+            if options.iterate_lower_bound is None or options.iterate_lower_bound < lower:
+                options.iterate_lower_bound = lower
+        if upper is not None:
+            if options.iterate_upper_bound is None or options.iterate_upper_bound > upper:
+                options.iterate_upper_bound = upper
+        return options
+
     async def _build_iterator(self):
         if self.iterator:
             return
         db = self.c.d
         cf = self.c.cf
-        self.iterator = await db.create_iterator(self.options, cf)
+        self.iterator = await db.create_iterator(self._read_options(), cf)
         if self.prefix is not None:
             await self.iterator.seek(self.prefix)
             self.desc = False
@@ -90,29 +171,33 @@ class Iterator:
     def __aiter__(self):
         return self
 
+    def _finish(self):
+        self._rows.clear()
+        self._exhausted = True
+        raise StopAsyncIteration
+
     async def __anext__(self) -> Tuple[bytes, bytes]:
-        valid = await self.iterator.valid()
-        if not valid:
-            status = await self.iterator.status()
-            if not status.ok():
-                raise StatusError(status)
-            else:
-                raise StopAsyncIteration
-        key = await self.iterator.key()
+        if not self._rows:
+            if not self._exhausted:
+                rows = await self.iterator.next_batch(self.batch_size, self.desc)
+                self._exhausted = len(rows) < self.batch_size
+                self._rows.extend(rows)
+            if not self._rows:
+                status = await self.iterator.status()
+                if not status.ok():
+                    raise StatusError(status)
+                else:
+                    raise StopAsyncIteration
+        key, value = self._rows.popleft()
         if self.prefix is not None:
             if not key.startswith(self.prefix):
-                raise StopAsyncIteration
+                self._finish()
         if self.desc and self.start is not None:
             if key < self.start:
-                raise StopAsyncIteration
+                self._finish()
         if not self.desc and self.stop is not None:
             if key > self.stop:
-                raise StopAsyncIteration
-        value = await self.iterator.value()
-        if self.desc:
-            await self.iterator.prev()
-        else:
-            await self.iterator.next()
+                self._finish()
         d = self.c.d
         codec = Codec.find_codec(key, d.codec_list)
         value = codec.loads(value)
@@ -13,6 +13,13 @@ class KeyTypeEnum(enum.Enum):
     ORDER_LIST = enum.auto()
     ORDER_LIST_SET = enum.auto()
     ORDER_LIST_ZSET = enum.auto()
+    HASH = enum.auto()
+    ZSET = enum.auto()
+
+
+class ListEncodingEnum(enum.Enum):
+    LINKED = enum.auto()
+    SEQUENCE = enum.auto()
 
 
 class MetaBase(ABC):
@@ -49,6 +56,11 @@ class KeyMeta(MetaBase):
     head_seq: int = None
     tail_seq: int = None
     seq: int = 0
+    # None for lists written before encodings existed, they are linked lists
+    encoding: str = None
+    # sorted sets only, whether a RankIndex is kept and the id of its root page
+    rank_index: bool = False
+    rank_root: int = None
 
     def height(self):
         height = int(math.log2(max(self.length, 1)))
@@ -80,4 +92,4 @@ class SkipListNode(MetaBase):
         return f'<SkipListNode: {self.seq} prev: {self.prev} next: {self.next}>'
 
 
-__all__ = ['KeyTypeEnum', 'KeyMeta', 'ListNode', 'SkipListNode', 'MetaBase', ]
+__all__ = ['KeyTypeEnum', 'ListEncodingEnum', 'KeyMeta', 'ListNode', 'SkipListNode', 'MetaBase', ]
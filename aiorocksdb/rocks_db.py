@@ -1,18 +1,40 @@
 from typing import *
 import asyncio
 from functools import partial
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Executor
 from aiorocksdb.db_type import *
+from aiorocksdb.executor import *
+from aiorocksdb.instrument import *
 from aiorocksdb.db_native import *
 from aiorocksdb.db_api import *
+from aiorocksdb.error_type import *
 
 
 import faulthandler
 faulthandler.enable()
 
 
+def is_buffer(obj) -> bool:
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return True
+    if isinstance(obj, str):
+        return False
+    try:
+        memoryview(obj).release()
+    except TypeError:
+        return False
+    return True
+
+
 class AsyncCallMixin:
     def _aio_call(self, fn: Callable, *args, **kwargs):
+        if self.instrument is not None and self.instrument.sample():
+            timed_call, done_callback = self.instrument.wrap(
+                partial(fn, *args, **kwargs), getattr(fn, '__name__', 'call'),
+            )
+            future = self.loop.run_in_executor(self.thread, timed_call)
+            future.add_done_callback(done_callback)
+            return future
         return self.loop.run_in_executor(
             self.thread, partial(fn, *args, **kwargs)
         )
@@ -20,17 +42,34 @@ class AsyncCallMixin:
     async def _sio_call(self, fn: Callable, *args, **kwargs):
         return fn(*args, **kwargs)
 
-    def __init__(self):
-        self.thread = ThreadPoolExecutor()
+    def __init__(self, executor: Union[Executor, ExecutorRegistry] = None):
+        executor = executor or ExecutorRegistry.default()
+        if isinstance(executor, ExecutorRegistry):
+            self.executor_registry = executor
+            self.thread = executor.acquire()
+        else:
+            assert isinstance(executor, Executor)
+            self.executor_registry = None
+            self.thread = executor
         self.aio_call = self._aio_call
         self.loop = asyncio.get_event_loop()
+        self.instrument: Optional[Instrument] = None
+
+    def enable_instrumentation(self, sample_rate: float = 1.0, instrument: Instrument = None) -> Instrument:
+        self.instrument = instrument or Instrument(sample_rate)
+        return self.instrument
+
+    def disable_instrumentation(self):
+        self.instrument = None
 
     def close_executor(self):
         if not self.thread:
             return
-        self.thread.shutdown(wait=False)
+        if self.executor_registry:
+            self.executor_registry.release(self.thread)
         self.aio_call = None
         self.thread = None
+        self.executor_registry = None
 
 
 class RocksDbTransaction:
@@ -40,15 +79,23 @@ class RocksDbTransaction:
         self.db = db
 
     async def put(self, key: bytes, value: bytes, column_family: RColumnFamily = None) -> StatusT:
-        assert isinstance(key, bytes)
-        assert isinstance(value, bytes)
+        assert is_buffer(key)
+        assert is_buffer(value)
         column_family = column_family or self.db.default_column_family
         assert isinstance(column_family, RColumnFamily)
         status = await self.aio_call(self.transaction.put, column_family, key, value)
         return status
 
+    async def merge(self, key: bytes, value: bytes, column_family: RColumnFamily = None) -> StatusT:
+        assert is_buffer(key)
+        assert is_buffer(value)
+        column_family = column_family or self.db.default_column_family
+        assert isinstance(column_family, RColumnFamily)
+        status = await self.aio_call(self.transaction.merge, column_family, key, value)
+        return status
+
     async def delete(self, key: bytes, column_family: RColumnFamily = None) -> StatusT:
-        assert isinstance(key, bytes)
+        assert is_buffer(key)
         column_family = column_family or self.db.default_column_family
         assert isinstance(column_family, RColumnFamily)
         status = await self.aio_call(self.transaction.delete_key, column_family, key)
@@ -103,7 +150,7 @@ class RocksDbTransaction:
             read_options: ReadOptionsT = None,
             column_family: RColumnFamilyT = None,
     ) -> StatusT[bytes]:
-        assert isinstance(key, bytes)
+        assert is_buffer(key)
         read_options = read_options or ReadOptions()
         assert isinstance(read_options, ReadOptions)
         column_family = column_family or self.db.default_column_family
@@ -128,11 +175,11 @@ class RocksDbIterator:
         self.iterator = None
 
     async def seek(self, key: bytes):
-        assert isinstance(key, bytes)
+        assert is_buffer(key)
         await self.aio_call(self.iterator.seek, key)
 
     async def seek_for_prev(self, key: bytes):
-        assert isinstance(key, bytes)
+        assert is_buffer(key)
         await self.aio_call(self.iterator.seek_for_prev, key)
 
     async def seek_to_first(self):
@@ -151,6 +198,11 @@ class RocksDbIterator:
     async def next(self):
         await self.aio_call(self.iterator.next)
 
+    async def next_batch(self, n: int, reverse: bool = False) -> List[Tuple[bytes, bytes]]:
+        assert isinstance(n, int) and n > 0
+        result = await self.aio_call(self.iterator.next_batch, n, reverse)
+        return result
+
     async def key(self) -> bytes:
         result = await self.aio_call(self.iterator.key)
         return result
@@ -169,12 +221,12 @@ class RocksDbIterator:
 
 
 class SstFileReader(AsyncCallMixin):
-    def __init__(self, options: Options = None):
+    def __init__(self, options: Options = None, executor: Union[Executor, ExecutorRegistry] = None):
         options = options or Options()
         assert isinstance(options, Options)
         self.options = options
         self.reader = RSstFileReader(options)
-        super(SstFileReader, self).__init__()
+        super(SstFileReader, self).__init__(executor)
 
     async def open(self, file_path: str) -> StatusT:
         status = await self.aio_call(self.reader.open, file_path)
@@ -199,7 +251,12 @@ class SstFileReader(AsyncCallMixin):
 
 
 class SstFileWriter(AsyncCallMixin):
-    def __init__(self, env_options: EnvOptions = None, options: Options = None):
+    def __init__(
+            self,
+            env_options: EnvOptions = None,
+            options: Options = None,
+            executor: Union[Executor, ExecutorRegistry] = None,
+    ):
         env_options = env_options or EnvOptions()
         assert isinstance(env_options, EnvOptions)
         options = options or Options()
@@ -207,40 +264,52 @@ class SstFileWriter(AsyncCallMixin):
         self.env_options = env_options
         self.options = options
         self.writer = RSstFileWriter(env_options, options)
-        super(SstFileWriter, self).__init__()
+        super(SstFileWriter, self).__init__(executor)
 
     async def open(self, file_path: str) -> StatusT:
         status = await self.aio_call(self.writer.open, file_path)
         return status
 
     async def put(self, key: bytes, value: bytes) -> StatusT:
-        assert isinstance(key, bytes)
-        assert isinstance(value, bytes)
+        assert is_buffer(key)
+        assert is_buffer(value)
         status = await self.aio_call(self.writer.put, key, value)
         return status
 
+    async def put_many(self, pairs: Iterable[Tuple[bytes, bytes]]) -> StatusT:
+        pairs = list(pairs)
+        status = await self.aio_call(self.writer.put_many, pairs)
+        return status
+
     async def delete(self, key: bytes) -> StatusT:
-        assert isinstance(key, bytes)
+        assert is_buffer(key)
         status = await self.aio_call(self.writer.delete, key)
         return status
 
+    async def delete_many(self, keys: Iterable[bytes]) -> StatusT:
+        keys = list(keys)
+        status = await self.aio_call(self.writer.delete_many, keys)
+        return status
+
     async def delete_range(self, key_from: bytes, key_to: bytes) -> StatusT:
-        assert isinstance(key_from, bytes)
-        assert isinstance(key_to, bytes)
+        assert is_buffer(key_from)
+        assert is_buffer(key_to)
         status = await self.aio_call(self.writer.delete_range, key_from, key_to)
         return status
 
-    async def finish(self) -> StatusT:
-        status = await self.aio_call(self.writer.finish)
+    async def finish(self) -> StatusT[ExternalSstFileInfoT]:
+        complex_status: ComplexStatusT = await self.aio_call(self.writer.finish)
         self.close_executor()
+        status = complex_status.status
+        status.result = complex_status.value
         return status
 
 
 class RocksDbBackupReadonly(AsyncCallMixin):
-    def __init__(self, backup=None):
+    def __init__(self, backup=None, executor: Union[Executor, ExecutorRegistry] = None):
         backup = backup or RBackupReadonly
         self.backup = backup()
-        super(RocksDbBackupReadonly, self).__init__()
+        super(RocksDbBackupReadonly, self).__init__(executor)
 
     async def open(self, options: BackupableDBOptionsNative) -> StatusT:
         assert isinstance(options, BackupableDBOptionsNative)
@@ -277,8 +346,8 @@ class RocksDbBackupReadonly(AsyncCallMixin):
 
 
 class RocksDbDbBackup(RocksDbBackupReadonly):
-    def __init__(self):
-        super(RocksDbDbBackup, self).__init__(backup=RBackup)
+    def __init__(self, executor: Union[Executor, ExecutorRegistry] = None):
+        super(RocksDbDbBackup, self).__init__(backup=RBackup, executor=executor)
 
     async def purge_old_backups(self, num_backups_to_keep: int) -> StatusT:
         assert isinstance(num_backups_to_keep, int) and num_backups_to_keep > 0
@@ -291,17 +360,144 @@ class RocksDbDbBackup(RocksDbBackupReadonly):
         return result
 
 
+class ScanProfile:
+    """
+    read options for long scans, blocks read by the scan do not evict the hot working set from the block cache
+    pin_data only pays off when callers keep slices alive, keys and values are copied to bytes here so it is off by default
+    """
+    def __init__(
+            self,
+            fill_cache: bool = False,
+            readahead_size: int = 2 * 1024 * 1024,
+            auto_readahead_size: bool = True,
+            adaptive_readahead: bool = True,
+            pin_data: bool = False,
+            async_io: bool = True,
+    ):
+        self.fill_cache = fill_cache
+        self.readahead_size = readahead_size
+        self.auto_readahead_size = auto_readahead_size
+        self.adaptive_readahead = adaptive_readahead
+        self.pin_data = pin_data
+        self.async_io = async_io
+
+    def apply(self, read_options: ReadOptionsT = None) -> ReadOptionsT:
+        options = read_options.copy() if read_options is not None else ReadOptions()
+        assert isinstance(options, ReadOptions)
+        options.fill_cache = self.fill_cache
+        options.readahead_size = self.readahead_size
+        options.auto_readahead_size = self.auto_readahead_size
+        options.adaptive_readahead = self.adaptive_readahead
+        options.pin_data = self.pin_data
+        options.async_io = self.async_io
+        return options
+
+
+class WriteCoalescer:
+    """
+    group commit for concurrent put/merge/delete calls
+    writes issued within one loop tick (or max_delay seconds) are collected into one RBatch,
+    the batch is written once and every caller receives the shared status
+    """
+    def __init__(
+            self,
+            db: 'RocksDb',
+            write_options: WriteOptions = None,
+            max_batch_size: int = 1024,
+            max_delay: float = 0,
+    ):
+        write_options = write_options or WriteOptions()
+        assert isinstance(write_options, WriteOptions)
+        assert max_batch_size > 0
+        assert max_delay >= 0
+        self.db = db
+        self.write_options = write_options
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.write_count = 0
+        self.operation_count = 0
+        self._batch: Optional[RBatch] = None
+        self._futures: List[asyncio.Future] = list()
+        self._handle: Optional[asyncio.Handle] = None
+        self._writing: Set[asyncio.Future] = set()
+
+    def _pending_batch(self) -> RBatch:
+        if self._batch is None:
+            self._batch = RBatch()
+            loop = self.db.loop
+            if self.max_delay:
+                self._handle = loop.call_later(self.max_delay, self._flush)
+            else:
+                self._handle = loop.call_soon(self._flush)
+        return self._batch
+
+    def _submit(self) -> asyncio.Future:
+        future = self.db.loop.create_future()
+        self._futures.append(future)
+        self.operation_count += 1
+        if len(self._futures) >= self.max_batch_size:
+            self._flush()
+        return future
+
+    def put(self, key: bytes, value: bytes, column_family: RColumnFamily) -> Awaitable[StatusT]:
+        self._pending_batch().put(key, value, column_family)
+        return self._submit()
+
+    def merge(self, key: bytes, value: bytes, column_family: RColumnFamily) -> Awaitable[StatusT]:
+        self._pending_batch().merge(key, value, column_family)
+        return self._submit()
+
+    def delete(self, key: bytes, column_family: RColumnFamily) -> Awaitable[StatusT]:
+        self._pending_batch().delete_key(key, column_family)
+        return self._submit()
+
+    def _flush(self):
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        batch = self._batch
+        futures = self._futures
+        self._batch = None
+        self._futures = list()
+        if batch is None:
+            return
+        self.write_count += 1
+        write = self.db.aio_call(self.db.interface.write, self.write_options, batch)
+        self._writing.add(write)
+        write.add_done_callback(partial(self._resolve, futures))
+
+    def _resolve(self, futures: List[asyncio.Future], write: asyncio.Future):
+        self._writing.discard(write)
+        for future in futures:
+            if future.done():
+                continue
+            if write.cancelled():
+                future.cancel()
+            elif write.exception() is not None:
+                future.set_exception(write.exception())
+            else:
+                future.set_result(write.result())
+
+    async def flush(self):
+        self._flush()
+        if self._writing:
+            await asyncio.wait(list(self._writing))
+
+
 class RocksDb(AsyncCallMixin):
     DEFAULT_COLUMN_FAMILY = 'default'
 
-    def __init__(self):
-        super(RocksDb, self).__init__()
+    def __init__(self, executor: Union[Executor, ExecutorRegistry] = None):
+        super(RocksDb, self).__init__(executor)
         self._db: Optional[RDb] = None
         self._column_family_list = None
         self.enable_transaction = False
         self.enable_optimistic_transaction = False
         self.is_readonly = False
         self.codec_list = None
+        self.inline_get = False
+        self.get_path_counter = dict(inline=0, executor=0)
+        self.write_coalescer: Optional[WriteCoalescer] = None
 
     @property
     def column_family_list(self) -> List[RColumnFamily]:
@@ -315,6 +511,20 @@ class RocksDb(AsyncCallMixin):
     def default_column_family(self):
         return self.column_family_dict[self.DEFAULT_COLUMN_FAMILY]
 
+    @property
+    def interface(self) -> RDb:
+        return self._db
+
+    def enable_write_coalescing(
+            self,
+            write_options: WriteOptions = None,
+            max_batch_size: int = 1024,
+            max_delay: float = 0,
+    ) -> WriteCoalescer:
+        assert not self.is_readonly
+        self.write_coalescer = WriteCoalescer(self, write_options, max_batch_size, max_delay)
+        return self.write_coalescer
+
     @classmethod
     async def load_latest_options(cls, db_path: str, options: ConfigOptions = None) -> LatestOptionsStatusT:
         options = options or ConfigOptions()
@@ -329,7 +539,7 @@ class RocksDb(AsyncCallMixin):
     def _build(cls, rocks, path, options: OptionsT, column_family_list=None):
         column_family_list = column_family_list or list()
         if not any(cf for cf in column_family_list if cf.get_name() == cls.DEFAULT_COLUMN_FAMILY):
-            column_family_list.append(RColumnFamily(cls.DEFAULT_COLUMN_FAMILY))
+            column_family_list.append(RColumnFamily(cls.DEFAULT_COLUMN_FAMILY, ColumnFamilyOptions(options)))
         rocks._column_family_list = column_family_list
         rocks._db = RDb(path, options)
 
@@ -359,15 +569,23 @@ class RocksDb(AsyncCallMixin):
         return status
 
     @classmethod
-    async def open_db(cls, path, options: OptionsT = None, column_family_list=None) -> StatusT['RocksDb']:
+    async def open_db(
+            cls,
+            path,
+            options: OptionsT = None,
+            column_family_list=None,
+            executor: Union[Executor, ExecutorRegistry] = None,
+    ) -> StatusT['RocksDb']:
         options = options or Options()
         assert isinstance(options, Options)
-        rocks = RocksDb()
+        rocks = RocksDb(executor)
         rocks.enable_transaction = False
         rocks.enable_optimistic_transaction = False
         cls._build(rocks, path, options, column_family_list)
         column_family_list = rocks._column_family_list
         status = await rocks.aio_call(rocks._db.open_db, column_family_list)
+        if not status.ok():
+            await rocks.close()
         status.result = rocks
         return status
 
@@ -379,18 +597,21 @@ class RocksDb(AsyncCallMixin):
             column_family_list: List[RColumnFamily],
             read_only: bool = False,
             options: OptionsT = None,
+            executor: Union[Executor, ExecutorRegistry] = None,
     ) -> StatusT['RocksDb']:
         options = options or Options()
         assert isinstance(options, Options)
         assert isinstance(ttls, list)
         assert isinstance(column_family_list, list)
         assert len(ttls) == len(column_family_list)
-        rocks = RocksDb()
+        rocks = RocksDb(executor)
         rocks.enable_transaction = False
         rocks.enable_optimistic_transaction = False
         cls._build(rocks, path, options, column_family_list)
         column_family_list = rocks._column_family_list
         status = await rocks.aio_call(rocks._db.open_db_with_ttl, column_family_list, ttls, read_only)
+        if not status.ok():
+            await rocks.close()
         status.result = rocks
         return status
 
@@ -401,29 +622,40 @@ class RocksDb(AsyncCallMixin):
             options: OptionsT = None,
             column_family_list=None,
             error_if_log_file_exist: bool = False,
+            executor: Union[Executor, ExecutorRegistry] = None,
     ) -> StatusT['RocksDb']:
         options = options or Options()
         assert isinstance(options, Options)
-        rocks = RocksDb()
+        rocks = RocksDb(executor)
         rocks.enable_transaction = False
         rocks.enable_optimistic_transaction = False
         rocks.is_readonly = True
         cls._build(rocks, path, options, column_family_list)
         column_family_list = rocks._column_family_list
         status = await rocks.aio_call(rocks._db.open_db_for_readonly, column_family_list, error_if_log_file_exist)
+        if not status.ok():
+            await rocks.close()
         status.result = rocks
         return status
 
     @classmethod
-    async def open_transaction_db(cls, path, options: OptionsT = None, column_family_list=None) -> StatusT['RocksDb']:
+    async def open_transaction_db(
+            cls,
+            path,
+            options: OptionsT = None,
+            column_family_list=None,
+            executor: Union[Executor, ExecutorRegistry] = None,
+    ) -> StatusT['RocksDb']:
         options = options or Options()
         assert isinstance(options, Options)
-        rocks = RocksDb()
+        rocks = RocksDb(executor)
         rocks.enable_transaction = True
         rocks.enable_optimistic_transaction = False
         cls._build(rocks, path, options, column_family_list)
         column_family_list = rocks._column_family_list
         status = await rocks.aio_call(rocks._db.open_transaction_db, column_family_list)
+        if not status.ok():
+            await rocks.close()
         status.result = rocks
         return status
 
@@ -433,19 +665,34 @@ class RocksDb(AsyncCallMixin):
             path,
             options: OptionsT = None,
             column_family_list=None,
+            executor: Union[Executor, ExecutorRegistry] = None,
     ) -> StatusT['RocksDb']:
         options = options or Options()
         assert isinstance(options, Options)
-        rocks = RocksDb()
+        rocks = RocksDb(executor)
         rocks.enable_transaction = False
         rocks.enable_optimistic_transaction = True
         cls._build(rocks, path, options, column_family_list)
         column_family_list = rocks._column_family_list
         status = await rocks.aio_call(rocks._db.open_optimistic_transaction_db, column_family_list)
+        if not status.ok():
+            await rocks.close()
         status.result = rocks
         return status
 
     async def close(self):
+        """
+        raises StatusError (Busy) without closing while memoryviews of pinned slices from get_pinned are alive,
+        pinned slices without views are released and read as empty afterwards
+        """
+        if self._db is None:
+            return
+        status = await self.aio_call(self._db.release_pinned_slices)
+        if not status.ok():
+            raise StatusError(status)
+        if self.write_coalescer:
+            await self.write_coalescer.flush()
+            self.write_coalescer = None
         if self._column_family_list:
             for cf in self._column_family_list:
                 if not cf.is_loaded():
@@ -464,7 +711,7 @@ class RocksDb(AsyncCallMixin):
     ) -> StatusT:
         if column_family.is_loaded():
             raise ValueError('column_family has handle')
-        options = options or ColumnFamilyOptions()
+        options = options or column_family.get_column_family_descriptor().options
         assert isinstance(options, ColumnFamilyOptions)
         status = await self.aio_call(self._db.create_column_family, options, column_family, ttl)
         if status.ok():
@@ -498,18 +745,40 @@ class RocksDb(AsyncCallMixin):
 
     async def put(
             self,
-            key,
-            value,
+            key: bytes,
+            value: bytes,
             write_options: WriteOptions = None,
             column_family: RColumnFamilyT = None,
     ) -> StatusT:
-        assert isinstance(key, bytes)
-        assert isinstance(value, bytes)
+        assert is_buffer(key)
+        assert is_buffer(value)
+        column_family = column_family or self.default_column_family
+        assert isinstance(column_family, RColumnFamily)
+        if self.write_coalescer and write_options is None:
+            status = await self.write_coalescer.put(key, value, column_family)
+            return status
         write_options = write_options or WriteOptions()
         assert isinstance(write_options, WriteOptions)
+        status = await self.aio_call(self._db.put, write_options, column_family, key, value)
+        return status
+
+    async def merge(
+            self,
+            key: bytes,
+            value: bytes,
+            write_options: WriteOptions = None,
+            column_family: RColumnFamilyT = None,
+    ) -> StatusT:
+        assert is_buffer(key)
+        assert is_buffer(value)
         column_family = column_family or self.default_column_family
         assert isinstance(column_family, RColumnFamily)
-        status = await self.aio_call(self._db.put, write_options, column_family, key, value)
+        if self.write_coalescer and write_options is None:
+            status = await self.write_coalescer.merge(key, value, column_family)
+            return status
+        write_options = write_options or WriteOptions()
+        assert isinstance(write_options, WriteOptions)
+        status = await self.aio_call(self._db.merge, write_options, column_family, key, value)
         return status
 
     async def get(
@@ -518,16 +787,40 @@ class RocksDb(AsyncCallMixin):
             read_options: ReadOptionsT = None,
             column_family: RColumnFamilyT = None,
     ) -> StatusT[bytes]:
-        assert isinstance(key, bytes)
+        assert is_buffer(key)
         read_options = read_options or ReadOptions()
         assert isinstance(read_options, ReadOptions)
         column_family = column_family or self.default_column_family
         assert isinstance(column_family, RColumnFamily)
+        if self.inline_get:
+            complex_status: ComplexStatusT = self._db.get_cached(read_options, column_family, key)
+            if not complex_status.status.is_incomplete():
+                self.get_path_counter['inline'] += 1
+                status = complex_status.status
+                status.result = complex_status.value
+                return status
+        self.get_path_counter['executor'] += 1
         complex_status: ComplexStatusT = await self.aio_call(self._db.get, read_options, column_family, key)
         status = complex_status.status
         status.result = complex_status.value
         return status
 
+    async def get_pinned(
+            self,
+            key: bytes,
+            read_options: ReadOptionsT = None,
+            column_family: RColumnFamilyT = None,
+    ) -> StatusT[PinnableSliceT]:
+        assert is_buffer(key)
+        read_options = read_options or ReadOptions()
+        assert isinstance(read_options, ReadOptions)
+        column_family = column_family or self.default_column_family
+        assert isinstance(column_family, RColumnFamily)
+        value = RPinnableSlice()
+        status = await self.aio_call(self._db.get_pinned, read_options, column_family, key, value)
+        status.result = value if status.ok() else None
+        return status
+
     async def multi_get(
             self,
             pairs: List[Tuple[bytes, RColumnFamilyT]],
@@ -544,17 +837,40 @@ class RocksDb(AsyncCallMixin):
             status_list[idx].result = complex_status.value_list[idx]
         return status_list
 
+    async def multi_get_batch(
+            self,
+            keys: List[bytes],
+            read_options: ReadOptionsT = None,
+            column_family: RColumnFamilyT = None,
+            sorted_input: bool = False,
+    ) -> StatusT[List[Optional[bytes]]]:
+        read_options = read_options or ReadOptions()
+        assert isinstance(read_options, ReadOptions)
+        column_family = column_family or self.default_column_family
+        assert isinstance(column_family, RColumnFamily)
+        keys = list(keys)
+        complex_status: ComplexStatusT = await self.aio_call(
+            self._db.multi_get_batch, read_options, column_family, keys, sorted_input,
+        )
+        status = complex_status.status
+        status.result = complex_status.value
+        status.errors = complex_status.error_list
+        return status
+
     async def delete(
             self,
             key: bytes,
             write_options: WriteOptions = None,
             column_family: RColumnFamilyT = None,
     ) -> StatusT:
-        assert isinstance(key, bytes)
-        write_options = write_options or WriteOptions()
-        assert isinstance(write_options, WriteOptions)
+        assert is_buffer(key)
         column_family = column_family or self.default_column_family
         assert isinstance(column_family, RColumnFamily)
+        if self.write_coalescer and write_options is None:
+            status = await self.write_coalescer.delete(key, column_family)
+            return status
+        write_options = write_options or WriteOptions()
+        assert isinstance(write_options, WriteOptions)
         status = await self.aio_call(self._db.delete_key, write_options, column_family, key)
         return status
 
@@ -565,8 +881,8 @@ class RocksDb(AsyncCallMixin):
             write_options: WriteOptions = None,
             column_family: RColumnFamily = None,
     ) -> StatusT:
-        assert isinstance(from_key, bytes)
-        assert isinstance(to_key, bytes)
+        assert is_buffer(from_key)
+        assert is_buffer(to_key)
         write_options = write_options or WriteOptions()
         assert isinstance(write_options, WriteOptions)
         column_family = column_family or self.default_column_family
@@ -578,7 +894,10 @@ class RocksDb(AsyncCallMixin):
             self,
             read_options: ReadOptionsT = None,
             column_family: RColumnFamilyT = None,
+            scan_profile: ScanProfile = None,
     ) -> RocksDbIterator:
+        if scan_profile is not None:
+            read_options = scan_profile.apply(read_options)
         read_options = read_options or ReadOptions()
         assert isinstance(read_options, ReadOptions)
         column_family = column_family or self.default_column_family
@@ -608,6 +927,119 @@ class RocksDb(AsyncCallMixin):
         status = await self.aio_call(self._db.flush, flush_options, column_family_list)
         return status
 
+    async def compact_range(
+            self,
+            start: Optional[bytes] = None,
+            end: Optional[bytes] = None,
+            column_family: RColumnFamilyT = None,
+            options: CompactRangeOptions = None,
+            bottommost_level_compaction: BottommostLevelCompaction = None,
+            exclusive_manual_compaction: bool = None,
+    ) -> StatusT:
+        """
+        cancelling the awaiting task cancels the running manual compaction, then CancelledError is raised
+        """
+        column_family = column_family or self.default_column_family
+        assert isinstance(column_family, RColumnFamily)
+        options = options or CompactRangeOptions()
+        assert isinstance(options, CompactRangeOptions)
+        if bottommost_level_compaction is not None:
+            options.bottommost_level_compaction = bottommost_level_compaction
+        if exclusive_manual_compaction is not None:
+            options.exclusive_manual_compaction = exclusive_manual_compaction
+        start = bytes(start) if start is not None else None
+        end = bytes(end) if end is not None else None
+        token = RCancelToken()
+        future = self.aio_call(self._db.compact_range, options, column_family, start, end, token)
+        try:
+            status = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            token.cancel()
+            await asyncio.wait([future])
+            raise
+        return status
+
+    async def compact_files(
+            self,
+            files: List[str],
+            output_level: int,
+            column_family: RColumnFamilyT = None,
+            options: CompactionOptions = None,
+    ) -> StatusT:
+        column_family = column_family or self.default_column_family
+        assert isinstance(column_family, RColumnFamily)
+        options = options or CompactionOptions()
+        assert isinstance(options, CompactionOptions)
+        status = await self.aio_call(self._db.compact_files, options, column_family, files, output_level)
+        return status
+
+    async def set_options(self, new_options: Dict[str, str], column_family: RColumnFamilyT = None) -> StatusT:
+        column_family = column_family or self.default_column_family
+        assert isinstance(column_family, RColumnFamily)
+        new_options = {k: str(v).lower() if isinstance(v, bool) else str(v) for k, v in new_options.items()}
+        status = await self.aio_call(self._db.set_options, column_family, new_options)
+        return status
+
+    async def set_db_options(self, new_options: Dict[str, str]) -> StatusT:
+        new_options = {k: str(v).lower() if isinstance(v, bool) else str(v) for k, v in new_options.items()}
+        status = await self.aio_call(self._db.set_db_options, new_options)
+        return status
+
+    async def enable_auto_compaction(self, column_family_list: List[RColumnFamily] = None) -> StatusT:
+        column_family_list = column_family_list or [self.default_column_family]
+        status = await self.aio_call(self._db.enable_auto_compaction, column_family_list)
+        return status
+
+    async def disable_auto_compaction(self, column_family: RColumnFamilyT = None) -> StatusT:
+        status = await self.set_options({'disable_auto_compactions': True}, column_family)
+        return status
+
+    async def pause_background_work(self) -> StatusT:
+        """
+        waits for running background jobs, a cancelled pause resumes background work before CancelledError is raised
+        """
+        future = self.aio_call(self._db.pause_background_work)
+        try:
+            status = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            await asyncio.wait([future])
+            if not future.cancelled() and future.exception() is None and future.result().ok():
+                await asyncio.shield(self.aio_call(self._db.continue_background_work))
+            raise
+        return status
+
+    async def continue_background_work(self) -> StatusT:
+        status = await self.aio_call(self._db.continue_background_work)
+        return status
+
+    @property
+    def statistics(self) -> Optional[StatisticsT]:
+        return self._db.get_statistics()
+
+    async def get_property(self, name: str, column_family: RColumnFamilyT = None) -> StatusT[str]:
+        column_family = column_family or self.default_column_family
+        assert isinstance(column_family, RColumnFamily)
+        complex_status: ComplexStatusT = await self.aio_call(self._db.get_property, column_family, name)
+        status = complex_status.status
+        status.result = complex_status.value
+        return status
+
+    async def get_int_property(self, name: str, column_family: RColumnFamilyT = None) -> StatusT[int]:
+        column_family = column_family or self.default_column_family
+        assert isinstance(column_family, RColumnFamily)
+        complex_status: ComplexStatusT = await self.aio_call(self._db.get_int_property, column_family, name)
+        status = complex_status.status
+        status.result = complex_status.value
+        return status
+
+    async def get_map_property(self, name: str, column_family: RColumnFamilyT = None) -> StatusT[Dict[str, str]]:
+        column_family = column_family or self.default_column_family
+        assert isinstance(column_family, RColumnFamily)
+        complex_status: ComplexStatusT = await self.aio_call(self._db.get_map_property, column_family, name)
+        status = complex_status.status
+        status.result = complex_status.value
+        return status
+
     async def create_backup(self, backup: RocksDbDbBackup) -> StatusT:
         assert isinstance(backup, RocksDbDbBackup) and backup.backup
         status = await self.aio_call(self._db.create_backup, backup.backup)
@@ -674,10 +1106,34 @@ __all__ = [
     'FlushOptions',
     'SstFileWriter',
     'IngestExternalFileOptions',
+    'ExternalSstFileInfo',
     'SstFileReader',
     'RocksDbBackupReadonly',
     'RocksDbDbBackup',
     'BackupableDBOptions',
     'RocksDbTransaction',
     'ColumnFamilyOptions',
+    'CompressionType',
+    'CompactionStyle',
+    'CompactRangeOptions',
+    'CompactionOptions',
+    'BottommostLevelCompaction',
+    'ReadTier',
+    'StatsLevel',
+    'Statistics',
+    'Cache',
+    'BlockBasedTableOptions',
+    'new_lru_cache',
+    'new_hyper_clock_cache',
+    'RateLimiter',
+    'new_generic_rate_limiter',
+    'WriteBufferManager',
+    'EnvPriority',
+    'set_background_threads',
+    'get_background_threads',
+    'ExecutorRegistry',
+    'Instrument',
+    'RPinnableSlice',
+    'WriteCoalescer',
+    'ScanProfile',
 ]
@@ -9,7 +9,7 @@ __version__ = '0.0.3'
 name = 'aiorocksdb'
 
 
-subprocess.call([sys.executable, '-m', 'pip', 'install', 'pybind11>=2.4'])
+subprocess.call([sys.executable, '-m', 'pip', 'install', 'pybind11>=2.8'])
 
 
 class get_pybind_include(object):
@@ -140,8 +140,8 @@ setup(
     url='https://github.com/xdusongwei/aiorocksdb',
     description='',
     long_description='',
-    install_requires=['pybind11>=2.4', 'typing', 'msgpack', ],
-    setup_requires=['pybind11>=2.4'],
+    install_requires=['pybind11>=2.8', 'typing', 'msgpack', ],
+    setup_requires=['pybind11>=2.8'],
     ext_modules=ext_modules,
     cmdclass={'build_ext': BuildExt},
     zip_safe=False,
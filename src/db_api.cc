@@ -20,6 +20,7 @@ namespace py = pybind11;
 
 #define RDB DB
 #include "rocks_db.h"
+#include "rocks_merge_operator.h"
 
 
 namespace pybind11 { namespace detail {
@@ -28,30 +29,32 @@ template <> struct type_caster<Slice> {
         PYBIND11_TYPE_CASTER(Slice, _("Slice"));
 
         bool load(handle src, bool) {
-            PyObject *source = src.ptr();
-            PyObject *tmp = PyObject_Bytes(source);
-            if (!tmp){
+            if (!buffer.load(src.ptr())){
                 return false;
             }
-            else{
-                value = PyBytes_AsString(tmp);
-            }
-            return !PyErr_Occurred();
+            value = buffer.getSlice();
+            return true;
         }
 
-        static handle cast(Slice src, return_value_policy, handle) {
-            return PyBytes_FromString(src.ToString().c_str());
+        static handle cast(const Slice& src, return_value_policy, handle) {
+            return PyBytes_FromStringAndSize(src.data(), src.size());
         }
+
+    private:
+        RBuffer buffer;
     };
 }}
 
 
 PYBIND11_MODULE(db_api, m) {
+    registerMergeOperators();
+
     py::class_<ComplexStatus>(m, "ComplexStatus")
     .def(py::init())
     .def_readonly("status", &ComplexStatus::status)
     .def_readonly("status_list", &ComplexStatus::statusList)
     .def_readonly("value_list", &ComplexStatus::valueList)
+    .def_readonly("error_list", &ComplexStatus::errorList)
     .def_readonly("value", &ComplexStatus::value)
     ;
 
@@ -65,6 +68,7 @@ PYBIND11_MODULE(db_api, m) {
     py::class_<RTransaction>(m, "RTransaction")
     .def(py::init())
     .def("put", &RTransaction::put)
+    .def("merge", &RTransaction::merge)
     .def("delete_key", &RTransaction::deleteKey)
     .def("commit", &RTransaction::commit)
     .def("set_save_point", &RTransaction::setSavePoint)
@@ -87,12 +91,25 @@ PYBIND11_MODULE(db_api, m) {
     .def("valid", &RIterator::valid)
     .def("prev", &RIterator::prev)
     .def("next", &RIterator::next)
+    .def("next_batch", &RIterator::nextBatch, py::arg("n"), py::arg("reverse") = false)
     .def("key", &RIterator::key)
     .def("value", &RIterator::value)
     .def("status", &RIterator::status)
     .def("close", &RIterator::close)
     ;
 
+    py::class_<RPinnableSlice>(m, "RPinnableSlice", py::custom_type_setup([](PyHeapTypeObject *heap_type){
+        heap_type->as_buffer.bf_getbuffer = RPinnableSlice::getBuffer;
+        heap_type->as_buffer.bf_releasebuffer = RPinnableSlice::releaseBuffer;
+        heap_type->ht_type.tp_as_buffer = &heap_type->as_buffer;
+    }))
+    .def(py::init())
+    .def("__len__", &RPinnableSlice::size)
+    .def("is_pinned", &RPinnableSlice::isPinned)
+    .def("to_bytes", &RPinnableSlice::toBytes)
+    .def("release", &RPinnableSlice::release)
+    ;
+
     py::class_<RSnapshot>(m, "RSnapshot")
     .def(py::init())
     .def("set_read_options", &RSnapshot::setReadOptions)
@@ -105,6 +122,8 @@ PYBIND11_MODULE(db_api, m) {
     .def("get_name", &RColumnFamily::getName)
     .def("is_loaded", &RColumnFamily::isLoaded)
     .def("get_column_family_descriptor", &RColumnFamily::getColumnFamilyDescriptor)
+    .def("has_prefix_extractor", &RColumnFamily::hasPrefixExtractor)
+    .def("prefix_seek_compatible", &RColumnFamily::prefixSeekCompatible)
     .def("__repr__",
         [](RColumnFamily &a) {
             return "<RColumnFamily name:" + a.getName() + " handle:" + (a.getHandle() ? "loaded": "empty") + ">";
@@ -112,10 +131,18 @@ PYBIND11_MODULE(db_api, m) {
     )
     ;
 
+    py::class_<RCancelToken>(m, "RCancelToken")
+    .def(py::init())
+    .def("cancel", &RCancelToken::cancel)
+    .def("is_canceled", &RCancelToken::isCanceled)
+    ;
+
     py::class_<RBatch>(m, "RBatch")
     .def(py::init())
     .def("put", &RBatch::put)
+    .def("merge", &RBatch::merge)
     .def("delete_key", &RBatch::deleteKey)
+    .def("delete_range", &RBatch::deleteRange)
     ;
 
     py::class_<RBackup>(m, "RBackup")
@@ -141,7 +168,9 @@ PYBIND11_MODULE(db_api, m) {
     py::class_<RSstFileWriter>(m, "RSstFileWriter")
     .def(py::init<const EnvOptions &, const Options &>())
     .def("put", &RSstFileWriter::put)
+    .def("put_many", &RSstFileWriter::putMany)
     .def("delete", &RSstFileWriter::deleteKey)
+    .def("delete_many", &RSstFileWriter::deleteMany)
     .def("delete_range", &RSstFileWriter::deleteRange)
     .def("open", &RSstFileWriter::open)
     .def("finish", &RSstFileWriter::finish)
@@ -151,7 +180,7 @@ PYBIND11_MODULE(db_api, m) {
     .def(py::init<const Options &>())
     .def("open", &RSstFileReader::open_sst)
     .def("verify_checksum", &RSstFileReader::verifyChecksum)
-    .def("create_iterator", &RSstFileReader::createIterator)
+    .def("create_iterator", &RSstFileReader::createIterator, py::keep_alive<2, 3>())
     ;
 
     py::class_<RDb>(m, "RDb")
@@ -166,19 +195,35 @@ PYBIND11_MODULE(db_api, m) {
     .def("create_column_family", &RDb::createColumnFamily)
     .def("create_snapshot", &RDb::createSnapshot)
     .def("release_snapshot", &RDb::releaseSnapshot)
-    .def("create_iterator", &RDb::createIterator)
+    .def("create_iterator", &RDb::createIterator, py::keep_alive<2, 3>())
     .def("get", &RDb::get)
+    .def("get_cached", &RDb::getCached)
+    .def("get_pinned", &RDb::getPinned, py::keep_alive<5, 1>())
     .def("put", &RDb::put)
+    .def("merge", &RDb::merge)
     .def("delete_key", &RDb::deleteKey)
     .def("delete_range", &RDb::deleteRange)
     .def("multi_get", &RDb::multiGet)
+    .def("multi_get_batch", &RDb::multiGetBatch, py::arg("options"), py::arg("column_family"), py::arg("keys"), py::arg("sorted_input") = false)
     .def("ingest_external_file", &RDb::ingestExternalFile)
     .def("flush", &RDb::flush)
+    .def("compact_range", &RDb::compactRange)
+    .def("compact_files", &RDb::compactFiles)
+    .def("set_options", &RDb::setOptions)
+    .def("set_db_options", &RDb::setDBOptions)
+    .def("enable_auto_compaction", &RDb::enableAutoCompaction)
+    .def("pause_background_work", &RDb::pauseBackgroundWork)
+    .def("continue_background_work", &RDb::continueBackgroundWork)
+    .def("get_property", &RDb::getProperty)
+    .def("get_int_property", &RDb::getIntProperty)
+    .def("get_map_property", &RDb::getMapProperty)
+    .def("get_statistics", &RDb::getStatistics)
     .def("write", &RDb::write)
     .def("begin_transaction", &RDb::beginTransaction)
     .def("begin_optimistic_transaction", &RDb::beginOptimisticTransaction)
     .def("release_transaction", &RDb::releaseTransaction)
     .def("create_backup", &RDb::createBackup)
+    .def("release_pinned_slices", &RDb::releasePinnedSlices)
     .def("close", &RDb::close)
     .def("set_ttl", py::overload_cast<int32_t>(&RDb::setTTL))
     .def("set_ttl", py::overload_cast<RColumnFamily&, int32_t>(&RDb::setTTL))
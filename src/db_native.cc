@@ -8,6 +8,15 @@
 #include <rocksdb/utilities/transaction_db.h>
 #include <rocksdb/utilities/backup_engine.h>
 #include <rocksdb/utilities/options_util.h>
+#include <rocksdb/statistics.h>
+#include <rocksdb/cache.h>
+#include <rocksdb/table.h>
+#include <rocksdb/filter_policy.h>
+#include <rocksdb/slice_transform.h>
+#include <rocksdb/sst_file_writer.h>
+#include <rocksdb/rate_limiter.h>
+#include <rocksdb/write_buffer_manager.h>
+#include <rocksdb/env.h>
 using namespace ROCKSDB_NAMESPACE;
 
 #define PY_SSIZE_T_CLEAN
@@ -19,6 +28,11 @@ using namespace ROCKSDB_NAMESPACE;
 
 namespace py = pybind11;
 
+#include "rocks_slice_transform.h"
+#include "rocks_merge_operator.h"
+#include "rocks_event_listener.h"
+#include "rocks_buffer.h"
+
 
 struct BackupableDBOptionsWrapper: BackupEngineOptions{
     public:
@@ -26,12 +40,410 @@ struct BackupableDBOptionsWrapper: BackupEngineOptions{
 };
 
 
+struct ReadOptionsBound{
+    public:
+        explicit ReadOptionsBound(const std::string& _key): key(_key), slice(key){}
+        ReadOptionsBound(const ReadOptionsBound&) = delete;
+        ReadOptionsBound& operator=(const ReadOptionsBound&) = delete;
+
+        std::string key;
+        Slice slice;
+};
+
+
+py::object getReadOptionsBound(const Slice* bound){
+    if(bound == nullptr){
+        return py::none();
+    }
+    return py::bytes(bound->data(), bound->size());
+}
+
+
+const Slice* setReadOptionsBound(py::object self, const char* holder_name, py::object value){
+    if(value.is_none()){
+        self.attr(holder_name) = py::none();
+        return nullptr;
+    }
+    RBuffer buffer;
+    if(!buffer.load(value.ptr())){
+        throw py::type_error("read option bounds must be bytes-like or None");
+    }
+    ReadOptionsBound* bound = new ReadOptionsBound(buffer.getSlice().ToString());
+    self.attr(holder_name) = py::cast(bound, py::return_value_policy::take_ownership);
+    return &bound->slice;
+}
+
+
+Tickers getTicker(const std::string& name){
+    for(const auto& i : TickersNameMap) {
+        if(i.second == name){
+            return i.first;
+        }
+    }
+    throw py::key_error(name);
+}
+
+
+Histograms getHistogram(const std::string& name){
+    for(const auto& i : HistogramsNameMap) {
+        if(i.second == name){
+            return i.first;
+        }
+    }
+    throw py::key_error(name);
+}
+
+
+py::dict histogramDataToDict(const HistogramData& data){
+    py::dict result;
+    result["median"] = data.median;
+    result["percentile95"] = data.percentile95;
+    result["percentile99"] = data.percentile99;
+    result["average"] = data.average;
+    result["standard_deviation"] = data.standard_deviation;
+    result["max"] = data.max;
+    result["count"] = data.count;
+    result["sum"] = data.sum;
+    return result;
+}
+
+
+template <class T>
+void bindColumnFamilyOptions(py::class_<T>& cls){
+    cls
+    .def_readwrite("write_buffer_size", &T::write_buffer_size)
+    .def_readwrite("max_write_buffer_number", &T::max_write_buffer_number)
+    .def_readwrite("min_write_buffer_number_to_merge", &T::min_write_buffer_number_to_merge)
+    .def_readwrite("target_file_size_base", &T::target_file_size_base)
+    .def_readwrite("target_file_size_multiplier", &T::target_file_size_multiplier)
+    .def_readwrite("max_bytes_for_level_base", &T::max_bytes_for_level_base)
+    .def_readwrite("max_bytes_for_level_multiplier", &T::max_bytes_for_level_multiplier)
+    .def_readwrite("level_compaction_dynamic_level_bytes", &T::level_compaction_dynamic_level_bytes)
+    .def_readwrite("level0_file_num_compaction_trigger", &T::level0_file_num_compaction_trigger)
+    .def_readwrite("level0_slowdown_writes_trigger", &T::level0_slowdown_writes_trigger)
+    .def_readwrite("level0_stop_writes_trigger", &T::level0_stop_writes_trigger)
+    .def_readwrite("num_levels", &T::num_levels)
+    .def_readwrite("compression", &T::compression)
+    .def_readwrite("bottommost_compression", &T::bottommost_compression)
+    .def_readwrite("compaction_style", &T::compaction_style)
+    .def_readwrite("disable_auto_compactions", &T::disable_auto_compactions)
+    .def_readwrite("optimize_filters_for_hits", &T::optimize_filters_for_hits)
+    .def_readwrite("memtable_prefix_bloom_size_ratio", &T::memtable_prefix_bloom_size_ratio)
+    .def_readwrite("memtable_whole_key_filtering", &T::memtable_whole_key_filtering)
+    .def_property_readonly("prefix_extractor_name",
+        [](T &a) -> py::object {
+            if(!a.prefix_extractor){
+                return py::none();
+            }
+            return py::str(a.prefix_extractor->Name());
+        }
+    )
+    .def("set_fixed_prefix_extractor",
+        [](T &a, size_t prefix_len) {
+            a.prefix_extractor.reset(NewFixedPrefixTransform(prefix_len));
+        }
+    )
+    .def("set_capped_prefix_extractor",
+        [](T &a, size_t cap_len) {
+            a.prefix_extractor.reset(NewCappedPrefixTransform(cap_len));
+        }
+    )
+    .def("set_delimiter_prefix_extractor",
+        [](T &a, const std::string &delimiter, size_t occurrences) {
+            a.prefix_extractor.reset(new DelimiterPrefixTransform(delimiter, occurrences));
+        },
+        py::arg("delimiter") = ":",
+        py::arg("occurrences") = 1
+    )
+    .def("clear_prefix_extractor",
+        [](T &a) {
+            a.prefix_extractor.reset();
+        }
+    )
+    .def_property_readonly("merge_operator_name",
+        [](T &a) -> py::object {
+            if(!a.merge_operator){
+                return py::none();
+            }
+            return py::str(a.merge_operator->Name());
+        }
+    )
+    .def("set_uint64_add_merge_operator",
+        [](T &a) {
+            a.merge_operator = std::make_shared<UInt64AddOperator>();
+        }
+    )
+    .def("set_string_append_merge_operator",
+        [](T &a, const std::string &delimiter) {
+            a.merge_operator = std::make_shared<StringAppendOperator>(delimiter);
+        },
+        py::arg("delimiter") = ","
+    )
+    .def("set_max_merge_operator",
+        [](T &a) {
+            a.merge_operator = std::make_shared<BytewiseExtremumOperator>(true);
+        }
+    )
+    .def("set_min_merge_operator",
+        [](T &a) {
+            a.merge_operator = std::make_shared<BytewiseExtremumOperator>(false);
+        }
+    )
+    .def("clear_merge_operator",
+        [](T &a) {
+            a.merge_operator.reset();
+        }
+    )
+    ;
+}
+
+
+template <class T>
+void setBlockBasedTableFactory(T& options, const BlockBasedTableOptions& table_options){
+    options.table_factory.reset(NewBlockBasedTableFactory(table_options));
+}
+
+
 PYBIND11_MODULE(db_native, m) {
+    registerMergeOperators();
+
     py::class_<DbPath>(m, "DbPath")
     .def(py::init<const std::string &, uint64_t>());
 
-    py::class_<Options>(m, "Options")
+    py::enum_<StatsLevel>(m, "StatsLevel")
+    .value("kDisableAll", StatsLevel::kDisableAll)
+    .value("kExceptTickers", StatsLevel::kExceptTickers)
+    .value("kExceptHistogramOrTimers", StatsLevel::kExceptHistogramOrTimers)
+    .value("kExceptTimers", StatsLevel::kExceptTimers)
+    .value("kExceptDetailedTimers", StatsLevel::kExceptDetailedTimers)
+    .value("kExceptTimeForMutex", StatsLevel::kExceptTimeForMutex)
+    .value("kAll", StatsLevel::kAll)
+    ;
+
+    py::class_<Statistics, std::shared_ptr<Statistics>>(m, "Statistics")
+    .def_property("stats_level",
+        [](Statistics &a) {
+            return a.get_stats_level();
+        },
+        [](Statistics &a, StatsLevel level) {
+            a.set_stats_level(level);
+        }
+    )
+    .def("get_ticker_count",
+        [](Statistics &a, const std::string& name) {
+            return a.getTickerCount(getTicker(name));
+        }
+    )
+    .def("get_and_reset_ticker_count",
+        [](Statistics &a, const std::string& name) {
+            return a.getAndResetTickerCount(getTicker(name));
+        }
+    )
+    .def("get_histogram_data",
+        [](Statistics &a, const std::string& name) {
+            HistogramData data;
+            a.histogramData(getHistogram(name), &data);
+            return histogramDataToDict(data);
+        }
+    )
+    .def("tickers",
+        [](Statistics &a) {
+            py::dict result;
+            for(const auto& i : TickersNameMap) {
+                result[py::str(i.second)] = a.getTickerCount(i.first);
+            }
+            return result;
+        }
+    )
+    .def("histograms",
+        [](Statistics &a) {
+            py::dict result;
+            for(const auto& i : HistogramsNameMap) {
+                HistogramData data;
+                a.histogramData(i.first, &data);
+                result[py::str(i.second)] = histogramDataToDict(data);
+            }
+            return result;
+        }
+    )
+    .def("reset", &Statistics::Reset)
+    .def("ToString", &Statistics::ToString)
+    ;
+
+    m.def("create_db_statistics", &CreateDBStatistics);
+
+    py::class_<Cache, std::shared_ptr<Cache>>(m, "Cache")
+    .def("name", &Cache::Name)
+    .def("get_capacity", &Cache::GetCapacity)
+    .def("set_capacity", &Cache::SetCapacity)
+    .def("get_usage", py::overload_cast<>(&Cache::GetUsage, py::const_))
+    .def("get_pinned_usage", &Cache::GetPinnedUsage)
+    .def("has_strict_capacity_limit", &Cache::HasStrictCapacityLimit)
+    .def("set_strict_capacity_limit", &Cache::SetStrictCapacityLimit)
+    ;
+
+    m.def("new_lru_cache",
+        [](size_t capacity, int num_shard_bits, bool strict_capacity_limit, double high_pri_pool_ratio) {
+            return NewLRUCache(capacity, num_shard_bits, strict_capacity_limit, high_pri_pool_ratio);
+        },
+        py::arg("capacity"),
+        py::arg("num_shard_bits") = -1,
+        py::arg("strict_capacity_limit") = false,
+        py::arg("high_pri_pool_ratio") = 0.5
+    );
+
+    m.def("new_hyper_clock_cache",
+        [](size_t capacity, size_t estimated_entry_charge, int num_shard_bits, bool strict_capacity_limit) {
+            HyperClockCacheOptions cache_options(capacity, estimated_entry_charge, num_shard_bits, strict_capacity_limit);
+            return cache_options.MakeSharedCache();
+        },
+        py::arg("capacity"),
+        py::arg("estimated_entry_charge") = 0,
+        py::arg("num_shard_bits") = -1,
+        py::arg("strict_capacity_limit") = false
+    );
+
+    py::class_<RateLimiter, std::shared_ptr<RateLimiter>>(m, "RateLimiter")
+    .def("get_bytes_per_second", &RateLimiter::GetBytesPerSecond)
+    .def("set_bytes_per_second", &RateLimiter::SetBytesPerSecond)
+    .def("get_total_bytes_through",
+        [](RateLimiter &a) {
+            return a.GetTotalBytesThrough();
+        }
+    )
+    .def("get_total_requests",
+        [](RateLimiter &a) {
+            return a.GetTotalRequests();
+        }
+    )
+    ;
+
+    m.def("new_generic_rate_limiter",
+        [](int64_t rate_bytes_per_sec, int64_t refill_period_us, int32_t fairness, bool auto_tuned) {
+            return std::shared_ptr<RateLimiter>(NewGenericRateLimiter(
+                rate_bytes_per_sec, refill_period_us, fairness, RateLimiter::Mode::kWritesOnly, auto_tuned
+            ));
+        },
+        py::arg("rate_bytes_per_sec"),
+        py::arg("refill_period_us") = 100 * 1000,
+        py::arg("fairness") = 10,
+        py::arg("auto_tuned") = false
+    );
+
+    py::class_<WriteBufferManager, std::shared_ptr<WriteBufferManager>>(m, "WriteBufferManager")
+    .def(py::init<size_t, std::shared_ptr<Cache>, bool>(),
+        py::arg("buffer_size"),
+        py::arg("cache") = std::shared_ptr<Cache>(),
+        py::arg("allow_stall") = false
+    )
+    .def("enabled", &WriteBufferManager::enabled)
+    .def("cost_to_cache", &WriteBufferManager::cost_to_cache)
+    .def("memory_usage", &WriteBufferManager::memory_usage)
+    .def("mutable_memtable_memory_usage", &WriteBufferManager::mutable_memtable_memory_usage)
+    .def("buffer_size", &WriteBufferManager::buffer_size)
+    .def("set_buffer_size", &WriteBufferManager::SetBufferSize)
+    ;
+
+    py::enum_<Env::Priority>(m, "EnvPriority")
+    .value("BOTTOM", Env::Priority::BOTTOM)
+    .value("LOW", Env::Priority::LOW)
+    .value("HIGH", Env::Priority::HIGH)
+    ;
+
+    m.def("set_background_threads",
+        [](int number, Env::Priority priority) {
+            Env::Default()->SetBackgroundThreads(number, priority);
+        },
+        "Size the process wide default Env thread pool shared by every DB.",
+        py::arg("number"),
+        py::arg("priority") = Env::Priority::LOW
+    );
+
+    m.def("get_background_threads",
+        [](Env::Priority priority) {
+            return Env::Default()->GetBackgroundThreads(priority);
+        },
+        py::arg("priority") = Env::Priority::LOW
+    );
+
+    py::class_<BlockBasedTableOptions>(m, "BlockBasedTableOptions")
     .def(py::init())
+    .def_readwrite("block_cache", &BlockBasedTableOptions::block_cache)
+    .def_readwrite("no_block_cache", &BlockBasedTableOptions::no_block_cache)
+    .def_readwrite("block_size", &BlockBasedTableOptions::block_size)
+    .def_readwrite("block_restart_interval", &BlockBasedTableOptions::block_restart_interval)
+    .def_readwrite("cache_index_and_filter_blocks", &BlockBasedTableOptions::cache_index_and_filter_blocks)
+    .def_readwrite("cache_index_and_filter_blocks_with_high_priority", &BlockBasedTableOptions::cache_index_and_filter_blocks_with_high_priority)
+    .def_readwrite("pin_l0_filter_and_index_blocks_in_cache", &BlockBasedTableOptions::pin_l0_filter_and_index_blocks_in_cache)
+    .def_readwrite("pin_top_level_index_and_filter", &BlockBasedTableOptions::pin_top_level_index_and_filter)
+    .def_readwrite("partition_filters", &BlockBasedTableOptions::partition_filters)
+    .def_readwrite("whole_key_filtering", &BlockBasedTableOptions::whole_key_filtering)
+    .def_readwrite("optimize_filters_for_memory", &BlockBasedTableOptions::optimize_filters_for_memory)
+    .def_readwrite("format_version", &BlockBasedTableOptions::format_version)
+    .def("set_bloom_filter",
+        [](BlockBasedTableOptions &a, double bits_per_key) {
+            a.filter_policy.reset(NewBloomFilterPolicy(bits_per_key));
+        },
+        py::arg("bits_per_key") = 10.0
+    )
+    ;
+
+    py::enum_<CompressionType>(m, "CompressionType")
+    .value("kNoCompression", CompressionType::kNoCompression)
+    .value("kSnappyCompression", CompressionType::kSnappyCompression)
+    .value("kZlibCompression", CompressionType::kZlibCompression)
+    .value("kBZip2Compression", CompressionType::kBZip2Compression)
+    .value("kLZ4Compression", CompressionType::kLZ4Compression)
+    .value("kLZ4HCCompression", CompressionType::kLZ4HCCompression)
+    .value("kZSTD", CompressionType::kZSTD)
+    .value("kDisableCompressionOption", CompressionType::kDisableCompressionOption)
+    ;
+
+    py::enum_<CompactionStyle>(m, "CompactionStyle")
+    .value("kCompactionStyleLevel", CompactionStyle::kCompactionStyleLevel)
+    .value("kCompactionStyleUniversal", CompactionStyle::kCompactionStyleUniversal)
+    .value("kCompactionStyleFIFO", CompactionStyle::kCompactionStyleFIFO)
+    .value("kCompactionStyleNone", CompactionStyle::kCompactionStyleNone)
+    ;
+
+    py::class_<EventListener, std::shared_ptr<EventListener>>(m, "EventListenerBase")
+    ;
+
+    py::class_<REventListener, EventListener, std::shared_ptr<REventListener>>(m, "REventListener")
+    .def(py::init())
+    .def("fileno", &REventListener::fileno)
+    .def("drain", &REventListener::drain)
+    ;
+
+    py::class_<Options> options_class(m, "Options");
+    bindColumnFamilyOptions(options_class);
+    options_class
+    .def(py::init())
+    .def("set_block_based_table_factory", &setBlockBasedTableFactory<Options>)
+    .def_readwrite("row_cache", &Options::row_cache)
+    .def("add_event_listener",
+        [](Options &a, std::shared_ptr<EventListener> listener) {
+            a.listeners.push_back(listener);
+        }
+    )
+    .def_readwrite("rate_limiter", &Options::rate_limiter)
+    .def_readwrite("write_buffer_manager", &Options::write_buffer_manager)
+    .def_readwrite("db_write_buffer_size", &Options::db_write_buffer_size)
+    .def_readwrite("bytes_per_sync", &Options::bytes_per_sync)
+    .def_readwrite("wal_bytes_per_sync", &Options::wal_bytes_per_sync)
+    .def("enable_statistics",
+        [](Options &a, StatsLevel level) {
+            if(!a.statistics){
+                a.statistics = CreateDBStatistics();
+            }
+            a.statistics->set_stats_level(level);
+            return a.statistics;
+        },
+        py::arg("level") = StatsLevel::kExceptDetailedTimers
+    )
+    .def_readwrite("statistics", &Options::statistics)
+    .def_readwrite("stats_dump_period_sec", &Options::stats_dump_period_sec)
+    .def_readwrite("stats_persist_period_sec", &Options::stats_persist_period_sec)
     .def("IncreaseParallelism",
         [](Options &a, int total_threads) {
             a.IncreaseParallelism(total_threads);
@@ -77,6 +489,8 @@ PYBIND11_MODULE(db_native, m) {
         }
     )
     .def("ok", &Status::ok)
+    .def("is_not_found", &Status::IsNotFound)
+    .def("is_incomplete", &Status::IsIncomplete)
     .def("ToString", &Status::ToString)
     .def("__repr__",
         [](Status &a) {
@@ -85,14 +499,62 @@ PYBIND11_MODULE(db_native, m) {
     )
     ;
 
-    py::class_<ReadOptions>(m, "ReadOptions")
+    py::enum_<ReadTier>(m, "ReadTier")
+    .value("kReadAllTier", ReadTier::kReadAllTier)
+    .value("kBlockCacheTier", ReadTier::kBlockCacheTier)
+    .value("kPersistedTier", ReadTier::kPersistedTier)
+    .value("kMemtableTier", ReadTier::kMemtableTier)
+    ;
+
+    py::class_<ReadOptionsBound>(m, "ReadOptionsBound")
+    ;
+
+    py::class_<ReadOptions>(m, "ReadOptions", py::dynamic_attr())
     .def_readwrite("tailing", &ReadOptions::tailing)
+    .def_readwrite("prefix_same_as_start", &ReadOptions::prefix_same_as_start)
+    .def_readwrite("read_tier", &ReadOptions::read_tier)
+    .def_readwrite("total_order_seek", &ReadOptions::total_order_seek)
+    .def_readwrite("fill_cache", &ReadOptions::fill_cache)
+    .def_readwrite("verify_checksums", &ReadOptions::verify_checksums)
+    .def_readwrite("readahead_size", &ReadOptions::readahead_size)
+    .def_readwrite("auto_readahead_size", &ReadOptions::auto_readahead_size)
+    .def_readwrite("adaptive_readahead", &ReadOptions::adaptive_readahead)
+    .def_readwrite("pin_data", &ReadOptions::pin_data)
+    .def_readwrite("async_io", &ReadOptions::async_io)
+    .def_readwrite("auto_prefix_mode", &ReadOptions::auto_prefix_mode)
+    .def_property("iterate_lower_bound",
+        [](ReadOptions &a) {
+            return getReadOptionsBound(a.iterate_lower_bound);
+        },
+        [](py::object self, py::object value) {
+            const Slice* bound = setReadOptionsBound(self, "_iterate_lower_bound", value);
+            self.cast<ReadOptions&>().iterate_lower_bound = bound;
+        }
+    )
+    .def_property("iterate_upper_bound",
+        [](ReadOptions &a) {
+            return getReadOptionsBound(a.iterate_upper_bound);
+        },
+        [](py::object self, py::object value) {
+            const Slice* bound = setReadOptionsBound(self, "_iterate_upper_bound", value);
+            self.cast<ReadOptions&>().iterate_upper_bound = bound;
+        }
+    )
+    .def("copy",
+        [](py::object self) {
+            py::object result = py::cast(new ReadOptions(self.cast<const ReadOptions&>()), py::return_value_policy::take_ownership);
+            result.attr("iterate_lower_bound") = self.attr("iterate_lower_bound");
+            result.attr("iterate_upper_bound") = self.attr("iterate_upper_bound");
+            return result;
+        }
+    )
     .def(py::init())
     ;
 
     py::class_<WriteOptions>(m, "WriteOptions")
     .def_readwrite("low_pri", &WriteOptions::low_pri)
-    .def_readwrite("disableWAL ", &WriteOptions::disableWAL)
+    .def_readwrite("disableWAL", &WriteOptions::disableWAL)
+    .def_readwrite("sync", &WriteOptions::sync)
     .def(py::init())
     ;
 
@@ -104,11 +566,67 @@ PYBIND11_MODULE(db_native, m) {
     .def(py::init())
     ;
 
+    py::enum_<BottommostLevelCompaction>(m, "BottommostLevelCompaction")
+    .value("kSkip", BottommostLevelCompaction::kSkip)
+    .value("kIfHaveCompactionFilter", BottommostLevelCompaction::kIfHaveCompactionFilter)
+    .value("kForce", BottommostLevelCompaction::kForce)
+    .value("kForceOptimized", BottommostLevelCompaction::kForceOptimized)
+    ;
+
+    py::class_<CompactRangeOptions>(m, "CompactRangeOptions")
+    .def(py::init())
+    .def_readwrite("exclusive_manual_compaction", &CompactRangeOptions::exclusive_manual_compaction)
+    .def_readwrite("bottommost_level_compaction", &CompactRangeOptions::bottommost_level_compaction)
+    .def_readwrite("change_level", &CompactRangeOptions::change_level)
+    .def_readwrite("target_level", &CompactRangeOptions::target_level)
+    .def_readwrite("allow_write_stall", &CompactRangeOptions::allow_write_stall)
+    .def_readwrite("max_subcompactions", &CompactRangeOptions::max_subcompactions)
+    ;
+
+    py::class_<CompactionOptions>(m, "CompactionOptions")
+    .def(py::init())
+    .def_readwrite("compression", &CompactionOptions::compression)
+    .def_readwrite("output_file_size_limit", &CompactionOptions::output_file_size_limit)
+    .def_readwrite("max_subcompactions", &CompactionOptions::max_subcompactions)
+    ;
+
     py::class_<IngestExternalFileOptions>(m, "IngestExternalFileOptions")
     .def_readwrite("write_global_seqno", &IngestExternalFileOptions::write_global_seqno)
+    .def_readwrite("move_files", &IngestExternalFileOptions::move_files)
+    .def_readwrite("snapshot_consistency", &IngestExternalFileOptions::snapshot_consistency)
+    .def_readwrite("allow_global_seqno", &IngestExternalFileOptions::allow_global_seqno)
+    .def_readwrite("allow_blocking_flush", &IngestExternalFileOptions::allow_blocking_flush)
+    .def("copy",
+        [](const IngestExternalFileOptions &self) {
+            return IngestExternalFileOptions(self);
+        }
+    )
     .def(py::init())
     ;
 
+    py::class_<ExternalSstFileInfo>(m, "ExternalSstFileInfo")
+    .def_readonly("file_path", &ExternalSstFileInfo::file_path)
+    .def_property_readonly("smallest_key",
+        [](ExternalSstFileInfo &a) {
+            return py::bytes(a.smallest_key);
+        }
+    )
+    .def_property_readonly("largest_key",
+        [](ExternalSstFileInfo &a) {
+            return py::bytes(a.largest_key);
+        }
+    )
+    .def_readonly("sequence_number", &ExternalSstFileInfo::sequence_number)
+    .def_readonly("file_size", &ExternalSstFileInfo::file_size)
+    .def_readonly("num_entries", &ExternalSstFileInfo::num_entries)
+    .def_readonly("num_range_del_entries", &ExternalSstFileInfo::num_range_del_entries)
+    .def("__repr__",
+        [](ExternalSstFileInfo &a) {
+            return "<ExternalSstFileInfo path:" + a.file_path + " entries:" + std::to_string(a.num_entries) + " size:" + std::to_string(a.file_size) + ">";
+        }
+    )
+    ;
+
     py::class_<TransactionOptions>(m, "TransactionOptions")
     .def(py::init())
     ;
@@ -125,8 +643,18 @@ PYBIND11_MODULE(db_native, m) {
     .def(py::init())
     ;
 
-    py::class_<ColumnFamilyOptions>(m, "ColumnFamilyOptions")
+    py::class_<ColumnFamilyOptions> column_family_options_class(m, "ColumnFamilyOptions");
+    bindColumnFamilyOptions(column_family_options_class);
+    column_family_options_class
     .def(py::init())
+    .def(py::init<const Options&>())
+    .def("OptimizeLevelStyleCompaction",
+        [](ColumnFamilyOptions &a, uint64_t memtable_memory_budget) {
+            a.OptimizeLevelStyleCompaction(memtable_memory_budget);
+        },
+        py::arg("memtable_memory_budget") = 512 * 1024 * 1024
+    )
+    .def("set_block_based_table_factory", &setBlockBasedTableFactory<ColumnFamilyOptions>)
     ;
 
     py::class_<ColumnFamilyDescriptor>(m, "ColumnFamilyDescriptor")
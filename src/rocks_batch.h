@@ -7,12 +7,20 @@ class RBatch: public WriteBatch{
         RBatch(){
         }
 
-        void put(const std::string& key, const std::string& value, RColumnFamily &columnFamily){
+        void put(const Slice& key, const Slice& value, RColumnFamily &columnFamily){
             WriteBatch::Put(columnFamily.getHandle(), key, value);
         }
 
-        void deleteKey(const std::string& key, RColumnFamily &columnFamily){
+        void merge(const Slice& key, const Slice& value, RColumnFamily &columnFamily){
+            WriteBatch::Merge(columnFamily.getHandle(), key, value);
+        }
+
+        void deleteKey(const Slice& key, RColumnFamily &columnFamily){
             WriteBatch::Delete(columnFamily.getHandle(), key);
         }
+
+        void deleteRange(const Slice& beginKey, const Slice& endKey, RColumnFamily &columnFamily){
+            WriteBatch::DeleteRange(columnFamily.getHandle(), beginKey, endKey);
+        }
 };
 #endif
@@ -0,0 +1,58 @@
+#include <rocksdb/slice.h>
+
+using namespace ROCKSDB_NAMESPACE;
+
+class RBuffer{
+    public:
+        RBuffer(){
+            acquired = false;
+        }
+
+        RBuffer(const RBuffer&) = delete;
+        RBuffer& operator=(const RBuffer&) = delete;
+
+        RBuffer(RBuffer&& other) noexcept{
+            view = other.view;
+            acquired = other.acquired;
+            slice = other.slice;
+            other.acquired = false;
+        }
+
+        ~RBuffer(){
+            release();
+        }
+
+        bool load(PyObject* source){
+            release();
+            if(PyBytes_Check(source)){
+                slice = Slice(PyBytes_AS_STRING(source), PyBytes_GET_SIZE(source));
+                return true;
+            }
+            if(PyUnicode_Check(source) || !PyObject_CheckBuffer(source)){
+                return false;
+            }
+            if(PyObject_GetBuffer(source, &view, PyBUF_SIMPLE) != 0){
+                PyErr_Clear();
+                return false;
+            }
+            acquired = true;
+            slice = Slice((const char*)view.buf, view.len);
+            return true;
+        }
+
+        const Slice& getSlice() const{
+            return slice;
+        }
+
+        void release(){
+            if(acquired){
+                PyBuffer_Release(&view);
+                acquired = false;
+            }
+        }
+
+    private:
+        Py_buffer view;
+        bool acquired;
+        Slice slice;
+};
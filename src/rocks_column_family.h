@@ -1,4 +1,5 @@
 #include <rocksdb/db.h>
+#include <rocksdb/slice_transform.h>
 
 using namespace ROCKSDB_NAMESPACE;
 
@@ -70,6 +71,23 @@ class RColumnFamily{
             return cd;
         }
 
+        void setColumnFamilyOptions(const ColumnFamilyOptions& cf_options){
+            cd.options = cf_options;
+        }
+
+        bool hasPrefixExtractor(){
+            return cd.options.prefix_extractor != nullptr;
+        }
+
+        // every key starting with prefix shares its extracted prefix, so prefix_same_as_start is exact
+        bool prefixSeekCompatible(const Slice &prefix){
+            const SliceTransform* extractor = cd.options.prefix_extractor.get();
+            if(extractor == nullptr || !extractor->InDomain(prefix)){
+                return false;
+            }
+            return extractor->SameResultWhenAppended(extractor->Transform(prefix));
+        }
+
     private:
         ColumnFamilyHandle* cf;
         ColumnFamilyDescriptor cd;
@@ -8,6 +8,10 @@
 #include <rocksdb/utilities/transaction_db.h>
 #include <rocksdb/utilities/backup_engine.h>
 #include <rocksdb/utilities/db_ttl.h>
+#include <rocksdb/statistics.h>
+#include <atomic>
+#include <optional>
+#include <unordered_map>
 
 #define PY_SSIZE_T_CLEAN
 #include <Python.h>
@@ -19,8 +23,10 @@
 namespace py = pybind11;
 using namespace ROCKSDB_NAMESPACE;
 
+#include "rocks_buffer.h"
 #include "rocks_column_family.h"
 #include "rocks_status.h"
+#include "rocks_pinnable_slice.h"
 #include "rocks_iterator.h"
 #include "rocks_snapshot.h"
 #include "rocks_batch.h"
@@ -36,6 +42,21 @@ ComplexStatus ListColumnFamilies(const std::string& name, const Options& db_opti
     return result;
 }
 
+class RCancelToken {
+    public:
+        RCancelToken(): canceled(false) {}
+
+        void cancel(){
+            canceled.store(true, std::memory_order_release);
+        }
+
+        bool isCanceled(){
+            return canceled.load(std::memory_order_acquire);
+        }
+
+        std::atomic<bool> canceled;
+};
+
 class RDb {
     public:
         RDb(const std::string &path, const Options& options)
@@ -63,22 +84,54 @@ class RDb {
 
         void createIterator(RIterator& iter, ReadOptions &options, RColumnFamily &columnFamily);
 
-        void close();
+        Status releasePinnedSlices();
+
+        Status close();
+
+        Status put(const WriteOptions &options, RColumnFamily &columnFamily, const Slice &key, const Slice &value);
+
+        Status merge(const WriteOptions &options, RColumnFamily &columnFamily, const Slice &key, const Slice &value);
+
+        ComplexStatus get(const ReadOptions &options, RColumnFamily &columnFamily, const Slice &key);
+
+        ComplexStatus getCached(const ReadOptions &options, RColumnFamily &columnFamily, const Slice &key);
 
-        Status put(const WriteOptions &options, RColumnFamily &columnFamily, const std::string &key, const std::string &value);
+        Status getPinned(const ReadOptions &options, RColumnFamily &columnFamily, const Slice &key, RPinnableSlice &value);
 
-        ComplexStatus get(const ReadOptions &options, RColumnFamily &columnFamily, const std::string &key);
+        Status deleteKey(const WriteOptions &options, RColumnFamily &columnFamily, const Slice &key);
 
-        Status deleteKey(const WriteOptions &options, RColumnFamily &columnFamily, const std::string &key);
+        Status deleteRange(const WriteOptions &options, RColumnFamily &columnFamily, const Slice &from, const Slice &to);
 
-        Status deleteRange(const WriteOptions &options, RColumnFamily &columnFamily, const std::string &from, const std::string &to);
+        ComplexStatus multiGet(const ReadOptions &options, const std::vector<RColumnFamily*>& column_family_list, const std::vector<Slice> &keys);
 
-        ComplexStatus multiGet(const ReadOptions &options, const std::vector<RColumnFamily*>& column_family_list, const std::vector<std::string> keys);
+        ComplexStatus multiGetBatch(const ReadOptions &options, RColumnFamily &columnFamily, const std::vector<Slice> &keys, bool sorted_input);
 
         Status ingestExternalFile(const std::vector<std::string> &files, RColumnFamily &columnFamily, IngestExternalFileOptions &ifo);
 
         Status flush(const FlushOptions &options, std::vector<RColumnFamily*>& column_family_list);
 
+        Status compactRange(const CompactRangeOptions &options, RColumnFamily &columnFamily, const std::optional<std::string> &begin, const std::optional<std::string> &end, RCancelToken &token);
+
+        Status compactFiles(const CompactionOptions &options, RColumnFamily &columnFamily, const std::vector<std::string> &files, int output_level);
+
+        Status setOptions(RColumnFamily &columnFamily, const std::unordered_map<std::string, std::string> &new_options);
+
+        Status setDBOptions(const std::unordered_map<std::string, std::string> &new_options);
+
+        Status enableAutoCompaction(std::vector<RColumnFamily*>& column_family_list);
+
+        Status pauseBackgroundWork();
+
+        Status continueBackgroundWork();
+
+        ComplexStatus getProperty(RColumnFamily &columnFamily, const std::string &name);
+
+        ComplexStatus getIntProperty(RColumnFamily &columnFamily, const std::string &name);
+
+        ComplexStatus getMapProperty(RColumnFamily &columnFamily, const std::string &name);
+
+        std::shared_ptr<Statistics> getStatistics();
+
         Status write(const WriteOptions &options, RBatch& batch);
 
         void beginTransaction(const WriteOptions &options, TransactionOptions& txn_options, RTransaction &txn);
@@ -100,13 +153,14 @@ class RDb {
         bool           is_transaction_db;
         bool           is_optimistic_transaction_db;
         bool           is_ttl_db;
+        std::unordered_set<RPinnableSlice*> pinnedSlices;
 };
 
 Status RDb::openDb(std::vector<RColumnFamily*>& column_family_list){
     std::vector<ColumnFamilyDescriptor> column_families;
     std::vector<ColumnFamilyHandle*> handles;
     for(RColumnFamily* i : column_family_list) {
-        column_families.push_back(ColumnFamilyDescriptor(i->getName(), ColumnFamilyOptions()));
+        column_families.push_back(i->getColumnFamilyDescriptor());
     }
     #ifndef USE_GIL
     py::gil_scoped_release release;
@@ -128,7 +182,7 @@ Status RDb::openDbForReadonly(std::vector<RColumnFamily*>& column_family_list, b
     std::vector<ColumnFamilyDescriptor> column_families;
     std::vector<ColumnFamilyHandle*> handles;
     for(RColumnFamily* i : column_family_list) {
-        column_families.push_back(ColumnFamilyDescriptor(i->getName(), ColumnFamilyOptions()));
+        column_families.push_back(i->getColumnFamilyDescriptor());
     }
     #ifndef USE_GIL
     py::gil_scoped_release release;
@@ -150,7 +204,7 @@ Status RDb::openTransactionDb(std::vector<RColumnFamily*>& column_family_list){
     std::vector<ColumnFamilyDescriptor> column_families;
     std::vector<ColumnFamilyHandle*> handles;
     for(RColumnFamily* i : column_family_list) {
-        column_families.push_back(ColumnFamilyDescriptor(i->getName(), ColumnFamilyOptions()));
+        column_families.push_back(i->getColumnFamilyDescriptor());
     }
     TransactionDBOptions txn_db_options;
     TransactionDB* txn_db;
@@ -176,7 +230,7 @@ Status RDb::openOptimisticTransactionDb(std::vector<RColumnFamily*>& column_fami
     std::vector<ColumnFamilyDescriptor> column_families;
     std::vector<ColumnFamilyHandle*> handles;
     for(RColumnFamily* i : column_family_list) {
-        column_families.push_back(ColumnFamilyDescriptor(i->getName(), ColumnFamilyOptions()));
+        column_families.push_back(i->getColumnFamilyDescriptor());
     }
     OptimisticTransactionDB* txn_db;
     #ifndef USE_GIL
@@ -201,7 +255,7 @@ Status RDb::openDbWithTTL(std::vector<RColumnFamily*>& column_family_list, std::
     std::vector<ColumnFamilyDescriptor> column_families;
     std::vector<ColumnFamilyHandle*> handles;
     for(RColumnFamily* i : column_family_list) {
-        column_families.push_back(ColumnFamilyDescriptor(i->getName(), ColumnFamilyOptions()));
+        column_families.push_back(i->getColumnFamilyDescriptor());
     }
     #ifndef USE_GIL
     py::gil_scoped_release release;
@@ -248,6 +302,9 @@ Status RDb::createColumnFamily(const ColumnFamilyOptions& cf_options, RColumnFam
     py::gil_scoped_acquire acquire;
     #endif
     cf.setHandle(handle);
+    if(s.ok()){
+        cf.setColumnFamilyOptions(cf_options);
+    }
     return s;
 }
 
@@ -276,10 +333,11 @@ void RDb::releaseSnapshot(RSnapshot& snapshot){
 }
 
 void RDb::createIterator(RIterator& iter, ReadOptions &options, RColumnFamily &columnFamily){
+    const ReadOptions& iterOptions = iter.ownReadOptions(options);
     #ifndef USE_GIL
     py::gil_scoped_release release;
     #endif
-    Iterator* newIter = db->NewIterator(options, columnFamily.getHandle());
+    Iterator* newIter = db->NewIterator(iterOptions, columnFamily.getHandle());
     #ifndef USE_GIL
     py::gil_scoped_acquire acquire;
     #endif
@@ -287,15 +345,35 @@ void RDb::createIterator(RIterator& iter, ReadOptions &options, RColumnFamily &c
 }
 
 
-void RDb::close(){
+// pinned slices point into the block cache of this db, they are reset before it closes
+Status RDb::releasePinnedSlices(){
+    for(RPinnableSlice* slice : pinnedSlices){
+        if(slice->exportCount() > 0){
+            return Status::Busy("memoryviews of pinned slices are still alive");
+        }
+    }
+    for(RPinnableSlice* slice : pinnedSlices){
+        slice->resetByOwner();
+    }
+    pinnedSlices.clear();
+    return Status::OK();
+}
+
+
+Status RDb::close(){
+    Status s = releasePinnedSlices();
+    if(!s.ok()){
+        return s;
+    }
     if(db != nullptr){
         delete db;
         db = nullptr;
     }
+    return s;
 }
 
 
-ComplexStatus RDb::get(const ReadOptions &options, RColumnFamily &columnFamily, const std::string &key){
+ComplexStatus RDb::get(const ReadOptions &options, RColumnFamily &columnFamily, const Slice &key){
     ComplexStatus result;
     {
         std::string str;
@@ -315,7 +393,35 @@ ComplexStatus RDb::get(const ReadOptions &options, RColumnFamily &columnFamily,
 }
 
 
-Status RDb::put(const WriteOptions &options, RColumnFamily &columnFamily, const std::string &key, const std::string &value){
+ComplexStatus RDb::getCached(const ReadOptions &options, RColumnFamily &columnFamily, const Slice &key){
+    ComplexStatus result;
+    ReadOptions cache_options = options;
+    cache_options.read_tier = kBlockCacheTier;
+    std::string str;
+    Status s = db->Get(cache_options, columnFamily.getHandle(), key, &str);
+    result.status = s;
+    if(s.ok()){
+        result.value = py::bytes(str);
+    }
+    return result;
+}
+
+
+Status RDb::getPinned(const ReadOptions &options, RColumnFamily &columnFamily, const Slice &key, RPinnableSlice &value){
+    value.release();
+    value.attach(&pinnedSlices);
+    #ifndef USE_GIL
+    py::gil_scoped_release release;
+    #endif
+    Status s = db->Get(options, columnFamily.getHandle(), key, value.getPinnableSlice());
+    #ifndef USE_GIL
+    py::gil_scoped_acquire acquire;
+    #endif
+    return s;
+}
+
+
+Status RDb::put(const WriteOptions &options, RColumnFamily &columnFamily, const Slice &key, const Slice &value){
     #ifndef USE_GIL
     py::gil_scoped_release release;
     #endif
@@ -327,7 +433,19 @@ Status RDb::put(const WriteOptions &options, RColumnFamily &columnFamily, const
 }
 
 
-Status RDb::deleteKey(const WriteOptions &options, RColumnFamily &columnFamily, const std::string &key){
+Status RDb::merge(const WriteOptions &options, RColumnFamily &columnFamily, const Slice &key, const Slice &value){
+    #ifndef USE_GIL
+    py::gil_scoped_release release;
+    #endif
+    Status s = db->Merge(options, columnFamily.getHandle(), key, value);
+    #ifndef USE_GIL
+    py::gil_scoped_acquire acquire;
+    #endif
+    return s;
+}
+
+
+Status RDb::deleteKey(const WriteOptions &options, RColumnFamily &columnFamily, const Slice &key){
     #ifndef USE_GIL
     py::gil_scoped_release release;
     #endif
@@ -339,7 +457,7 @@ Status RDb::deleteKey(const WriteOptions &options, RColumnFamily &columnFamily,
 }
 
 
-Status RDb::deleteRange(const WriteOptions &options, RColumnFamily &columnFamily, const std::string &from, const std::string &to){
+Status RDb::deleteRange(const WriteOptions &options, RColumnFamily &columnFamily, const Slice &from, const Slice &to){
     #ifndef USE_GIL
     py::gil_scoped_release release;
     #endif
@@ -351,21 +469,17 @@ Status RDb::deleteRange(const WriteOptions &options, RColumnFamily &columnFamily
 }
 
 
-ComplexStatus RDb::multiGet(const ReadOptions &options, const std::vector<RColumnFamily*>& column_family_list, const std::vector<std::string> keys){
-    std::vector<Slice> slice_keys;
+ComplexStatus RDb::multiGet(const ReadOptions &options, const std::vector<RColumnFamily*>& column_family_list, const std::vector<Slice> &keys){
     std::vector<std::string> values;
     std::vector<ColumnFamilyHandle*> handles;
     for(RColumnFamily* i : column_family_list) {
         handles.push_back(i->getHandle());
     }
-    for(std::string i : keys) {
-        slice_keys.push_back(Slice(i));
-    }
     ComplexStatus result;
     #ifndef USE_GIL
     py::gil_scoped_release release;
     #endif
-    result.statusList = db->MultiGet(options, handles, slice_keys, &values);
+    result.statusList = db->MultiGet(options, handles, keys, &values);
     result.valueList = values;
     #ifndef USE_GIL
     py::gil_scoped_acquire acquire;
@@ -374,11 +488,46 @@ ComplexStatus RDb::multiGet(const ReadOptions &options, const std::vector<RColum
 }
 
 
+ComplexStatus RDb::multiGetBatch(const ReadOptions &options, RColumnFamily &columnFamily, const std::vector<Slice> &keys, bool sorted_input = false){
+    size_t count = keys.size();
+    std::vector<Slice> slice_keys(keys);
+    std::vector<PinnableSlice> values(count);
+    std::vector<Status> statuses(count);
+    {
+        #ifndef USE_GIL
+        py::gil_scoped_release release;
+        #endif
+        db->MultiGet(options, columnFamily.getHandle(), count, slice_keys.data(), values.data(), statuses.data(), sorted_input);
+        #ifndef USE_GIL
+        py::gil_scoped_acquire acquire;
+        #endif
+    }
+    ComplexStatus result;
+    py::list valueList;
+    for(size_t i = 0; i < count; i++) {
+        if(statuses[i].ok()){
+            valueList.append(py::bytes(values[i].data(), values[i].size()));
+        }
+        else{
+            valueList.append(py::none());
+            if(!statuses[i].IsNotFound()){
+                if(result.errorList.empty()){
+                    result.status = statuses[i];
+                }
+                result.errorList.push_back(std::make_pair(i, statuses[i]));
+            }
+        }
+    }
+    result.value = valueList;
+    return result;
+}
+
+
 Status RDb::ingestExternalFile(const std::vector<std::string> &files, RColumnFamily &columnFamily, IngestExternalFileOptions &ifo){
     #ifndef USE_GIL
     py::gil_scoped_release release;
     #endif
-    Status s = db->IngestExternalFile(files, ifo);
+    Status s = db->IngestExternalFile(columnFamily.getHandle(), files, ifo);
     #ifndef USE_GIL
     py::gil_scoped_acquire acquire;
     #endif
@@ -402,6 +551,172 @@ Status RDb::flush(const FlushOptions &options, std::vector<RColumnFamily*>& colu
 }
 
 
+Status RDb::compactRange(const CompactRangeOptions &options, RColumnFamily &columnFamily, const std::optional<std::string> &begin, const std::optional<std::string> &end, RCancelToken &token){
+    CompactRangeOptions compact_options = options;
+    compact_options.canceled = &token.canceled;
+    Slice begin_slice;
+    Slice end_slice;
+    if(begin){
+        begin_slice = Slice(*begin);
+    }
+    if(end){
+        end_slice = Slice(*end);
+    }
+    #ifndef USE_GIL
+    py::gil_scoped_release release;
+    #endif
+    Status s = db->CompactRange(compact_options, columnFamily.getHandle(), begin ? &begin_slice : nullptr, end ? &end_slice : nullptr);
+    #ifndef USE_GIL
+    py::gil_scoped_acquire acquire;
+    #endif
+    return s;
+}
+
+
+Status RDb::compactFiles(const CompactionOptions &options, RColumnFamily &columnFamily, const std::vector<std::string> &files, int output_level){
+    #ifndef USE_GIL
+    py::gil_scoped_release release;
+    #endif
+    Status s = db->CompactFiles(options, columnFamily.getHandle(), files, output_level);
+    #ifndef USE_GIL
+    py::gil_scoped_acquire acquire;
+    #endif
+    return s;
+}
+
+
+Status RDb::setOptions(RColumnFamily &columnFamily, const std::unordered_map<std::string, std::string> &new_options){
+    #ifndef USE_GIL
+    py::gil_scoped_release release;
+    #endif
+    Status s = db->SetOptions(columnFamily.getHandle(), new_options);
+    #ifndef USE_GIL
+    py::gil_scoped_acquire acquire;
+    #endif
+    return s;
+}
+
+
+Status RDb::setDBOptions(const std::unordered_map<std::string, std::string> &new_options){
+    #ifndef USE_GIL
+    py::gil_scoped_release release;
+    #endif
+    Status s = db->SetDBOptions(new_options);
+    #ifndef USE_GIL
+    py::gil_scoped_acquire acquire;
+    #endif
+    return s;
+}
+
+
+Status RDb::enableAutoCompaction(std::vector<RColumnFamily*>& column_family_list){
+    std::vector<ColumnFamilyHandle*> handles;
+    for(RColumnFamily* i : column_family_list) {
+        handles.push_back(i->getHandle());
+    }
+    #ifndef USE_GIL
+    py::gil_scoped_release release;
+    #endif
+    Status s = db->EnableAutoCompaction(handles);
+    #ifndef USE_GIL
+    py::gil_scoped_acquire acquire;
+    #endif
+    return s;
+}
+
+
+Status RDb::pauseBackgroundWork(){
+    #ifndef USE_GIL
+    py::gil_scoped_release release;
+    #endif
+    Status s = db->PauseBackgroundWork();
+    #ifndef USE_GIL
+    py::gil_scoped_acquire acquire;
+    #endif
+    return s;
+}
+
+
+Status RDb::continueBackgroundWork(){
+    #ifndef USE_GIL
+    py::gil_scoped_release release;
+    #endif
+    Status s = db->ContinueBackgroundWork();
+    #ifndef USE_GIL
+    py::gil_scoped_acquire acquire;
+    #endif
+    return s;
+}
+
+
+ComplexStatus RDb::getProperty(RColumnFamily &columnFamily, const std::string &name){
+    ComplexStatus result;
+    {
+        std::string str;
+        #ifndef USE_GIL
+        py::gil_scoped_release release;
+        #endif
+        bool found = db->GetProperty(columnFamily.getHandle(), name, &str);
+        #ifndef USE_GIL
+        py::gil_scoped_acquire acquire;
+        #endif
+        if(found){
+            result.value = py::str(str);
+        }else{
+            result.status = Status::NotFound(name);
+        }
+    }
+    return result;
+}
+
+
+ComplexStatus RDb::getIntProperty(RColumnFamily &columnFamily, const std::string &name){
+    ComplexStatus result;
+    {
+        uint64_t value = 0;
+        #ifndef USE_GIL
+        py::gil_scoped_release release;
+        #endif
+        bool found = db->GetIntProperty(columnFamily.getHandle(), name, &value);
+        #ifndef USE_GIL
+        py::gil_scoped_acquire acquire;
+        #endif
+        if(found){
+            result.value = py::int_(value);
+        }else{
+            result.status = Status::NotFound(name);
+        }
+    }
+    return result;
+}
+
+
+ComplexStatus RDb::getMapProperty(RColumnFamily &columnFamily, const std::string &name){
+    ComplexStatus result;
+    {
+        std::map<std::string, std::string> values;
+        #ifndef USE_GIL
+        py::gil_scoped_release release;
+        #endif
+        bool found = db->GetMapProperty(columnFamily.getHandle(), name, &values);
+        #ifndef USE_GIL
+        py::gil_scoped_acquire acquire;
+        #endif
+        if(found){
+            result.value = py::cast(values);
+        }else{
+            result.status = Status::NotFound(name);
+        }
+    }
+    return result;
+}
+
+
+std::shared_ptr<Statistics> RDb::getStatistics(){
+    return options.statistics;
+}
+
+
 Status RDb::write(const WriteOptions &options, RBatch& batch){
     #ifndef USE_GIL
     py::gil_scoped_release release;
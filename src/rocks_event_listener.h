@@ -0,0 +1,155 @@
+#include <mutex>
+#include <deque>
+#include <map>
+#include <fcntl.h>
+#include <unistd.h>
+#include <rocksdb/listener.h>
+
+using namespace ROCKSDB_NAMESPACE;
+
+struct REvent{
+    std::string type;
+    std::map<std::string, std::string> text;
+    std::map<std::string, int64_t> number;
+};
+
+
+// RocksDB background threads only queue events and poke a pipe, they never touch the GIL.
+// The event loop watches fileno() and drains the queue in batches.
+class REventListener : public EventListener{
+    public:
+        REventListener(){
+            fds[0] = -1;
+            fds[1] = -1;
+            notified = false;
+            if(pipe(fds) == 0){
+                fcntl(fds[0], F_SETFL, fcntl(fds[0], F_GETFL) | O_NONBLOCK);
+                fcntl(fds[1], F_SETFL, fcntl(fds[1], F_GETFL) | O_NONBLOCK);
+            }
+        }
+
+        ~REventListener() override{
+            for(int fd : fds){
+                if(fd >= 0){
+                    ::close(fd);
+                }
+            }
+        }
+
+        const char* Name() const override{
+            return "aiorocksdb.EventListener";
+        }
+
+        int fileno(){
+            return fds[0];
+        }
+
+        void OnFlushCompleted(DB* db, const FlushJobInfo& info) override{
+            REvent event;
+            event.type = "flush_completed";
+            event.text["cf_name"] = info.cf_name;
+            event.text["file_path"] = info.file_path;
+            event.number["job_id"] = info.job_id;
+            event.number["triggered_writes_slowdown"] = info.triggered_writes_slowdown;
+            event.number["triggered_writes_stop"] = info.triggered_writes_stop;
+            event.number["smallest_seqno"] = info.smallest_seqno;
+            event.number["largest_seqno"] = info.largest_seqno;
+            event.number["flush_reason"] = (int64_t)info.flush_reason;
+            push(std::move(event));
+        }
+
+        void OnCompactionCompleted(DB* db, const CompactionJobInfo& info) override{
+            REvent event;
+            event.type = "compaction_completed";
+            event.text["cf_name"] = info.cf_name;
+            event.text["status"] = info.status.ToString();
+            event.number["job_id"] = info.job_id;
+            event.number["base_input_level"] = info.base_input_level;
+            event.number["output_level"] = info.output_level;
+            event.number["input_file_count"] = info.input_files.size();
+            event.number["output_file_count"] = info.output_files.size();
+            event.number["compaction_reason"] = (int64_t)info.compaction_reason;
+            event.number["elapsed_micros"] = info.stats.elapsed_micros;
+            event.number["total_input_bytes"] = info.stats.total_input_bytes;
+            event.number["total_output_bytes"] = info.stats.total_output_bytes;
+            event.number["num_input_records"] = info.stats.num_input_records;
+            event.number["num_output_records"] = info.stats.num_output_records;
+            push(std::move(event));
+        }
+
+        void OnStallConditionsChanged(const WriteStallInfo& info) override{
+            REvent event;
+            event.type = "stall_conditions_changed";
+            event.text["cf_name"] = info.cf_name;
+            event.text["condition"] = conditionName(info.condition.cur);
+            event.text["previous_condition"] = conditionName(info.condition.prev);
+            push(std::move(event));
+        }
+
+        void OnBackgroundError(BackgroundErrorReason reason, Status* bg_error) override{
+            REvent event;
+            event.type = "background_error";
+            event.number["reason"] = (int64_t)reason;
+            event.text["status"] = bg_error != nullptr ? bg_error->ToString() : "";
+            push(std::move(event));
+        }
+
+        py::list drain(){
+            char buffer[64];
+            while(read(fds[0], buffer, sizeof(buffer)) > 0){
+            }
+            std::deque<REvent> events;
+            {
+                std::lock_guard<std::mutex> guard(mutex);
+                events.swap(queue);
+                notified = false;
+            }
+            py::list result;
+            for(const REvent& event : events){
+                py::dict item;
+                item["type"] = event.type;
+                for(const auto& i : event.text){
+                    item[py::str(i.first)] = i.second;
+                }
+                for(const auto& i : event.number){
+                    item[py::str(i.first)] = i.second;
+                }
+                result.append(item);
+            }
+            return result;
+        }
+
+    private:
+        static const char* conditionName(WriteStallCondition condition){
+            switch(condition){
+                case WriteStallCondition::kDelayed:
+                    return "delayed";
+                case WriteStallCondition::kStopped:
+                    return "stopped";
+                default:
+                    return "normal";
+            }
+        }
+
+        void push(REvent&& event){
+            bool notify = false;
+            {
+                std::lock_guard<std::mutex> guard(mutex);
+                queue.push_back(std::move(event));
+                if(!notified){
+                    notified = true;
+                    notify = true;
+                }
+            }
+            if(notify && fds[1] >= 0){
+                char byte = 1;
+                ssize_t written = write(fds[1], &byte, 1);
+                (void)written;
+            }
+        }
+
+        int fds[2];
+        bool notified;
+        std::mutex mutex;
+        std::deque<REvent> queue;
+};
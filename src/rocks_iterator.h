@@ -1,3 +1,4 @@
+#include <string>
 #include <rocksdb/db.h>
 
 using namespace ROCKSDB_NAMESPACE;
@@ -6,10 +7,23 @@ using namespace ROCKSDB_NAMESPACE;
 class RIterator{
     public:
         RIterator(){
+            iter = nullptr;
+        }
 
+        RIterator(const RIterator&) = delete;
+        RIterator& operator=(const RIterator&) = delete;
+
+        // rocksdb keeps the raw bound slices of the read options, so the iterator reads through its own copy
+        // of the options and bounds instead of the holders of the python ReadOptions, which assigning a bound replaces
+        const ReadOptions& ownReadOptions(const ReadOptions& options){
+            close();
+            readOptions = options;
+            readOptions.iterate_lower_bound = copyBound(options.iterate_lower_bound, lowerBound, lowerSlice);
+            readOptions.iterate_upper_bound = copyBound(options.iterate_upper_bound, upperBound, upperSlice);
+            return readOptions;
         }
 
-        void seek(const std::string prefix){
+        void seek(const Slice& prefix){
             #ifndef USE_GIL
             py::gil_scoped_release release;
             #endif
@@ -21,7 +35,7 @@ class RIterator{
             #endif
         }
 
-        void seekForPrev(const std::string prefix){
+        void seekForPrev(const Slice& prefix){
             #ifndef USE_GIL
             py::gil_scoped_release release;
             #endif
@@ -88,16 +102,45 @@ class RIterator{
             #endif
         }
 
+        py::list nextBatch(size_t n, bool reverse){
+            std::vector<std::pair<std::string, std::string>> rows;
+            #ifndef USE_GIL
+            py::gil_scoped_release release;
+            #endif
+            if(iter != nullptr){
+                rows.reserve(n);
+                while(rows.size() < n && iter->Valid()){
+                    rows.emplace_back(iter->key().ToString(), iter->value().ToString());
+                    if(reverse){
+                        iter->Prev();
+                    }
+                    else{
+                        iter->Next();
+                    }
+                }
+            }
+            #ifndef USE_GIL
+            py::gil_scoped_acquire acquire;
+            #endif
+            py::list result;
+            for(auto &row : rows){
+                result.append(py::make_tuple(py::bytes(row.first), py::bytes(row.second)));
+            }
+            return result;
+        }
+
         Status status(){
             return iter->status();
         }
 
         py::object key(){
-            return py::bytes(iter->key().ToString());
+            Slice key = iter->key();
+            return py::bytes(key.data(), key.size());
         }
 
         py::object value(){
-            return py::bytes(iter->value().ToString());
+            Slice value = iter->value();
+            return py::bytes(value.data(), value.size());
         }
 
         void setIterator(Iterator* iter){
@@ -118,6 +161,20 @@ class RIterator{
         }
 
     private:
+        static const Slice* copyBound(const Slice* bound, std::string& data, Slice& slice){
+            if(bound == nullptr){
+                return nullptr;
+            }
+            data.assign(bound->data(), bound->size());
+            slice = Slice(data);
+            return &slice;
+        }
+
         Iterator* iter;
+        ReadOptions readOptions;
+        std::string lowerBound;
+        std::string upperBound;
+        Slice lowerSlice;
+        Slice upperSlice;
 };
 #endif
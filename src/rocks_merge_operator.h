@@ -0,0 +1,115 @@
+#include <rocksdb/slice.h>
+#include <rocksdb/merge_operator.h>
+#include <rocksdb/utilities/options_type.h>
+#include <rocksdb/utilities/object_registry.h>
+
+using namespace ROCKSDB_NAMESPACE;
+
+// operands and values are 8 byte little endian unsigned integers, malformed values count as zero
+class UInt64AddOperator : public AssociativeMergeOperator{
+    public:
+        bool Merge(const Slice& key, const Slice* existing_value, const Slice& value, std::string* new_value, Logger* logger) const override{
+            uint64_t result = decode(existing_value) + decode(&value);
+            char buffer[sizeof(uint64_t)];
+            for(size_t i = 0; i < sizeof(uint64_t); i++){
+                buffer[i] = (char)((result >> (8 * i)) & 0xff);
+            }
+            new_value->assign(buffer, sizeof(uint64_t));
+            return true;
+        }
+
+        const char* Name() const override{
+            return "UInt64AddOperator";
+        }
+
+    private:
+        static uint64_t decode(const Slice* value){
+            if(value == nullptr || value->size() != sizeof(uint64_t)){
+                return 0;
+            }
+            uint64_t result = 0;
+            for(size_t i = 0; i < sizeof(uint64_t); i++){
+                result |= ((uint64_t)(unsigned char)value->data()[i]) << (8 * i);
+            }
+            return result;
+        }
+};
+
+
+// same name and "delimiter" option as the RocksDB builtin, so an OPTIONS file records the delimiter
+// and reloading it builds an equivalent builtin operator instead of one with the default ','
+static std::unordered_map<std::string, OptionTypeInfo> string_append_type_info = {
+    {"delimiter", {0, OptionType::kString, OptionVerificationType::kNormal, OptionTypeFlags::kNone}},
+};
+
+
+class StringAppendOperator : public AssociativeMergeOperator{
+    public:
+        explicit StringAppendOperator(const std::string& delimiter): delimiter(delimiter){
+            RegisterOptions("Delimiter", &this->delimiter, &string_append_type_info);
+        }
+
+        bool Merge(const Slice& key, const Slice* existing_value, const Slice& value, std::string* new_value, Logger* logger) const override{
+            new_value->clear();
+            if(existing_value == nullptr){
+                new_value->assign(value.data(), value.size());
+                return true;
+            }
+            new_value->reserve(existing_value->size() + delimiter.size() + value.size());
+            new_value->assign(existing_value->data(), existing_value->size());
+            new_value->append(delimiter);
+            new_value->append(value.data(), value.size());
+            return true;
+        }
+
+        const char* Name() const override{
+            return "StringAppendOperator";
+        }
+
+    private:
+        std::string delimiter;
+};
+
+
+// keeps the bytewise largest (or smallest) operand, use fixed width big endian encodings for numbers
+class BytewiseExtremumOperator : public AssociativeMergeOperator{
+    public:
+        explicit BytewiseExtremumOperator(bool keep_max): keep_max(keep_max){}
+
+        bool Merge(const Slice& key, const Slice* existing_value, const Slice& value, std::string* new_value, Logger* logger) const override{
+            const Slice* result = &value;
+            if(existing_value != nullptr){
+                int cmp = existing_value->compare(value);
+                if((keep_max && cmp > 0) || (!keep_max && cmp < 0)){
+                    result = existing_value;
+                }
+            }
+            new_value->assign(result->data(), result->size());
+            return true;
+        }
+
+        const char* Name() const override{
+            return keep_max ? "MaxOperator" : kMinClassName();
+        }
+
+        static const char* kMinClassName(){
+            return "aiorocksdb.MinOperator";
+        }
+
+    private:
+        bool keep_max;
+};
+
+
+// the max variant reuses the builtin "MaxOperator", the min variant has no builtin,
+// so its factory is registered for OPTIONS files naming it to load back, call it from every module init
+// since a statically linked rocksdb gives each extension module its own default library
+static void registerMergeOperators(){
+    ObjectLibrary::Default()->AddFactory<MergeOperator>(
+        BytewiseExtremumOperator::kMinClassName(),
+        [](const std::string& uri, std::unique_ptr<MergeOperator>* guard, std::string* errmsg){
+            guard->reset(new BytewiseExtremumOperator(false));
+            return guard->get();
+        }
+    );
+}
@@ -0,0 +1,103 @@
+#include <unordered_set>
+#include <rocksdb/slice.h>
+
+using namespace ROCKSDB_NAMESPACE;
+
+#ifdef RDB
+// Implements the buffer protocol itself so it can count exported views:
+// the pinned block may only be released once no memoryview refers to it.
+// The owner set belongs to the RDb that pinned the slice, it is only touched with the GIL held.
+class RPinnableSlice{
+    public:
+        RPinnableSlice(){
+            exports = 0;
+            owner = nullptr;
+        }
+
+        ~RPinnableSlice(){
+            detach();
+        }
+
+        PinnableSlice* getPinnableSlice(){
+            return &slice;
+        }
+
+        size_t size(){
+            return slice.size();
+        }
+
+        bool isPinned(){
+            return slice.IsPinned();
+        }
+
+        py::object toBytes(){
+            return py::bytes(slice.data(), slice.size());
+        }
+
+        Py_ssize_t exportCount(){
+            return exports;
+        }
+
+        void release(){
+            if(exports > 0){
+                throw py::buffer_error("RPinnableSlice has exported memoryviews, release them first");
+            }
+            slice.Reset();
+            detach();
+        }
+
+        void attach(std::unordered_set<RPinnableSlice*>* registry){
+            detach();
+            owner = registry;
+            owner->insert(this);
+        }
+
+        // called by the owner while it closes, the owner clears its set itself
+        void resetByOwner(){
+            slice.Reset();
+            owner = nullptr;
+        }
+
+        static int getBuffer(PyObject *obj, Py_buffer *view, int flags){
+            RPinnableSlice *self = fromObject(obj);
+            if(self == nullptr){
+                view->obj = nullptr;
+                PyErr_SetString(PyExc_BufferError, "RPinnableSlice is not initialized");
+                return -1;
+            }
+            if(PyBuffer_FillInfo(view, obj, (void*)self->slice.data(), (Py_ssize_t)self->slice.size(), 1, flags) != 0){
+                return -1;
+            }
+            self->exports++;
+            return 0;
+        }
+
+        static void releaseBuffer(PyObject *obj, Py_buffer *view){
+            RPinnableSlice *self = fromObject(obj);
+            if(self != nullptr && self->exports > 0){
+                self->exports--;
+            }
+        }
+
+    private:
+        static RPinnableSlice* fromObject(PyObject *obj){
+            try{
+                return py::handle(obj).cast<RPinnableSlice*>();
+            }
+            catch(const py::cast_error&){
+                return nullptr;
+            }
+        }
+
+        void detach(){
+            if(owner != nullptr){
+                owner->erase(this);
+                owner = nullptr;
+            }
+        }
+
+        PinnableSlice slice;
+        Py_ssize_t exports;
+        std::unordered_set<RPinnableSlice*>* owner;
+};
+#endif
@@ -0,0 +1,54 @@
+#include <string_view>
+#include <rocksdb/slice.h>
+#include <rocksdb/slice_transform.h>
+
+using namespace ROCKSDB_NAMESPACE;
+
+class DelimiterPrefixTransform : public SliceTransform{
+    public:
+        DelimiterPrefixTransform(const std::string &delimiter, size_t occurrences){
+            this->delimiter = delimiter;
+            this->occurrences = occurrences;
+            name = "aiorocksdb.DelimiterPrefix." + std::to_string(occurrences) + "." + Slice(delimiter).ToString(true);
+        }
+
+        const char* Name() const override{
+            return name.c_str();
+        }
+
+        Slice Transform(const Slice &src) const override{
+            return Slice(src.data(), prefixSize(src));
+        }
+
+        bool InDomain(const Slice &src) const override{
+            return prefixSize(src) > 0;
+        }
+
+        bool SameResultWhenAppended(const Slice &prefix) const override{
+            return InDomain(prefix);
+        }
+
+    private:
+        // size of the prefix ending with the n-th delimiter, zero when src holds fewer delimiters
+        size_t prefixSize(const Slice &src) const{
+            if(delimiter.empty() || occurrences == 0){
+                return 0;
+            }
+            std::string_view view(src.data(), src.size());
+            size_t found = 0;
+            size_t position = 0;
+            while(found < occurrences){
+                position = view.find(delimiter, position);
+                if(position == std::string_view::npos){
+                    return 0;
+                }
+                position += delimiter.size();
+                found++;
+            }
+            return position;
+        }
+
+        std::string delimiter;
+        size_t occurrences;
+        std::string name;
+};
@@ -32,10 +32,11 @@ class RSstFileReader: public SstFileReader{
         }
 
         void createIterator(RIterator& iter, ReadOptions &options){
+            const ReadOptions& iterOptions = iter.ownReadOptions(options);
             #ifndef USE_GIL
             py::gil_scoped_release release;
             #endif
-            Iterator* newIter = NewIterator(options);
+            Iterator* newIter = NewIterator(iterOptions);
             #ifndef USE_GIL
             py::gil_scoped_acquire acquire;
             #endif
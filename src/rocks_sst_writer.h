@@ -22,49 +22,109 @@ class RSstFileWriter: public SstFileWriter{
             return status;
         }
 
-        Status put(const std::string& user_key, const std::string& value){
+        Status put(const Slice& user_key, const Slice& value){
             #ifndef USE_GIL
             py::gil_scoped_release release;
             #endif
-            Status status = Put(Slice(user_key), Slice(value));
+            Status status = Put(user_key, value);
             #ifndef USE_GIL
             py::gil_scoped_acquire acquire;
             #endif
             return status;
         }
 
-        Status deleteKey(const std::string& user_key){
+        Status putMany(const py::iterable& pairs){
+            // owners keep every key and value alive while the GIL is released
+            std::vector<py::object> owners;
+            std::vector<RBuffer> keys;
+            std::vector<RBuffer> values;
+            for(py::handle pair : pairs){
+                if(!PySequence_Check(pair.ptr()) || PySequence_Size(pair.ptr()) != 2){
+                    throw py::type_error("put_many expects (key, value) pairs");
+                }
+                py::sequence item = py::reinterpret_borrow<py::sequence>(pair);
+                owners.push_back(item[0]);
+                owners.push_back(item[1]);
+                keys.emplace_back();
+                values.emplace_back();
+                if(!keys.back().load(owners[owners.size() - 2].ptr()) || !values.back().load(owners.back().ptr())){
+                    throw py::type_error("put_many expects bytes-like keys and values");
+                }
+            }
             #ifndef USE_GIL
             py::gil_scoped_release release;
             #endif
-            Status status = Delete(Slice(user_key));
+            Status status;
+            for(size_t i = 0; i < keys.size() && status.ok(); i++){
+                status = Put(keys[i].getSlice(), values[i].getSlice());
+            }
             #ifndef USE_GIL
             py::gil_scoped_acquire acquire;
             #endif
             return status;
         }
 
-        Status deleteRange(const std::string& begin_key, const std::string& end_key){
+        Status deleteMany(const py::iterable& user_keys){
+            std::vector<py::object> owners;
+            std::vector<RBuffer> keys;
+            for(py::handle key : user_keys){
+                owners.push_back(py::reinterpret_borrow<py::object>(key));
+                keys.emplace_back();
+                if(!keys.back().load(key.ptr())){
+                    throw py::type_error("delete_many expects bytes-like keys");
+                }
+            }
             #ifndef USE_GIL
             py::gil_scoped_release release;
             #endif
-            Status status = DeleteRange(Slice(begin_key), Slice(end_key));
+            Status status;
+            for(size_t i = 0; i < keys.size() && status.ok(); i++){
+                status = Delete(keys[i].getSlice());
+            }
             #ifndef USE_GIL
             py::gil_scoped_acquire acquire;
             #endif
             return status;
         }
 
-        Status finish(){
-            ExternalSstFileInfo file_info;
+        Status deleteKey(const Slice& user_key){
             #ifndef USE_GIL
             py::gil_scoped_release release;
             #endif
-            Status status = Finish(&file_info);
+            Status status = Delete(user_key);
             #ifndef USE_GIL
             py::gil_scoped_acquire acquire;
             #endif
             return status;
         }
+
+        Status deleteRange(const Slice& begin_key, const Slice& end_key){
+            #ifndef USE_GIL
+            py::gil_scoped_release release;
+            #endif
+            Status status = DeleteRange(begin_key, end_key);
+            #ifndef USE_GIL
+            py::gil_scoped_acquire acquire;
+            #endif
+            return status;
+        }
+
+        ComplexStatus finish(){
+            ComplexStatus result;
+            ExternalSstFileInfo file_info;
+            {
+                #ifndef USE_GIL
+                py::gil_scoped_release release;
+                #endif
+                result.status = Finish(&file_info);
+                #ifndef USE_GIL
+                py::gil_scoped_acquire acquire;
+                #endif
+            }
+            if(result.status.ok()){
+                result.value = py::cast(file_info);
+            }
+            return result;
+        }
 };
 #endif
\ No newline at end of file
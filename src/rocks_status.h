@@ -11,6 +11,7 @@ struct ComplexStatus{
     Status status;
     std::vector<Status> statusList;
     std::vector<std::string> valueList;
+    std::vector<std::pair<size_t, Status>> errorList;
     py::object value;
 };
 
@@ -27,7 +27,7 @@ class RTransaction{
             #endif
         }
 
-        Status put(RColumnFamily &columnFamily, const std::string& key, const std::string& value){
+        Status put(RColumnFamily &columnFamily, const Slice& key, const Slice& value){
             #ifndef USE_GIL
             py::gil_scoped_release release;
             #endif
@@ -38,7 +38,18 @@ class RTransaction{
             return s;
         }
 
-        Status deleteKey(RColumnFamily &columnFamily, const std::string& key){
+        Status merge(RColumnFamily &columnFamily, const Slice& key, const Slice& value){
+            #ifndef USE_GIL
+            py::gil_scoped_release release;
+            #endif
+            Status s = transaction->Merge(columnFamily.getHandle(), key, value);
+            #ifndef USE_GIL
+            py::gil_scoped_acquire acquire;
+            #endif
+            return s;
+        }
+
+        Status deleteKey(RColumnFamily &columnFamily, const Slice& key){
             #ifndef USE_GIL
             py::gil_scoped_release release;
             #endif
@@ -142,7 +153,7 @@ class RTransaction{
             return result;
         }
 
-        ComplexStatus getForUpdate(const ReadOptions &options, RColumnFamily &columnFamily, const std::string &key){
+        ComplexStatus getForUpdate(const ReadOptions &options, RColumnFamily &columnFamily, const Slice &key){
             ComplexStatus result;
             {
                 std::string str;
@@ -32,3 +32,43 @@ async def test_column_family():
     await r.close()
 
     await RocksDb.destroy_db('db_test_native')
+
+
+@pytest.mark.asyncio
+async def test_column_family_options():
+    await RocksDb.destroy_db('db_test_native')
+
+    hot_options = ColumnFamilyOptions()
+    hot_options.write_buffer_size = 32 * 1024 * 1024
+    hot_options.max_write_buffer_number = 4
+    hot_options.level0_file_num_compaction_trigger = 8
+    hot_options.compression = CompressionType.kNoCompression
+    cold_options = ColumnFamilyOptions()
+    cold_options.write_buffer_size = 4 * 1024 * 1024
+    cold_options.target_file_size_base = 128 * 1024 * 1024
+    cold_options.compaction_style = CompactionStyle.kCompactionStyleUniversal
+    hot_cf = RColumnFamily('hot', hot_options)
+    cold_cf = RColumnFamily('cold', cold_options)
+    option = Options()
+    option.create_if_missing = True
+    option.create_missing_column_families = True
+    option.write_buffer_size = 16 * 1024 * 1024
+    s = await RocksDb.open_db('db_test_native', option, [hot_cf, cold_cf, ])
+    assert s.ok()
+    r = s.result
+    await r.put(b'ka', b'va', column_family=hot_cf)
+    await r.close()
+
+    s = await RocksDb.load_latest_options('db_test_native')
+    assert s.ok()
+    cf_options = {cf.get_name(): cf.get_column_family_descriptor().options for cf in s.result}
+    assert cf_options['default'].write_buffer_size == 16 * 1024 * 1024
+    assert cf_options['hot'].write_buffer_size == 32 * 1024 * 1024
+    assert cf_options['hot'].max_write_buffer_number == 4
+    assert cf_options['hot'].level0_file_num_compaction_trigger == 8
+    assert cf_options['hot'].compression == CompressionType.kNoCompression
+    assert cf_options['cold'].write_buffer_size == 4 * 1024 * 1024
+    assert cf_options['cold'].target_file_size_base == 128 * 1024 * 1024
+    assert cf_options['cold'].compaction_style == CompactionStyle.kCompactionStyleUniversal
+
+    await RocksDb.destroy_db('db_test_native')
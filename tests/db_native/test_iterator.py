@@ -41,3 +41,125 @@ async def test_iterator():
 
     await iterator.close()
     await r.close()
+
+
+@pytest.mark.asyncio
+async def test_iterator_next_batch():
+    await RocksDb.destroy_db('db_test_native')
+
+    option = Options()
+    option.create_if_missing = True
+    s = await RocksDb.open_db('db_test_native', option)
+    assert s.ok()
+    r = s.result
+
+    for k in [b'a', b'b', b'c', b'd', b'e']:
+        s = await r.put(k, b'v' + k)
+        assert s.ok()
+
+    iterator = await r.create_iterator()
+    await iterator.seek(b'b')
+    rows = await iterator.next_batch(2)
+    assert rows == [(b'b', b'vb'), (b'c', b'vc')]
+    rows = await iterator.next_batch(10)
+    assert rows == [(b'd', b'vd'), (b'e', b've')]
+    rows = await iterator.next_batch(10)
+    assert rows == []
+    valid = await iterator.valid()
+    assert valid is False
+
+    await iterator.seek_to_last()
+    rows = await iterator.next_batch(3, reverse=True)
+    assert rows == [(b'e', b've'), (b'd', b'vd'), (b'c', b'vc')]
+
+    await iterator.close()
+    await r.close()
+
+
+@pytest.mark.asyncio
+async def test_iterator_bounds():
+    await RocksDb.destroy_db('db_test_native')
+
+    option = Options()
+    option.create_if_missing = True
+    s = await RocksDb.open_db('db_test_native', option)
+    assert s.ok()
+    r = s.result
+
+    for k in [b'a', b'b', b'c', b'd', b'e']:
+        s = await r.put(k, b'v' + k)
+        assert s.ok()
+
+    read_options = ReadOptions()
+    read_options.iterate_lower_bound = b'b'
+    read_options.iterate_upper_bound = b'd'
+    assert read_options.iterate_lower_bound == b'b'
+    assert read_options.iterate_upper_bound == b'd'
+    copy_options = read_options.copy()
+    assert copy_options.iterate_upper_bound == b'd'
+
+    iterator = await r.create_iterator(read_options)
+    # the iterator keeps its own bounds, replacing them on the options does not affect it
+    read_options.iterate_upper_bound = bytearray(b'e')
+    assert read_options.iterate_upper_bound == b'e'
+    await iterator.seek_to_first()
+    rows = await iterator.next_batch(10)
+    assert rows == [(b'b', b'vb'), (b'c', b'vc')]
+    await iterator.close()
+
+    read_options.iterate_lower_bound = memoryview(b'c')
+    iterator = await r.create_iterator(read_options)
+    await iterator.seek_to_first()
+    rows = await iterator.next_batch(10)
+    assert rows == [(b'c', b'vc'), (b'd', b'vd')]
+    await iterator.close()
+
+    read_options.iterate_lower_bound = None
+    assert read_options.iterate_lower_bound is None
+    with pytest.raises(TypeError):
+        read_options.iterate_upper_bound = 'str bound'
+
+    await r.close()
+
+
+@pytest.mark.asyncio
+async def test_iterator_scan_profile():
+    await RocksDb.destroy_db('db_test_native')
+
+    option = Options()
+    option.create_if_missing = True
+    statistics = option.enable_statistics()
+    s = await RocksDb.open_db('db_test_native', option)
+    assert s.ok()
+    r = s.result
+
+    for i in range(1000):
+        s = await r.put(b'k%04d' % i, b'v' * 100)
+        assert s.ok()
+    s = await r.flush([r.default_column_family])
+    assert s.ok()
+
+    async def scan(**kwargs):
+        it = await r.create_iterator(**kwargs)
+        await it.seek_to_first()
+        rows = await it.next_batch(2000)
+        await it.close()
+        return rows
+
+    cache_add = statistics.get_ticker_count('rocksdb.block.cache.data.add')
+    rows = await scan(scan_profile=ScanProfile())
+    assert len(rows) == 1000
+    assert statistics.get_ticker_count('rocksdb.block.cache.data.add') == cache_add
+
+    rows = await scan()
+    assert len(rows) == 1000
+    assert statistics.get_ticker_count('rocksdb.block.cache.data.add') > cache_add
+
+    read_options = ReadOptions()
+    read_options.iterate_upper_bound = b'k0010'
+    options = ScanProfile(readahead_size=0, pin_data=True).apply(read_options)
+    assert not options.fill_cache and options.pin_data and options.readahead_size == 0
+    assert options.iterate_upper_bound == b'k0010'
+    assert read_options.fill_cache
+
+    await r.close()
@@ -1,5 +1,7 @@
+import asyncio
 import pytest
 from aiorocksdb.rocks_db import *
+from aiorocksdb.event_listener import *
 
 
 @pytest.mark.asyncio
@@ -49,3 +51,154 @@ async def test_open_optimistic_transaction_db():
     assert s.ok()
     r = s.result
     await r.close()
+
+
+@pytest.mark.asyncio
+async def test_open_db_shared_executor():
+    await RocksDb.destroy_db('db_test_executor_a')
+    await RocksDb.destroy_db('db_test_executor_b')
+
+    registry = ExecutorRegistry(max_workers=2)
+    option = Options()
+    option.create_if_missing = True
+    s = await RocksDb.open_db('db_test_executor_a', option, executor=registry)
+    assert s.ok()
+    ra = s.result
+    s = await RocksDb.open_db('db_test_executor_b', option, executor=registry)
+    assert s.ok()
+    rb = s.result
+    assert ra.thread is rb.thread
+    assert registry.users == 2
+
+    s = await RocksDb.open_db('db_test_not_exist', Options(), executor=registry)
+    assert not s.ok()
+    assert registry.users == 2
+
+    await ra.close()
+    assert registry.users == 1
+    await rb.close()
+    assert registry.users == 0
+    assert registry.executor is None
+
+
+@pytest.mark.asyncio
+async def test_open_db_shared_block_cache():
+    await RocksDb.destroy_db('db_test_cache_a')
+    await RocksDb.destroy_db('db_test_cache_b')
+
+    cache = new_lru_cache(8 * 1024 * 1024)
+    table_options = BlockBasedTableOptions()
+    table_options.block_cache = cache
+    table_options.block_size = 4 * 1024
+    table_options.cache_index_and_filter_blocks = True
+    table_options.pin_l0_filter_and_index_blocks_in_cache = True
+    table_options.format_version = 5
+    table_options.set_bloom_filter(10)
+    assert table_options.block_cache.get_capacity() == 8 * 1024 * 1024
+
+    db_list = list()
+    for path in ['db_test_cache_a', 'db_test_cache_b']:
+        option = Options()
+        option.create_if_missing = True
+        option.set_block_based_table_factory(table_options)
+        s = await RocksDb.open_db(path, option)
+        assert s.ok()
+        r = s.result
+        cf_options = ColumnFamilyOptions()
+        cf_options.set_block_based_table_factory(table_options)
+        cf = RColumnFamily('cached', cf_options)
+        s = await r.create_column_family(cf, cf_options)
+        assert s.ok()
+        s = await r.put(b'ka', b'va' * 100, column_family=cf)
+        assert s.ok()
+        s = await r.flush([cf])
+        assert s.ok()
+        s = await r.get(b'ka', column_family=cf)
+        assert s.ok() and s.result == b'va' * 100
+        db_list.append(r)
+
+    assert cache.get_usage() > 0
+    assert cache.get_pinned_usage() >= 0
+    assert new_hyper_clock_cache(8 * 1024 * 1024, 4 * 1024).get_capacity() == 8 * 1024 * 1024
+
+    for r in db_list:
+        await r.close()
+
+
+@pytest.mark.asyncio
+async def test_open_db_shared_budgets():
+    await RocksDb.destroy_db('db_test_budget_a')
+    await RocksDb.destroy_db('db_test_budget_b')
+
+    rate_limiter = new_generic_rate_limiter(64 * 1024 * 1024, auto_tuned=True)
+    write_buffer_manager = WriteBufferManager(32 * 1024 * 1024, new_lru_cache(64 * 1024 * 1024))
+    assert write_buffer_manager.enabled() and write_buffer_manager.cost_to_cache()
+    set_background_threads(4, EnvPriority.LOW)
+    set_background_threads(2, EnvPriority.HIGH)
+    assert get_background_threads(EnvPriority.LOW) >= 4
+
+    db_list = list()
+    for path in ['db_test_budget_a', 'db_test_budget_b']:
+        option = Options()
+        option.create_if_missing = True
+        option.rate_limiter = rate_limiter
+        option.write_buffer_manager = write_buffer_manager
+        s = await RocksDb.open_db(path, option)
+        assert s.ok()
+        r = s.result
+        s = await r.put(b'ka', b'va' * 1024)
+        assert s.ok()
+        s = await r.flush([r.default_column_family])
+        assert s.ok()
+        db_list.append(r)
+
+    assert write_buffer_manager.memory_usage() > 0
+    assert rate_limiter.get_total_bytes_through() > 0
+    rate_limiter.set_bytes_per_second(16 * 1024 * 1024)
+    assert 0 < rate_limiter.get_bytes_per_second() <= 16 * 1024 * 1024
+    write_buffer_manager.set_buffer_size(16 * 1024 * 1024)
+    assert write_buffer_manager.buffer_size() == 16 * 1024 * 1024
+
+    for r in db_list:
+        await r.close()
+
+
+@pytest.mark.asyncio
+async def test_open_db_event_listener():
+    await RocksDb.destroy_db('db_test_native')
+
+    received = list()
+
+    async def on_events(events):
+        received.extend(events)
+
+    listener = EventListener(on_events)
+    option = Options()
+    option.create_if_missing = True
+    listener.attach(option)
+    s = await RocksDb.open_db('db_test_native', option)
+    assert s.ok()
+    r = s.result
+
+    for i in range(2):
+        s = await r.put(b'k', b'v%d' % i)
+        assert s.ok()
+        s = await r.flush([r.default_column_family])
+        assert s.ok()
+    s = await r.compact_range()
+    assert s.ok()
+
+    for _ in range(100):
+        types = {event['type'] for event in received}
+        if {'flush_completed', 'compaction_completed'} <= types:
+            break
+        await asyncio.sleep(0.05)
+    flush_events = [event for event in received if event['type'] == 'flush_completed']
+    assert len(flush_events) == 2
+    assert flush_events[0]['cf_name'] == 'default'
+    compaction_events = [event for event in received if event['type'] == 'compaction_completed']
+    assert compaction_events and compaction_events[0]['num_input_records'] >= 2
+    assert not listener.is_stalled
+
+    await r.close()
+    listener.stop()
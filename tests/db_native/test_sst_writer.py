@@ -1,5 +1,8 @@
 import pytest
+import os
 from aiorocksdb.rocks_db import *
+from aiorocksdb.bulk_load import *
+from aiorocksdb.bulk_load import FileRun, MemoryRun
 
 
 @pytest.mark.asyncio
@@ -21,6 +24,33 @@ async def test_sst_writer():
     assert s.ok()
 
 
+@pytest.mark.asyncio
+async def test_sst_writer_many():
+    sst_writer = SstFileWriter()
+    s = await sst_writer.open('sst_writer_many.sst')
+    assert s.ok()
+
+    pairs = [(b'k%04d' % i, memoryview(b'v%04d' % i)) for i in range(1000)]
+    s = await sst_writer.put_many(pairs)
+    assert s.ok()
+    s = await sst_writer.put_many((bytearray(b'k2%03d' % i), b'\x00') for i in range(10))
+    assert s.ok()
+    s = await sst_writer.delete_many([b'k3%03d' % i for i in range(10)])
+    assert s.ok()
+    s = await sst_writer.put_many([(b'k0000', b'out of order')])
+    assert not s.ok()
+    with pytest.raises(TypeError):
+        await sst_writer.put_many([(b'k4000', 'str value')])
+
+    s = await sst_writer.finish()
+    assert s.ok()
+    info = s.result
+    assert info.num_entries == 1020
+    assert info.smallest_key == b'k0000'
+    assert info.largest_key == b'k3009'
+    assert info.file_size > 0
+
+
 @pytest.mark.asyncio
 async def test_sst_import():
     await RocksDb.destroy_db('db_test_native')
@@ -74,3 +104,59 @@ async def test_sst_import():
     assert s.ok() and s.result == b'vb'
 
     await r.close()
+
+
+@pytest.mark.asyncio
+async def test_bulk_load():
+    await RocksDb.destroy_db('db_test_native')
+
+    option = Options()
+    option.create_if_missing = True
+    s = await RocksDb.open_db('db_test_native', option)
+    assert s.ok()
+    r = s.result
+
+    expected = dict()
+
+    async def rows():
+        for i in range(5000):
+            key = b'k%05d' % ((i * 7919) % 3000)
+            value = b'v%05d' % i
+            expected[key] = value
+            yield key, value
+
+    loader = BulkLoader(r, 'bulk_load_tmp', writer_count=3, memory_limit=64 * 1024)
+    ingest_options = IngestExternalFileOptions()
+    s = await loader.load(rows(), ingest_options)
+    assert s.ok() and s.result == 5000
+    assert not os.listdir('bulk_load_tmp')
+    os.rmdir('bulk_load_tmp')
+    assert not ingest_options.move_files
+
+    for key in [b'k00000', b'k01234', b'k02999']:
+        s = await r.get(key)
+        assert s.ok() and s.result == expected[key]
+    it = await r.create_iterator()
+    await it.seek_to_first()
+    count = 0
+    previous = None
+    while await it.valid():
+        key = await it.key()
+        assert previous is None or previous < key
+        assert await it.value() == expected[key]
+        previous = key
+        count += 1
+        await it.next()
+    await it.close()
+    assert count == len(expected)
+
+    await r.close()
+
+
+def test_bulk_load_run_sample():
+    rows = [(b'k%04d' % i, b'v') for i in range(1000)]
+    file_run = FileRun.write('bulk_load_run_sample.run', rows, 4)
+    try:
+        assert file_run.sample(8) == MemoryRun(rows).sample(8)
+    finally:
+        file_run.remove()
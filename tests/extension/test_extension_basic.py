@@ -76,6 +76,15 @@ async def iterator(db, cf, d):
             match_seq.pop(0)
     assert len(match_seq) == 0
 
+    # small batches
+    match_seq = sorted(d.items(), key=lambda i: i[0])
+    match_seq = [(k, v) for k, v in match_seq if b'a2' <= k < b'b3']
+    async with Iterator.range(cf, start=b'a2', stop=b'b2', batch_size=2) as it:
+        async for k, v in it:
+            assert (k, v) == match_seq[0]
+            match_seq.pop(0)
+    assert len(match_seq) == 0
+
 
 @pytest.mark.asyncio
 async def test_extension():
@@ -156,3 +165,67 @@ async def test_extension_column_family():
 
         status = await db.drop_column_family('order')
         assert status.ok()
+
+
+@pytest.mark.asyncio
+async def test_extension_prefix_extractor():
+    await RocksDb.destroy_db('db_test_extension')
+
+    option = Options()
+    option.create_if_missing = True
+    option.set_delimiter_prefix_extractor(b':')
+    option.memtable_prefix_bloom_size_ratio = 0.1
+    assert option.prefix_extractor_name.startswith('aiorocksdb.DelimiterPrefix')
+    async with Db(Db.open_db('db_test_extension', option)) as db:
+        cf = db['default']
+        assert cf.cf.has_prefix_extractor()
+        assert cf.cf.prefix_seek_compatible(b'user:')
+        assert cf.cf.prefix_seek_compatible(b'user:1')
+        assert not cf.cf.prefix_seek_compatible(b'user')
+        d = {
+            b'order:1': b'o1',
+            b'user:1': b'u1',
+            b'user:2': b'u2',
+            b'user:3': b'u3',
+            b'users': b'us',
+            b'zz': b'zz',
+        }
+        for k, v in d.items():
+            await cf.put(k, v)
+
+        for prefix in [b'user:', b'user', b'user:2', b'order:']:
+            match_seq = sorted((k, v) for k, v in d.items() if k.startswith(prefix))
+            async with Iterator.prefix(cf, prefix=prefix) as it:
+                rows = [row async for row in it]
+            assert rows == match_seq
+
+        async with Iterator.range(cf) as it:
+            rows = [row async for row in it]
+        assert rows == sorted(d.items())
+
+    option = Options()
+    option.create_if_missing = True
+    option.set_fixed_prefix_extractor(4)
+    option.clear_prefix_extractor()
+    assert option.prefix_extractor_name is None
+    option.set_capped_prefix_extractor(4)
+    assert option.prefix_extractor_name
+
+
+@pytest.mark.asyncio
+async def test_extension_merge():
+    await RocksDb.destroy_db('db_test_extension')
+
+    option = Options()
+    option.create_if_missing = True
+    option.set_uint64_add_merge_operator()
+    async with Db(Db.open_db('db_test_extension', option)) as db:
+        cf = db['default']
+        for _ in range(3):
+            await cf.merge(b'counter', (1).to_bytes(8, 'little'))
+
+        async with Batch(db) as batch:
+            batch['default'].merge(b'counter', (2).to_bytes(8, 'little'))
+
+        value = await cf.get(b'counter')
+        assert int.from_bytes(value, 'little') == 5
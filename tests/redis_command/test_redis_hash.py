@@ -0,0 +1,57 @@
+import pytest
+from aiorocksdb.rocks_db import *
+from aiorocksdb.extension import *
+
+
+@pytest.mark.asyncio
+async def test_hash_commands():
+    await RocksDb.destroy_db('db_test_redis')
+
+    option = Options()
+    option.create_if_missing = True
+    async with Db(Db.open_db('db_test_redis', option)) as db:
+        redis = db.redis('default')
+        assert await redis.hget(b'notExist', b'f') is None
+        assert await redis.hgetall(b'notExist') == {}
+        assert await redis.hlen(b'notExist') == 0
+
+        assert await redis.hset(b'user', b'name', b'alice') == 1
+        assert await redis.hset(b'user', b'name', b'bob') == 0
+        assert await redis.hset(b'user', mapping={b'city': b'paris', b'lang': b'fr'}) == 2
+        assert await redis.hlen(b'user') == 3
+        assert await redis.hget(b'user', b'name') == b'bob'
+        assert await redis.hexists(b'user', b'city')
+        assert not await redis.hexists(b'user', b'missing')
+        assert await redis.hmget(b'user', [b'lang', b'missing', b'name']) == [b'fr', None, b'bob']
+
+        assert await redis.hincrby(b'user', b'visits') == 1
+        assert await redis.hincrby(b'user', b'visits', 10) == 11
+        assert await redis.hincrby(b'counter', b'n', -2) == -2
+        assert await redis.hlen(b'user') == 4
+
+        # keys sharing a prefix keep their fields apart
+        await redis.hset(b'user:1', b'name', b'carol')
+        assert await redis.hgetall(b'user') == {b'name': b'bob', b'city': b'paris', b'lang': b'fr', b'visits': 11}
+
+        assert await redis.hdel(b'user', b'city', b'missing') == 1
+        assert await redis.hlen(b'user') == 3
+        await redis.delete(b'user')
+        assert await redis.hlen(b'user') == 0
+        assert await redis.hgetall(b'user') == {}
+        assert await redis.hget(b'user:1', b'name') == b'carol'
+        assert await redis.hdel(b'user:1', b'name') == 1
+        assert await redis.hlen(b'user:1') == 0
+
+
+@pytest.mark.asyncio
+async def test_column_family_multi_get():
+    await RocksDb.destroy_db('db_test_redis')
+
+    option = Options()
+    option.create_if_missing = True
+    async with Db(Db.open_db('db_test_redis', option)) as db:
+        cf = db.redis('default').cf
+        await cf.put(b'a', b'1')
+        await cf.put(b'c', b'3')
+        assert await cf.multi_get([b'a', b'b', b'c']) == [b'1', None, b'3']
+        assert await cf.multi_get([]) == []
@@ -1,6 +1,11 @@
 import pytest
 from aiorocksdb.rocks_db import *
 from aiorocksdb.extension import *
+from aiorocksdb.iterator import *
+from aiorocksdb.meta import *
+from aiorocksdb.complex.codec import *
+from aiorocksdb.complex.linked_list import *
+from aiorocksdb.complex.sequence_list import *
 
 
 @pytest.mark.asyncio
@@ -54,3 +59,137 @@ async def test_list_delete():
         await redis.rpush(b'list', b'second')
 
         await redis.delete(b'list')
+
+
+@pytest.mark.asyncio
+async def test_list_sequence_encoding():
+    await RocksDb.destroy_db('db_test_redis')
+    option = Options()
+    option.create_if_missing = True
+    async with Db(Db.open_db('db_test_redis', option)) as db:
+        redis = db.redis('default')
+        codec = ComplexCodec()
+        for i in range(100):
+            await redis.rpush(b'queue', str(i).encode())
+        for i in range(1, 51):
+            await redis.lpush(b'queue', str(-i).encode())
+        meta = await redis.fetch_meta(redis.cf, redis.meta_key(codec, b'queue'), KeyTypeEnum.LIST)
+        assert meta.encoding == ListEncodingEnum.SEQUENCE.name
+        assert (meta.head_seq, meta.tail_seq, meta.length) == (-50, 99, 150)
+        assert await redis.llen(b'queue') == 150
+        assert await redis.lindex(b'queue', 0) == b'-50'
+        assert await redis.lindex(b'queue', 50) == b'0'
+        assert await redis.lindex(b'queue', -1) == b'99'
+        assert await redis.lindex(b'queue', -150) == b'-50'
+        with pytest.raises(ValueError):
+            await redis.lindex(b'queue', 150)
+        with pytest.raises(ValueError):
+            await redis.lindex(b'queue', -151)
+
+        await redis.lset(b'queue', -2, b'x')
+        assert await redis.lindex(b'queue', 148) == b'x'
+        assert await redis.lpop(b'queue') == b'-50'
+        assert await redis.rpop(b'queue') == b'99'
+        assert await redis.rpop(b'queue') == b'x'
+        assert await redis.llen(b'queue') == 147
+
+        assert SequenceList.encode_seq(-1) < SequenceList.encode_seq(0) < SequenceList.encode_seq(1)
+        assert SequenceList.decode_seq(SequenceList.encode_seq(-12345)) == -12345
+
+        # keys sharing a prefix keep their elements apart
+        await redis.rpush(b'queue:1', b'other')
+        await redis.delete(b'queue')
+        assert await redis.llen(b'queue') == 0
+        prefix = SequenceList.element_prefix(codec, b'queue')
+        async with Iterator.prefix(redis.cf, prefix) as iter:
+            assert [key async for key, _ in iter] == []
+        assert await redis.lindex(b'queue:1', 0) == b'other'
+
+        await redis.rpush(b'single', b'value')
+        assert await redis.lpop(b'single') == b'value'
+        assert await redis.llen(b'single') == 0
+        await redis.lpush(b'single', b'again')
+        assert await redis.rpop(b'single') == b'again'
+
+
+@pytest.mark.asyncio
+async def test_list_linked_encoding():
+    await RocksDb.destroy_db('db_test_redis')
+    option = Options()
+    option.create_if_missing = True
+    async with Db(Db.open_db('db_test_redis', option)) as db:
+        redis = db.redis('default')
+        codec = ComplexCodec()
+        meta_key = redis.meta_key(codec, b'legacy')
+        await LinkedList.create(codec, db, redis.cf, b'legacy', meta_key, b'first')
+        await redis.rpush(b'legacy', b'second')
+        await redis.lpush(b'legacy', b'zero')
+        meta = await redis.fetch_meta(redis.cf, meta_key, KeyTypeEnum.LIST)
+        assert meta.encoding is None
+        assert await redis.llen(b'legacy') == 3
+        assert await redis.lindex(b'legacy', 1) == b'first'
+        assert await redis.rpop(b'legacy') == b'second'
+        assert await redis.lpop(b'legacy') == b'zero'
+        await redis.delete(b'legacy')
+        assert await redis.llen(b'legacy') == 0
+
+
+@pytest.mark.asyncio
+async def test_list_range_commands():
+    await RocksDb.destroy_db('db_test_redis')
+    option = Options()
+    option.create_if_missing = True
+    async with Db(Db.open_db('db_test_redis', option)) as db:
+        redis = db.redis('default')
+        assert await redis.lrange(b'list', 0, -1) == []
+        for v in [b'a', b'b', b'c', b'a', b'd', b'a', b'e']:
+            await redis.rpush(b'list', v)
+        assert await redis.lrange(b'list', 0, -1) == [b'a', b'b', b'c', b'a', b'd', b'a', b'e']
+        assert await redis.lrange(b'list', 1, 2) == [b'b', b'c']
+        assert await redis.lrange(b'list', -2, 100) == [b'a', b'e']
+        assert await redis.lrange(b'list', 5, 2) == []
+
+        assert await redis.lrem(b'list', 1, b'a') == 1
+        assert await redis.lrange(b'list', 0, -1) == [b'b', b'c', b'a', b'd', b'a', b'e']
+        assert await redis.lrem(b'list', -1, b'a') == 1
+        assert await redis.lrange(b'list', 0, -1) == [b'b', b'c', b'a', b'd', b'e']
+        assert await redis.lrem(b'list', 0, b'missing') == 0
+        await redis.rpush(b'list', b'b')
+        assert await redis.lrem(b'list', 0, b'b') == 2
+        assert await redis.lrange(b'list', 0, -1) == [b'c', b'a', b'd', b'e']
+        assert await redis.llen(b'list') == 4
+        assert await redis.lindex(b'list', -1) == b'e'
+
+        assert await redis.linsert(b'list', b'a', b'x') == 5
+        assert await redis.linsert(b'list', b'd', b'y', before=False) == 6
+        assert await redis.linsert(b'list', b'missing', b'z') == -1
+        assert await redis.linsert(b'notExist', b'a', b'z') == 0
+        assert await redis.lrange(b'list', 0, -1) == [b'c', b'x', b'a', b'd', b'y', b'e']
+        assert await redis.lpop(b'list') == b'c'
+        assert await redis.rpop(b'list') == b'e'
+
+        await redis.ltrim(b'list', 1, -2)
+        assert await redis.lrange(b'list', 0, -1) == [b'a', b'd']
+        await redis.ltrim(b'list', 5, 10)
+        assert await redis.llen(b'list') == 0
+        assert await redis.lrange(b'list', 0, -1) == []
+
+
+@pytest.mark.asyncio
+async def test_list_convert_linked_encoding():
+    await RocksDb.destroy_db('db_test_redis')
+    option = Options()
+    option.create_if_missing = True
+    async with Db(Db.open_db('db_test_redis', option)) as db:
+        redis = db.redis('default')
+        codec = ComplexCodec()
+        meta_key = redis.meta_key(codec, b'legacy')
+        await LinkedList.create(codec, db, redis.cf, b'legacy', meta_key, b'b')
+        await redis.lpush(b'legacy', b'a')
+        await redis.rpush(b'legacy', b'c')
+        assert await redis.lrange(b'legacy', 0, -1) == [b'a', b'b', b'c']
+        meta = await redis.fetch_meta(redis.cf, meta_key, KeyTypeEnum.LIST)
+        assert meta.encoding == ListEncodingEnum.SEQUENCE.name
+        async with Iterator.prefix(redis.cf, LinkedList.node_key(codec, b'legacy') + codec.key_split) as iter:
+            assert [key async for key, _ in iter] == []
+        assert await redis.lindex(b'legacy', 1) == b'b'
@@ -0,0 +1,104 @@
+import pytest
+from aiorocksdb.rocks_db import *
+from aiorocksdb.extension import *
+from aiorocksdb.iterator import *
+from aiorocksdb.complex.codec import *
+from aiorocksdb.complex.ordered_set import *
+from aiorocksdb.complex.rank_index import *
+
+
+@pytest.mark.asyncio
+async def test_zset_commands():
+    await RocksDb.destroy_db('db_test_redis')
+
+    option = Options()
+    option.create_if_missing = True
+    async with Db(Db.open_db('db_test_redis', option)) as db:
+        redis = db.redis('default')
+        assert await redis.zcard(b'notExist') == 0
+        assert await redis.zscore(b'notExist', b'a') is None
+        assert await redis.zrange(b'notExist', 0, -1) == []
+
+        assert await redis.zadd(b'board', {b'a': 3, b'b': -1.5, b'c': 10, b'd': 3}) == 4
+        assert await redis.zadd(b'board', {b'a': 0, b'e': 7}) == 1
+        assert await redis.zcard(b'board') == 5
+        assert await redis.zscore(b'board', b'a') == 0.0
+        assert await redis.zscore(b'board', b'missing') is None
+
+        assert await redis.zrange(b'board', 0, -1) == [b'b', b'a', b'd', b'e', b'c']
+        assert await redis.zrange(b'board', 1, 2, with_scores=True) == [(b'a', 0.0), (b'd', 3.0)]
+        assert await redis.zrange(b'board', 0, 1, desc=True) == [b'c', b'e']
+        assert await redis.zrange(b'board', -2, 100) == [b'e', b'c']
+        assert await redis.zrange(b'board', 3, 1) == []
+
+        assert await redis.zrangebyscore(b'board', 0, 7) == [b'a', b'd', b'e']
+        assert await redis.zrangebyscore(b'board', 3, 3, with_scores=True) == [(b'd', 3.0)]
+        assert await redis.zrangebyscore(b'board', float('-inf'), float('inf'), offset=1, count=2) == [b'a', b'd']
+        assert await redis.zrangebyscore(b'board', 8, 1) == []
+
+        # keys sharing a prefix keep their members apart
+        await redis.zadd(b'board:1', {b'z': 1})
+        assert await redis.zrem(b'board', b'a', b'missing') == 1
+        assert await redis.zcard(b'board') == 4
+        assert await redis.zrangebyscore(b'board', 0, 1) == []
+        await redis.delete(b'board')
+        assert await redis.zcard(b'board') == 0
+        assert await redis.zrange(b'board', 0, -1) == []
+        assert await redis.zrange(b'board:1', 0, -1, with_scores=True) == [(b'z', 1.0)]
+
+
+def test_zset_score_encoding():
+    scores = [float('-inf'), -1e300, -2.5, -1, 0, 1e-300, 1, 2.5, 1e300, float('inf')]
+    keys = [OrderedSet.encode_score(score) for score in scores]
+    assert keys == sorted(keys)
+    assert [OrderedSet.decode_score(key) for key in keys] == scores
+    assert OrderedSet.encode_score(-0.0) == OrderedSet.encode_score(0.0)
+
+
+@pytest.mark.asyncio
+async def test_zset_rank_index(monkeypatch):
+    # small pages so a few hundred members build a multi level tree
+    monkeypatch.setattr(RankIndex, 'PAGE_SIZE', 4)
+    monkeypatch.setattr(RankIndex, 'BUILD_FILL', 3)
+    await RocksDb.destroy_db('db_test_redis')
+
+    option = Options()
+    option.create_if_missing = True
+    async with Db(Db.open_db('db_test_redis', option)) as db:
+        redis = db.redis('default')
+        scores = {f'm{i:03d}'.encode(): (i * 37) % 200 for i in range(200)}
+        assert await redis.zadd(b'plain', scores) == 200
+        assert await redis.zadd(b'ranked', dict(list(scores.items())[:100]), rank_index=True) == 100
+        assert await redis.zadd(b'ranked', dict(list(scores.items())[100:])) == 100
+        order = sorted(scores, key=lambda member: (scores[member], member))
+        expected = list(order)
+
+        for key in [b'plain', b'ranked']:
+            assert await redis.zrange(key, 0, -1) == expected
+            assert await redis.zrange(key, 17, 23) == expected[17:24]
+            assert await redis.zrange(key, 5, 9, desc=True) == expected[::-1][5:10]
+            for position in [0, 1, 57, 199]:
+                assert await redis.zrank(key, expected[position]) == position
+                assert await redis.zrevrank(key, expected[position]) == 199 - position
+            assert await redis.zrank(key, b'missing') is None
+
+        # moving and removing members keeps the counts right
+        await redis.zadd(b'ranked', {expected[0]: 1000, expected[1]: -1})
+        await redis.zrem(b'ranked', expected[2], expected[3])
+        expected = [expected[1]] + expected[4:] + [expected[0]]
+        assert await redis.zrange(b'ranked', 0, -1) == expected
+        assert await redis.zrank(b'ranked', expected[-1]) == len(expected) - 1
+        assert await redis.zrange(b'ranked', 100, 102, with_scores=True) == [
+            (member, float(scores[member])) for member in expected[100:103]
+        ]
+
+        # an existing set builds its index on request
+        await redis.zadd(b'plain', {b'extra': 500}, rank_index=True)
+        assert await redis.zrank(b'plain', b'extra') == 200
+        assert await redis.zrange(b'plain', 150, 152) == order[150:153]
+
+        await redis.zrem(b'ranked', *expected)
+        assert await redis.zcard(b'ranked') == 0
+        await redis.delete(b'plain')
+        async with Iterator.prefix(redis.cf, RankIndex.page_prefix(ComplexCodec(), b'plain')) as iter:
+            assert [key async for key, _ in iter] == []